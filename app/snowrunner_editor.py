@@ -16,10 +16,12 @@ if platform.system() == "Windows":
 import time
 import struct
 import zlib
+import mmap
 import copy
 import traceback
 import shutil
 import threading
+import queue
 import subprocess
 import codecs
 import tempfile
@@ -45,6 +47,12 @@ from tkinter import ttk, filedialog, messagebox, PhotoImage, colorchooser
 from tkinter import simpledialog
 import tkinter.font as tkfont
 
+# Optional: orjson speeds up decoding/encoding of large save-file JSON blocks.
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
+
 # Preserve native messagebox functions so we can fall back when needed.
 _NATIVE_SHOWINFO = messagebox.showinfo
 _NATIVE_SHOWWARNING = messagebox.showwarning
@@ -153,11 +161,41 @@ skip_time_var = None
 custom_day_var = None
 custom_night_var = None
 other_season_var = None
-# time_presets mappings are defined further below in the file, but some
-# functions reference `time_presets` before that definition. Provide a
-# safe default here so static analyzers (Pylance) don't report an
-# undefined-variable warning. The full mapping is assigned later.
-time_presets = {}
+# Save value <-> dropdown label tables for the built-in rules and time
+# settings. Static, so they live here instead of being rebuilt per launch.
+difficulty_map = {0: "Normal", 1: "Hard", 2: "New Game+"}
+truck_avail_map = {
+    1: "default", 0: "all trucks available", 3: "5–15 trucks/garage",
+    4: "locked"
+}
+truck_price_map = {
+    1: "default",
+    2: "free",
+    3: "2x",
+    4: "4x",
+    5: "5x"
+}
+addon_avail_map = {0: "default", 1: "all internal addons unlocked", 2: "custom range"}
+addon_amount_ranges = {
+    "None": (0, 0),
+    "10–50": (10, 50),
+    "30–100": (30, 100),
+    "50–150": (50, 150),
+    "0–100": (0, 100)
+}
+time_presets = {
+    "Custom": (1.0, 1.0),
+    "Default": (1.0, 1.0),
+    "Always Day": (0.0, 1.0),
+    "Always Night": (1.0, 0.0),
+    "Long Day": (0.01, 1.0),
+    "Long Night": (1.0, 0.01),
+    "Long Day and Long Night": (0.01, 0.01),
+    "Time Stops": (0.0, 0.0),
+    "Disco [SEIZURE RISK]": (1000.0, 1000.0),
+    "Disco+ [OH GOD WHY]": (10000.0, 10000.0),
+    "Disco++ [WILL DESTROY YOUR EYES]": (100000.0, 100000.0),
+}
 season_vars = []
 map_vars = []
 tyre_var = None
@@ -425,8 +463,33 @@ def _open_path_with_default_app(path):
     raise RuntimeError(last_error or f"No launcher available for '{target}'.")
 
 
+# path -> monotonic time it was last seen to exist; only hits are cached so
+# a file that appears is noticed at once, and a stale hit just means the
+# following open() reports the error instead
+_PATH_EXISTS_CACHE = {}
+_PATH_EXISTS_TTL = 0.5
+
+
+def _path_exists_cached(path):
+    """os.path.exists for GUI callbacks that re-check the same save path back to back."""
+    now = time.monotonic()
+    seen = _PATH_EXISTS_CACHE.get(path)
+    if seen is not None and now - seen < _PATH_EXISTS_TTL:
+        return True
+    if os.path.exists(path):
+        _PATH_EXISTS_CACHE[path] = now
+        return True
+    _PATH_EXISTS_CACHE.pop(path, None)
+    return False
+
+
 def _write_text_file_atomic(path, content, encoding="utf-8", newline=None):
     """Write text to a temp file in the same directory, then replace atomically."""
+    return _write_text_chunks_atomic(path, (str(content),), encoding=encoding, newline=newline)
+
+
+def _write_text_chunks_atomic(path, chunks, encoding="utf-8", newline=None):
+    """Like _write_text_file_atomic, but writes the text pieces without joining them first."""
     target = os.path.abspath(str(path or "").strip())
     if not target:
         raise ValueError("Target path is empty.")
@@ -441,7 +504,8 @@ def _write_text_file_atomic(path, content, encoding="utf-8", newline=None):
     )
     try:
         with os.fdopen(fd, "w", encoding=encoding, newline=newline) as fh:
-            fh.write(str(content))
+            for chunk in chunks:
+                fh.write(chunk)
             fh.flush()
             try:
                 os.fsync(fh.fileno())
@@ -3550,12 +3614,34 @@ def _migrate_legacy_config_if_needed():
         pass
 
 
+def _config_file_stamp():
+    try:
+        st = os.stat(CONFIG_FILE)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+# config text as last read/written, keyed by the file's (mtime_ns, size);
+# load_config() is called on most clicks, so an unchanged file is only
+# stat'ed and re-parsed (callers still get their own dict to mutate)
+_CONFIG_TEXT_CACHE = {"stamp": None, "text": None}
+
+
 def load_config():
-    _migrate_legacy_config_if_needed()
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                payload = json.load(f)
+    stamp = _config_file_stamp()
+    if stamp is None:
+        _migrate_legacy_config_if_needed()
+        stamp = _config_file_stamp()
+    if stamp is not None:
+        try:
+            if stamp == _CONFIG_TEXT_CACHE["stamp"]:
+                text = _CONFIG_TEXT_CACHE["text"]
+            else:
+                with open(CONFIG_FILE, "r", encoding="utf-8") as f:
+                    text = f.read()
+                _CONFIG_TEXT_CACHE.update(stamp=stamp, text=text)
+            payload = json.loads(text)
             if isinstance(payload, dict):
                 return payload
             print("Failed to load config: expected a JSON object.")
@@ -3569,6 +3655,7 @@ def save_config(data):
         payload = data if isinstance(data, dict) else {}
         text = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
         _write_text_file_atomic(CONFIG_FILE, text, encoding="utf-8")
+        _CONFIG_TEXT_CACHE.update(stamp=_config_file_stamp(), text=text)
         return True
     except Exception as e:
         print("Failed to save config:", e)
@@ -3913,6 +4000,53 @@ def _cleanup_backup_history(backup_dir, max_backups=20, max_autobackups=50):
         print(f"[Autosave] Removed {len(to_delete)} old autobackup(s)")
 
 
+_LINUX_FICLONE = 0x40049409  # ioctl: share src extents with dst (Btrfs, XFS, ...)
+
+
+def _clone_file_contents(src, dst):
+    """Try a copy-on-write clone of src into dst. Returns True when dst holds the data."""
+    system = platform.system()
+    if system == "Linux":
+        import fcntl
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            try:
+                fcntl.ioctl(fdst.fileno(), _LINUX_FICLONE, fsrc.fileno())
+                return True
+            except OSError:
+                pass
+            copy_range = getattr(os, "copy_file_range", None)
+            if copy_range is None:
+                return False
+            # in-kernel copy; filesystems that support it reflink or copy server-side
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                sent = copy_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if sent <= 0:
+                    return False
+                remaining -= sent
+            return True
+    if system == "Darwin":
+        import ctypes
+        libc = ctypes.CDLL(None, use_errno=True)
+        clonefile = getattr(libc, "clonefile", None)
+        if clonefile is None or os.path.exists(dst):
+            return False
+        return clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+    return False
+
+
+def _copy_file_for_backup(src, dst):
+    """shutil.copy2() for backups, trying a copy-on-write clone before copying bytes."""
+    try:
+        cloned = _clone_file_contents(src, dst)
+    except Exception:
+        cloned = False
+    if not cloned:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
 def _create_timestamped_full_backup(save_dir, prefix="backup"):
     """
     Create a timestamped full backup folder under the editor backup root.
@@ -3938,7 +4072,7 @@ def _create_timestamped_full_backup(save_dir, prefix="backup"):
             rel_path = os.path.relpath(src_path, save_dir)
             dst_path = os.path.join(full_dir, rel_path)
             os.makedirs(os.path.dirname(dst_path), exist_ok=True)
-            shutil.copy2(src_path, dst_path)
+            _copy_file_for_backup(src_path, dst_path)
             copied += 1
 
     return backup_dir, full_dir, copied
@@ -5833,7 +5967,7 @@ def _create_autobackup(save_dir, full_backup_mode=None):
                 dst_path = os.path.join(full_dir, rel_path)
                 os.makedirs(os.path.dirname(dst_path), exist_ok=True)
                 try:
-                    shutil.copy2(src_path, dst_path)
+                    _copy_file_for_backup(src_path, dst_path)
                 except Exception as e:
                     print(f"[Autosave] copy failed {src_path} -> {dst_path}: {e}")
         print(f"[Autosave] Created autobackup at: {full_dir}")
@@ -6085,7 +6219,7 @@ def make_backup_if_enabled(path, force_full=False):
             single_dir = os.path.join(backup_dir, timestamp)
             os.makedirs(single_dir, exist_ok=True)
             backup_file_path = os.path.join(single_dir, os.path.basename(path))
-            shutil.copy2(path, backup_file_path)
+            _copy_file_for_backup(path, backup_file_path)
             print(f"[Backup] Backup created at: {backup_file_path}")
             set_app_status(f"Backup created: {os.path.basename(backup_file_path)}", timeout_ms=5000)
         else:
@@ -6469,42 +6603,6 @@ def prompt_save_version_mismatch_and_choose(path, modal=True):
 
 # --- end replacement helper ---
 
-def try_autoload_last_save(save_path_var):
-    last_path = load_last_path()
-    if not last_path:
-        return
-
-    if not os.path.exists(last_path):
-        messagebox.showerror(
-            "Save File Missing",
-            f"Could not load save file:\n{last_path}\n\nThe file does not exist."
-        )
-        save_path_var.set("")
-        return
-
-    try:
-        with open(last_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Try parsing the save — if anything fails, it’s corrupted
-        money, rank, xp, difficulty, truck_avail, skip_time, day, night, truck_price = get_file_info(content)
-
-        # If day or night is None → treat as corruption
-        if day is None or night is None:
-            raise ValueError("Missing time settings")
-
-        # DO NOT prompt immediately here — accept the path now so GUI can finish loading.
-        save_path_var.set(last_path)
-
-        # (The delayed, non-blocking version-check will run separately after startup)
-    except Exception:
-        messagebox.showerror(
-            "Save File Corrupted",
-            f"Could not load save file:\n{last_path}\n\nThe file appears to be corrupted or incomplete."
-        )
-        save_path_var.set("")
-
-
 def save_path(path):
     if _wgs_is_session_path(path):
         return
@@ -6848,16 +6946,63 @@ def upload_improve_samples_from_entries(entries, endpoint=None, source="snowrunn
 # SECTION: Save Parsing + Common Extractors
 # Used In: sync_all_rules, Money & Rank tab, Time tab
 # =============================================================================
+def _compile_file_info_re(pattern, flags=0):
+    """(str, bytes) compiled pair, so a save can also be scanned without decoding it."""
+    return re.compile(pattern, flags), re.compile(pattern.encode("ascii"), flags)
+
+
+_FILE_INFO_INT_RES = {
+    key: _compile_file_info_re(rf'"{key}"\s*:\s*(\d+)')
+    for key in ("truckPricingFactor", "gameDifficultyMode", "truckAvailability", "internalAddonAvailability", "internalAddonAmount")
+}
+_FILE_INFO_MAX_INT_RES = {
+    key: _compile_file_info_re(rf'"{key}"\s*:\s*(-?\d+)', flags=re.IGNORECASE)
+    for key in ("money", "rank", "experience")
+}
+_FILE_INFO_NUM_RES = {
+    key: _compile_file_info_re(rf'"{key}"\s*:\s*(-?\d+(\.\d+)?(e[-+]?\d+)?)')
+    for key in ("timeSettingsDay", "timeSettingsNight")
+}
+_SKIP_TIME_RE = _compile_file_info_re(r'"isAbleToSkipTime"\s*:\s*(true|false)', flags=re.IGNORECASE)
+
+
+def _file_info_re_index(content):
+    """0 for decoded text, 1 for bytes-like content (bytes, mmap)."""
+    return 0 if isinstance(content, str) else 1
+
+
+def _open_save_for_scan(path):
+    """Read-only mmap of a save for the get_file_info scans; falls back to bytes.
+
+    Only for read-only scanning: the caller closes it, and edits still go
+    through the normal text read/write path.
+    """
+    with open(path, "rb") as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # empty files cannot be mapped
+            return f.read()
+
+
+def _search_file_info_int(content, key, default=None):
+    """First '"key": <digits>' value in content (key from _FILE_INFO_INT_RES), or default."""
+    match = _FILE_INFO_INT_RES[key][_file_info_re_index(content)].search(content)
+    return int(match.group(1)) if match else default
+
+
 def get_file_info(content):
-    truck_price = int(re.search(r'"truckPricingFactor"\s*:\s*(\d+)', content).group(1)) if re.search(r'"truckPricingFactor"\s*:\s*(\d+)', content) else 1
+    """Scalar save info from content, given as text or bytes-like (see _open_save_for_scan)."""
+    which = _file_info_re_index(content)
+    truck_price = _search_file_info_int(content, "truckPricingFactor", 1)
 
     def search_num(key):
-        match = re.search(rf'"{key}"\s*:\s*(-?\d+(\.\d+)?(e[-+]?\d+)?)', content)
+        match = _FILE_INFO_NUM_RES[key][which].search(content)
         return float(match.group(1)) if match else None
 
     # helper: return the maximum integer value for all occurrences of the given key, or None
     def read_max_int(key):
-        matches = re.findall(rf'"{re.escape(key)}"\s*:\s*(-?\d+)', content, flags=re.IGNORECASE)
+        matches = _FILE_INFO_MAX_INT_RES[key][which].findall(content)
         if not matches:
             return None
         vals = []
@@ -6878,11 +7023,11 @@ def get_file_info(content):
     xp_val = read_max_int("experience")
     xp = int(xp_val) if xp_val is not None else 0
 
-    difficulty = int(re.search(r'"gameDifficultyMode"\s*:\s*(\d+)', content).group(1)) if re.search(r'"gameDifficultyMode"\s*:\s*(\d+)', content) else 0
-    truck_avail = int(re.search(r'"truckAvailability"\s*:\s*(\d+)', content).group(1)) if re.search(r'"truckAvailability"\s*:\s*(\d+)', content) else 0
+    difficulty = _search_file_info_int(content, "gameDifficultyMode", 0)
+    truck_avail = _search_file_info_int(content, "truckAvailability", 0)
 
-    skip_match = re.search(r'"isAbleToSkipTime"\s*:\s*(true|false)', content, flags=re.IGNORECASE)
-    skip_time = skip_match.group(1).lower() == 'true' if skip_match else False
+    skip_match = _SKIP_TIME_RE[which].search(content)
+    skip_time = skip_match.group(1).lower() in ('true', b'true') if skip_match else False
 
     day = search_num("timeSettingsDay")
     night = search_num("timeSettingsNight")
@@ -6896,6 +7041,31 @@ def get_file_info(content):
 # SECTION: Time UI Sync Helpers
 # Used In: sync_all_rules, time preset selection, save reloads
 # =============================================================================
+# exact (day, night) -> first preset name, rebuilt when time_presets is replaced
+_TIME_PRESET_LOOKUP = {"source": None, "exact": {}}
+
+
+def _match_time_preset(day, night, default="Custom"):
+    """First preset in time_presets within 0.01 of (day, night), or default."""
+    day = float(day)
+    night = float(night)
+    presets = time_presets
+    if _TIME_PRESET_LOOKUP["source"] is not presets:
+        exact = {}
+        for name, (p_day, p_night) in presets.items():
+            exact.setdefault((float(p_day), float(p_night)), name)
+        _TIME_PRESET_LOOKUP.update(source=presets, exact=exact)
+    # presets sit further apart than the tolerance, so an exact hit is also
+    # the first near match; anything else takes the tolerant scan
+    name = _TIME_PRESET_LOOKUP["exact"].get((day, night))
+    if name is not None:
+        return name
+    for name, (p_day, p_night) in presets.items():
+        if abs(day - float(p_day)) < 0.01 and abs(night - float(p_night)) < 0.01:
+            return name
+    return default
+
+
 def _sync_time_ui(day=None, night=None, skip_time=None, preset_name=None):
     """Update time-related tkinter vars safely without recursion."""
     global _TIME_SYNC_GUARD
@@ -6945,15 +7115,8 @@ def _sync_time_ui(day=None, night=None, skip_time=None, preset_name=None):
         if "time_preset_var" in globals() and time_preset_var is not None:
             preset_to_set = preset_name
             if preset_to_set is None and day is not None and night is not None:
-                preset_to_set = "Custom"
                 try:
-                    for preset_name_it, (p_day, p_night) in time_presets.items():
-                        if (
-                            abs(float(day) - float(p_day)) < 0.01
-                            and abs(float(night) - float(p_night)) < 0.01
-                        ):
-                            preset_to_set = preset_name_it
-                            break
+                    preset_to_set = _match_time_preset(day, night)
                 except Exception:
                     preset_to_set = "Custom"
             if preset_to_set is not None:
@@ -6999,7 +7162,7 @@ def complete_seasons_and_maps(file_path, selected_seasons, selected_maps, notify
             return _action_error("'objectiveStates' not found in save file.", notify=notify)
 
         block_str, block_start, block_end = extract_brace_block(content, start)
-        obj_states = json.loads(block_str)
+        obj_states = _json_loads_block(block_str)
         modified = False
 
         for key in obj_states:
@@ -7023,7 +7186,7 @@ def complete_seasons_and_maps(file_path, selected_seasons, selected_maps, notify
         if not modified:
             return _action_result("Notice", "No matching missions found.", notify=notify)
 
-        new_block_str = json.dumps(obj_states, separators=(",", ":"))
+        new_block_str = _json_dumps_compact(obj_states)
         content = content[:block_start] + new_block_str + content[block_end:]
         _write_text_file_atomic(file_path, content, encoding="utf-8")
 
@@ -7054,54 +7217,180 @@ def sync_factor_rule_dropdowns(file_path):
 # SECTION: JSON Block Parsing + Contest/Mission Helpers
 # Used In: Contests tab, Objectives tab
 # =============================================================================
-def extract_brace_block(s, start_index):
-    open_braces = 0
-    in_string = False
-    escape = False
+# json.dumps() builds a fresh encoder whenever non-default options are passed;
+# reuse one for the compact layout the game writes.
+_COMPACT_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+# orjson decodes integers outside the 64-bit range to floats instead of
+# failing, so text with a run of 19+ digits (anything that could reach that
+# range) is left to the stdlib decoder. Digits inside strings or long float
+# mantissas also trip this; they just take the slower path.
+_LONG_DIGIT_RUN_RE = re.compile(r"\d{19}")
+
+def _orjson_can_decode(text):
+    """True if orjson would decode text to the same values as json.loads."""
+    return _orjson is not None and _LONG_DIGIT_RUN_RE.search(text) is None
+
+def _json_loads_block(text):
+    """
+    Decode a JSON block extracted from a save. orjson is used when installed,
+    except for text holding integers it cannot keep exact (see
+    _orjson_can_decode) or text it rejects, which go through json.loads.
+    """
+    if _orjson_can_decode(text):
+        try:
+            return _orjson.loads(text)
+        except Exception:
+            pass
+    return json.loads(text)
+
+def _has_non_finite_float(obj):
+    """True if obj (nested dicts/lists) holds a NaN or +/-Infinity float."""
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+def _json_dumps_compact(obj):
+    """
+    Compact JSON text with no whitespace between tokens.
+
+    With orjson available, non-ASCII characters are written unescaped and
+    floats in orjson's shortest form (1e16 rather than 1e+16); both read back
+    to the same values. orjson writes NaN/Infinity as null, so objects holding
+    them (and anything orjson rejects, like ints beyond 64 bits) are written by
+    json.dumps(obj, separators=(",", ":")) instead, which keeps NaN/Infinity
+    and escapes non-ASCII as \\uXXXX.
+    """
+    if _orjson is not None:
+        try:
+            text = _orjson.dumps(obj)
+        except Exception:
+            text = None
+        # "null" is also what a non-finite float turns into; only then walk obj
+        if text is not None and (b"null" not in text or not _has_non_finite_float(obj)):
+            return text.decode("utf-8")
+    return _COMPACT_JSON_ENCODER.encode(obj)
+
+_JSON_RAW_DECODER = json.JSONDecoder()
+
+def _decode_json_document(content):
+    """
+    Decode a file that holds one JSON value, tolerating surrounding whitespace
+    and the trailing NUL padding the game leaves behind.
+    Returns (obj, start, end) with content[start:end] being the JSON text.
+    """
+    start = len(content) - len(content.lstrip())
+    end = len(content.rstrip(" \t\r\n\x00"))
+    if _orjson_can_decode(content):
+        try:
+            return _orjson.loads(content[start:end]), start, end
+        except Exception:
+            pass
+    obj, stop = _JSON_RAW_DECODER.raw_decode(content, start)
+    if content[stop:end].strip():
+        raise ValueError("Extra data after JSON document.")
+    return obj, start, stop
+
+def _iter_spliced_text(content, edits):
+    """Yield content with (start, end, replacement) edits applied, without building the joined text."""
+    pos = 0
+    for start, end, replacement in sorted(edits, key=lambda edit: edit[0]):
+        if start < pos:
+            raise ValueError("Overlapping text edits.")
+        yield content[pos:start]
+        yield replacement
+        pos = end
+    yield content[pos:]
+
+def _find_key_object_start(content, key, pattern=None, start=0, opener="{"):
+    """Index of the '{' opening `"key":{` in content, or -1.
+
+    Saves are written compact, so a plain substring find hits first; the
+    whitespace-tolerant pattern is only tried when the literal is absent.
+    Pass opener="[" (and a matching pattern) to locate an array instead.
+    """
+    needle = f'"{key}":{opener}'
+    idx = content.find(needle, start)
+    if idx >= 0:
+        return idx + len(needle) - 1
+    if pattern is None:
+        return -1
+    match = pattern.search(content, start)
+    return match.end() - 1 if match else -1
+
+def _find_unique_key_object_start(content, key, opener="{"):
+    """Index of the opener in `"key":{` (or `"key":[`) when that text occurs exactly once in content, else -1."""
+    needle = f'"{key}":{opener}'
+    idx = content.find(needle)
+    if idx < 0 or content.find(needle, idx + 1) >= 0:
+        return -1
+    return idx + len(needle) - 1
+
+# Tokens for the block scanners: whole string literals (so braces/brackets
+# inside strings are skipped in C), an escaped quote/backslash outside a string
+# (ignored, as the old per-character loop did), the structural characters, or a
+# stray quote that opens an unterminated string.
+_BRACE_SCAN_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|\\["\\]|[{}]|"', re.S)
+_BRACKET_SCAN_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|\\["\\]|[\[\]]|"', re.S)
+
+def _scan_balanced_block(s, start_index, open_char, scan_re):
+    depth = 0
     block_start = None
-    for i in range(start_index, len(s)):
-        char = s[i]
-        if char == '"' and not escape:
-            in_string = not in_string
-        if not in_string:
-            if char == '{':
-                if open_braces == 0:
-                    block_start = i
-                open_braces += 1
-            elif char == '}':
-                open_braces -= 1
-                if open_braces == 0 and block_start is not None:
-                    return s[block_start:i+1], block_start, i+1
-        escape = (char == '\\' and not escape)
-    raise ValueError("Matching closing brace not found.")
+    for match in scan_re.finditer(s, start_index):
+        token = match.group()
+        if token == open_char:
+            if depth == 0:
+                block_start = match.start()
+            depth += 1
+        elif token[0] == '"':
+            if len(token) == 1:
+                # unterminated string: nothing after it can close the block
+                return None
+        elif token[0] == "\\":
+            continue
+        else:
+            depth -= 1
+            if depth == 0 and block_start is not None:
+                end = match.end()
+                return s[block_start:end], block_start, end
+    return None
+
+def extract_brace_block(s, start_index):
+    found = _scan_balanced_block(s, start_index, "{", _BRACE_SCAN_RE)
+    if found is None:
+        raise ValueError("Matching closing brace not found.")
+    return found
 
 def extract_bracket_block(s, start_index):
-    open_brackets = 0
-    in_string = False
-    escape = False
-    block_start = None
-    for i in range(start_index, len(s)):
-        char = s[i]
-        if char == '"' and not escape:
-            in_string = not in_string
-        if not in_string:
-            if char == '[':
-                if open_brackets == 0:
-                    block_start = i
-                open_brackets += 1
-            elif char == ']':
-                open_brackets -= 1
-                if open_brackets == 0 and block_start is not None:
-                    return s[block_start:i+1], block_start, i+1
-        escape = (char == '\\' and not escape)
-    raise ValueError("Matching closing bracket not found.")
+    found = _scan_balanced_block(s, start_index, "[", _BRACKET_SCAN_RE)
+    if found is None:
+        raise ValueError("Matching closing bracket not found.")
+    return found
+
+def _decode_json_value_at(s, start_index):
+    """
+    Decode the JSON value that begins exactly at s[start_index].
+    Returns (obj, start, end) like extract_brace_block, but with the parsed
+    value: the stdlib C scanner finds the end and decodes in one pass, which
+    beats scanning the block out first and decoding its text afterwards.
+    """
+    obj, end = _JSON_RAW_DECODER.raw_decode(s, start_index)
+    return obj, start_index, end
 def update_all_contest_times_blocks(content, new_entries):
     matches = list(re.finditer(r'"contestTimes"\s*:\s*{', content))
     updated_content = content
     for match in reversed(matches):  # process backwards so offsets remain valid
         json_block, block_start, block_end = extract_brace_block(updated_content, match.end() - 1)
         try:
-            parsed = json.loads(json_block)
+            parsed = _json_loads_block(json_block)
         except Exception:
             # If parsing fails, skip this block
             continue
@@ -7111,7 +7400,7 @@ def update_all_contest_times_blocks(content, new_entries):
                 parsed[key] = val
                 changed = True
         if changed:
-            new_block_str = json.dumps(parsed, separators=(",", ":"))
+            new_block_str = _json_dumps_compact(parsed)
             updated_content = updated_content[:block_start] + new_block_str + updated_content[block_end:]
     return updated_content
 def mark_discovered_contests_complete(save_path, selected_seasons, selected_maps, debug=False, notify=True, make_backup=True):
@@ -7149,7 +7438,7 @@ def mark_discovered_contests_complete(save_path, selected_seasons, selected_maps
             value_block_str, val_block_start, val_block_end = extract_brace_block(content, match.end() - 1)
             # value_block_str is the JSON string for the value of the CompleteSave key
             try:
-                value_data = json.loads(value_block_str)
+                value_data = _json_loads_block(value_block_str)
             except Exception as e:
                 # skip malformed blocks
                 if debug:
@@ -7234,7 +7523,7 @@ def mark_discovered_contests_complete(save_path, selected_seasons, selected_maps
 
                 # put SslValue back and serialize the value block back to JSON
                 value_data["SslValue"] = ssl_value
-                new_value_block_str = json.dumps(value_data, separators=(",", ":"))
+                new_value_block_str = _json_dumps_compact(value_data)
 
                 # replace this block in the file content
                 content = content[:val_block_start] + new_value_block_str + content[val_block_end:]
@@ -7267,7 +7556,7 @@ def mark_discovered_contests_complete(save_path, selected_seasons, selected_maps
                 save_key = match.group(1)
                 value_block_str, val_block_start, val_block_end = extract_brace_block(content, match.end() - 1)
                 try:
-                    value_data = json.loads(value_block_str)
+                    value_data = _json_loads_block(value_block_str)
                 except Exception:
                     continue
                 ssl_value = value_data.get("SslValue") or value_data.get(save_key, {}).get("SslValue") or {}
@@ -7325,7 +7614,7 @@ def mark_discovered_contests_complete(save_path, selected_seasons, selected_maps
                     if isinstance(viewed, list):
                         ssl_value["viewedUnactivatedObjectives"] = [v for v in viewed if v not in added_keys]
                     value_data["SslValue"] = ssl_value
-                    new_value_block_str = json.dumps(value_data, separators=(",", ":"))
+                    new_value_block_str = _json_dumps_compact(value_data)
                     content = content[:val_block_start] + new_value_block_str + content[val_block_end:]
                     made_any = True
                     total_added += len(added_keys)
@@ -8247,6 +8536,13 @@ for _lvl in VISITED_LEVELS_DEFAULTS:
     except Exception:
         pass
 
+_UPGRADES_GIVER_DATA_RE = re.compile(r'"upgradesGiverData"\s*:\s*{')
+_PERSISTENT_PROFILE_DATA_RE = re.compile(r'"persistentProfileData"\s*:\s*{')
+_DISCOVERED_UPGRADES_RE = re.compile(r'"discoveredUpgrades"\s*:\s*{')
+# upgrade states that still need unlocking (2 = unlocked); a tuple, not a
+# frozenset, so malformed list/dict entries are skipped instead of raising
+_ZERO_OR_ONE = (0, 1)
+
 def _ensure_upgrades_defaults(upgrades_data):
     added = 0
     for map_key, upgrades in UPGRADES_GIVER_UNLOCKS.items():
@@ -8263,13 +8559,38 @@ def _ensure_upgrades_defaults(upgrades_data):
                 added += 1
     return added
 
-def _level_key_matches_regions(map_key, selected_region_codes):
-    map_key_low = str(map_key or "").lower()
+def _changed_map_block_edits(content, block_start, block_end, changed_maps, new_data):
+    """Text edits that rewrite only the changed per-map objects inside a block.
+
+    changed_maps holds the original (decoded) value of every changed key.
+    Returns None when a map object can't be located unambiguously, so the
+    caller re-encodes the whole block instead.
+    """
+    edits = []
+    for map_key, original in changed_maps.items():
+        index = _find_key_object_start(content, map_key, start=block_start)
+        if index < 0 or index >= block_end:
+            return None
+        old_text, start, end = extract_brace_block(content, index)
+        if end > block_end or _json_loads_block(old_text) != original:
+            return None
+        edits.append((start, end, _json_dumps_compact(new_data[map_key])))
+    return edits
+
+def _region_level_tokens(selected_region_codes):
+    """Lowercased "level_<code>" tokens for region codes; build once per batch of keys."""
+    tokens = []
     for code in selected_region_codes or []:
         code_low = str(code or "").strip().lower()
-        if code_low and f"level_{code_low}" in map_key_low:
-            return True
-    return False
+        if code_low:
+            tokens.append(f"level_{code_low}")
+    return tuple(tokens)
+
+def _level_key_matches_regions(map_key, selected_region_codes, level_tokens=None):
+    if level_tokens is None:
+        level_tokens = _region_level_tokens(selected_region_codes)
+    map_key_low = str(map_key or "").lower()
+    return any(token in map_key_low for token in level_tokens)
 
 def _ensure_watchpoints_defaults(wp_data):
     added = 0
@@ -8335,8 +8656,9 @@ def _truck_shop_unlock_ids_for_regions(selected_region_codes, unlocks_by_level=N
     source = unlocks_by_level if isinstance(unlocks_by_level, dict) else DISCOVERY_TRUCK_SHOP_UNLOCKS_BY_LEVEL
     out = []
     seen = set()
+    level_tokens = _region_level_tokens(selected_region_codes)
     for level_id, truck_ids in source.items():
-        if not _level_key_matches_regions(level_id, selected_region_codes):
+        if not _level_key_matches_regions(level_id, selected_region_codes, level_tokens):
             continue
         for raw_id in truck_ids or ():
             tid = _normalize_truck_shop_unlock_id(raw_id)
@@ -8406,11 +8728,14 @@ def _ensure_discovered_upgrades_defaults(du_data, selected_region_codes=None):
     added = 0
     if not isinstance(du_data, dict):
         du_data = {}
+    level_tokens = _region_level_tokens(selected_region_codes)
     for map_key, upgrades in UPGRADES_GIVER_UNLOCKS.items():
         map_key_text = str(map_key or "").strip()
         if not map_key_text.lower().startswith("level_"):
             continue
-        if selected_region_codes is not None and not _level_key_matches_regions(map_key_text, selected_region_codes):
+        if selected_region_codes is not None and not _level_key_matches_regions(
+            map_key_text, selected_region_codes, level_tokens
+        ):
             continue
         all_count = len(upgrades) if isinstance(upgrades, dict) else 0
         if all_count <= 0:
@@ -8507,7 +8832,7 @@ def unlock_watchtowers(save_path, selected_regions, notify=True, make_backup=Tru
             return _action_error("No watchPointsData found in file.", notify=notify)
 
         block, start, end = extract_brace_block(content, match.end() - 1)
-        wp_data = json.loads(block)
+        wp_data = _json_loads_block(block)
         added = _ensure_watchpoints_defaults(wp_data)
         updated = 0
 
@@ -8526,7 +8851,7 @@ def unlock_watchtowers(save_path, selected_regions, notify=True, make_backup=Tru
                             updated += 1
                     break
 
-        new_block = json.dumps(wp_data, separators=(",", ":"))
+        new_block = _json_dumps_compact(wp_data)
         content = content[:start] + new_block + content[end:]
         with open(save_path, "w", encoding="utf-8") as f:
             f.write(content)
@@ -8552,7 +8877,7 @@ def unlock_garages(save_path, selected_regions, upgrade_all=False, notify=True,
 
         ssl_block, ssl_start, ssl_end = extract_brace_block(content, ssl_match.end() - 1)
         try:
-            ssl_data = json.loads(ssl_block)
+            ssl_data = _json_loads_block(ssl_block)
         except Exception as e:
             return _action_error(f"Failed to parse SslValue:\n{e}", notify=notify)
 
@@ -8629,7 +8954,7 @@ def unlock_garages(save_path, selected_regions, upgrade_all=False, notify=True,
                 upgraded_entries += 1
             ssl_data["upgradableGarages"] = ug_data
 
-        new_block = json.dumps(ssl_data, separators=(",", ":"))
+        new_block = _json_dumps_compact(ssl_data)
         content = content[:ssl_start] + new_block + content[ssl_end:]
 
         with open(save_path, "w", encoding="utf-8") as f:
@@ -8655,13 +8980,13 @@ def unlock_discoveries(save_path, selected_regions, notify=True, make_backup=Tru
         with open(save_path, "r", encoding="utf-8") as f:
             content = f.read()
 
-        pp_match = re.search(r'"persistentProfileData"\s*:\s*{', content)
+        pp_match = _PERSISTENT_PROFILE_DATA_RE.search(content)
         if not pp_match:
             return _action_error("persistentProfileData not found in save file.", notify=notify)
 
         pp_block, pp_start, pp_end = extract_brace_block(content, pp_match.end() - 1)
         try:
-            pp_data = json.loads(pp_block)
+            pp_data = _json_loads_block(pp_block)
         except Exception as e:
             return _action_error(f"Failed to parse persistentProfileData:\n{e}", notify=notify)
 
@@ -8697,7 +9022,7 @@ def unlock_discoveries(save_path, selected_regions, notify=True, make_backup=Tru
             include_mission_trucks=bool(include_mission_trucks),
         )
 
-        pp_block = json.dumps(pp_data, separators=(",", ":"))
+        pp_block = _json_dumps_compact(pp_data)
         content = content[:pp_start] + pp_block + content[pp_end:]
 
         total_current = _sum_discovered_trucks_current(dt_data)
@@ -8748,7 +9073,7 @@ def unlock_levels(save_path, selected_regions, notify=True, make_backup=True):
             content = f.read()
 
         # --- persistentProfileData.knownRegions (only this block) ---
-        pp_match = re.search(r'"persistentProfileData"\s*:\s*{', content)
+        pp_match = _PERSISTENT_PROFILE_DATA_RE.search(content)
         if not pp_match:
             return _action_error("persistentProfileData not found in save file.", notify=notify)
 
@@ -8757,7 +9082,7 @@ def unlock_levels(save_path, selected_regions, notify=True, make_backup=True):
         if kr_match:
             kr_block, kr_start, kr_end = extract_bracket_block(pp_block, kr_match.end() - 1)
             try:
-                known_regions = json.loads(kr_block)
+                known_regions = _json_loads_block(kr_block)
             except Exception:
                 known_regions = []
         else:
@@ -8771,7 +9096,7 @@ def unlock_levels(save_path, selected_regions, notify=True, make_backup=True):
                 known_regions.append(key)
                 added_selected_kr += 1
 
-        new_known = json.dumps(known_regions, separators=(",", ":"))
+        new_known = _json_dumps_compact(known_regions)
         if kr_start is not None and kr_end is not None:
             pp_block = pp_block[:kr_start] + new_known + pp_block[kr_end:]
         else:
@@ -8784,7 +9109,7 @@ def unlock_levels(save_path, selected_regions, notify=True, make_backup=True):
         if vl_match:
             vl_block, vl_start, vl_end = extract_bracket_block(content, vl_match.end() - 1)
             try:
-                visited_levels = json.loads(vl_block)
+                visited_levels = _json_loads_block(vl_block)
             except Exception:
                 visited_levels = []
         else:
@@ -8798,7 +9123,7 @@ def unlock_levels(save_path, selected_regions, notify=True, make_backup=True):
                     visited_levels.append(lvl)
                     added_selected_vl += 1
 
-        new_visited = json.dumps(visited_levels, separators=(",", ":"))
+        new_visited = _json_dumps_compact(visited_levels)
         if vl_start is not None and vl_end is not None:
             content = content[:vl_start] + new_visited + content[vl_end:]
         else:
@@ -8967,7 +9292,7 @@ def _read_finished_contests(path: str) -> Set[str]:
     save_key = m.group(1)
     try:
         json_block, _, _ = extract_json_block_by_key(content, save_key)
-        data = json.loads(json_block)
+        data = _json_loads_block(json_block)
     except Exception:
         return set()
 
@@ -8993,7 +9318,7 @@ def _read_recorded_contest_times(path: str) -> Set[str]:
     for match in re.finditer(r'"contestTimes"\s*:\s*{', content):
         try:
             block, _, _ = extract_brace_block(content, match.end() - 1)
-            parsed = json.loads(block)
+            parsed = _json_loads_block(block)
         except Exception:
             continue
         if not isinstance(parsed, dict):
@@ -9038,7 +9363,7 @@ def _read_finished_missions(save_path: str) -> Set[str]:
         if start == -1:
             return set()
         block, bs, be = extract_brace_block(content, start)
-        obj_states = json.loads(block)
+        obj_states = _json_loads_block(block)
         return {k for k, v in obj_states.items() if isinstance(v, dict) and v.get("isFinished")}
     except Exception:
         return set()
@@ -17684,7 +18009,7 @@ class VirtualObjectivesFast:
                             try:
                                 block, bs, be = extract_brace_block(content, start)
                                 try:
-                                    obj_states = json.loads(block)
+                                    obj_states = _json_loads_block(block)
                                 except Exception:
                                     obj_states = {}
                                 for kid in mission_changes.keys():
@@ -17713,7 +18038,7 @@ class VirtualObjectivesFast:
                                 try:
                                     value_block_str, val_block_start, val_block_end = extract_brace_block(content, match.end() - 1)
                                     try:
-                                        value_data = json.loads(value_block_str)
+                                        value_data = _json_loads_block(value_block_str)
                                     except Exception:
                                         continue
 
@@ -17803,7 +18128,7 @@ class VirtualObjectivesFast:
                                             ssl["viewedUnactivatedObjectives"] = new_viewed
 
                                         value_data["SslValue"] = ssl
-                                        new_value_block_str = json.dumps(value_data, separators=(",", ":"))
+                                        new_value_block_str = _json_dumps_compact(value_data)
                                         content = content[:val_block_start] + new_value_block_str + content[val_block_end:]
 
                                         finished_added_total += len(added_here)
@@ -18012,6 +18337,37 @@ class VirtualObjectivesFast:
 # SECTION: Tab Builders (UI construction)
 # Used In: launch_gui -> Notebook tabs
 # =============================================================================
+def _run_in_worker(widget, work, on_done, poll_ms=50):
+    """
+    Run work() on a daemon thread and pass its return value to on_done() on
+    the Tk thread. The worker only fills a queue that widget.after() polls,
+    so no Tk call is made from the worker. If work() raises, on_done() gets
+    the exception instance instead.
+    """
+    results = queue.Queue(maxsize=1)
+
+    def _worker():
+        try:
+            result = work()
+        except Exception as e:
+            result = e
+        results.put(result)
+
+    def _poll():
+        try:
+            result = results.get_nowait()
+        except queue.Empty:
+            try:
+                widget.after(poll_ms, _poll)
+            except tk.TclError:
+                pass  # widget is gone, nobody left to report to
+            return
+        on_done(result)
+
+    threading.Thread(target=_worker, daemon=True).start()
+    widget.after(poll_ms, _poll)
+
+
 # TAB: Backups (launch_gui -> tab_backups)
 def create_backups_tab(tab_backups, save_path_var):
     """
@@ -20558,13 +20914,7 @@ def _add_check_all_checkbox(tab, all_vars, before_widget=None, label="Check All"
     cb.pack(**pack_kwargs)
 
     for v in all_vars:
-        try:
-            v.trace_add("write", sync_all)
-        except Exception:
-            try:
-                v.trace("w", sync_all)
-            except Exception:
-                pass
+        _trace_var_write(v, sync_all)
 
     # Ensure initial state matches current selections
     sync_all()
@@ -20725,20 +21075,38 @@ def _build_region_selector(
         "map_frame": map_frame,
     }
 
+def _snapshot_checked_states(variables):
+    """Truth values of several Tk variables, read with a single Tcl round trip."""
+    if not variables:
+        return []
+    try:
+        interp = variables[0]._tk
+        script = "list " + " ".join(f"[set {{::{var._name}}}]" for var in variables)
+        raw_values = interp.splitlist(interp.eval(script))
+        if len(raw_values) == len(variables):
+            return [bool(interp.getboolean(raw)) if str(raw) != "" else False for raw in raw_values]
+    except Exception:
+        pass
+    return [bool(var.get()) for var in variables]
+
 def _collect_checked_values(pairs):
-    return [value for value, var in pairs if bool(var.get())]
+    pairs = list(pairs)
+    states = _snapshot_checked_states([var for _, var in pairs])
+    return [value for (value, _), checked in zip(pairs, states) if checked]
 
 def _append_other_season_int(selected, other_var):
     try:
-        if other_var is not None and other_var.get().isdigit():
-            selected.append(int(other_var.get()))
+        raw = other_var.get() if other_var is not None else ""
+        if raw.isdigit():
+            selected.append(int(raw))
     except Exception:
         pass
 
 def _append_other_region_code(selected, other_var):
     try:
-        if other_var is not None and other_var.get().isdigit():
-            selected.append(f"US_{int(other_var.get()):02}")
+        raw = other_var.get() if other_var is not None else ""
+        if raw.isdigit():
+            selected.append(f"US_{int(raw):02}")
     except Exception:
         pass
 
@@ -20748,14 +21116,28 @@ def _collect_selected_regions(season_vars, map_vars, other_var=None):
     _append_other_region_code(selected, other_var)
     return selected
 
+# common_ssl_path as last read from the config, keyed by the config file's
+# (mtime_ns, size): any save_config() call changes the stamp, so the memo
+# can't go stale while repeated syncs skip re-reading the JSON
+_COMMON_SSL_PATH_MEMO = {"stamp": None, "path": ""}
+
 def _load_common_ssl_path_from_config():
+    stamp = _config_file_stamp()
+    if stamp is not None and stamp == _COMMON_SSL_PATH_MEMO["stamp"]:
+        return _COMMON_SSL_PATH_MEMO["path"]
     try:
         cfg = load_config()
-        return cfg.get("common_ssl_path", "") if isinstance(cfg, dict) else ""
+        path = cfg.get("common_ssl_path", "") if isinstance(cfg, dict) else ""
     except Exception:
         return ""
+    _COMMON_SSL_PATH_MEMO.update(stamp=stamp, path=path)
+    return path
 
 def _save_common_ssl_path_to_config(path):
+    # every CommonSslSave tab reports the same path on each load/sync;
+    # only rewrite the config when it actually changes
+    if path and _load_common_ssl_path_from_config() == path:
+        return
     try:
         cfg = load_config() or {}
         cfg["common_ssl_path"] = path
@@ -20763,32 +21145,54 @@ def _save_common_ssl_path_to_config(path):
     except Exception:
         pass
 
+# prefer exact commonsslsave filenames
+_COMMON_SSL_PREFERRED_FILENAMES = frozenset((
+    "commonsslsave",
+    "commonsslsave.cfg",
+    "commonsslsave.dat",
+    "common_ssl_save",
+    "common_ssl_save.cfg",
+    "common_ssl_save.dat",
+))
+
+# (folder, folder mtime_ns, allow_json) -> found path ("" when none); a
+# directory's mtime changes whenever entries are added, removed or renamed.
+_COMMON_SSL_SCAN_CACHE = {}
+_COMMON_SSL_SCAN_CACHE_MAX = 32
+
+def _scan_folder_for_common_ssl_save(folder, allow_json=True):
+    # single directory pass: stop at the first preferred name, otherwise
+    # fall back to the first fuzzy "common...ssl" save-looking file
+    fuzzy = None
+    with os.scandir(folder) as it:
+        for entry in it:
+            low = entry.name.lower()
+            if low in _COMMON_SSL_PREFERRED_FILENAMES:
+                return os.path.join(folder, entry.name)
+            if (
+                fuzzy is None
+                and "common" in low
+                and "ssl" in low
+                and _is_probable_snowrunner_save_filename(low, allow_json=allow_json)
+            ):
+                fuzzy = os.path.join(folder, entry.name)
+    return fuzzy
+
 def _find_common_ssl_save_in_folder(folder, allow_json=True):
     if not folder or not os.path.isdir(folder):
         return None
-    # prefer exact commonsslsave filenames
-    preferred = (
-        "commonsslsave",
-        "commonsslsave.cfg",
-        "commonsslsave.dat",
-        "common_ssl_save",
-        "common_ssl_save.cfg",
-        "common_ssl_save.dat",
-    )
-    candidates = []
     try:
-        for fname in os.listdir(folder):
-            low = fname.lower()
-            if low in preferred:
-                candidates.append(os.path.join(folder, fname))
-        if not candidates:
-            for fname in os.listdir(folder):
-                low = fname.lower()
-                if "common" in low and "ssl" in low and _is_probable_snowrunner_save_filename(low, allow_json=allow_json):
-                    candidates.append(os.path.join(folder, fname))
+        cache_key = (os.path.abspath(folder), os.stat(folder).st_mtime_ns, bool(allow_json))
+        cached = _COMMON_SSL_SCAN_CACHE.get(cache_key)
+        if cached is not None and (not cached or os.path.exists(cached)):
+            return cached or None
+        found = _scan_folder_for_common_ssl_save(folder, allow_json=allow_json)
     except Exception:
         return None
-    return candidates[0] if candidates else None
+    if cache_key not in _COMMON_SSL_SCAN_CACHE and len(_COMMON_SSL_SCAN_CACHE) >= _COMMON_SSL_SCAN_CACHE_MAX:
+        _COMMON_SSL_SCAN_CACHE.pop(next(iter(_COMMON_SSL_SCAN_CACHE)), None)
+    _COMMON_SSL_SCAN_CACHE[cache_key] = found or ""
+    return found
 
 def _pick_common_ssl_file(save_path_var, allow_json=True):
     startdir = os.path.dirname(save_path_var.get()) if save_path_var.get() else os.getcwd()
@@ -20816,12 +21220,67 @@ def _sync_common_ssl_from_save(main_save_path, target_var, on_load, allow_json=T
         pass
     return False
 
-def _trace_var_write(var, callback):
+_COMMON_SSL_SAVE_RE = re.compile(r'"CommonSslSave"\s*:\s*{')
+
+def _parse_common_ssl_content(content):
+    """
+    Parse CommonSslSave text. Returns (doc, block, start, end):
+    - doc is the JSON value stored at content[start:end]
+    - block is the CommonSslSave object inside doc (edits to it land in doc)
+    The whole file is decoded in one pass; the regex + brace scan is only used
+    when that fails. start/end are None for a bare SslValue dump.
+    """
+    try:
+        doc, start, end = _decode_json_document(content)
+    except ValueError:
+        doc = None
+    if isinstance(doc, dict):
+        block = doc.get("CommonSslSave")
+        if isinstance(block, dict):
+            return doc, block, start, end
+    block_index = _find_key_object_start(content, "CommonSslSave", _COMMON_SSL_SAVE_RE)
+    if block_index >= 0:
+        block, bs, be = _decode_json_value_at(content, block_index)
+        return block, block, bs, be
+    if doc is None:
+        doc = json.loads(content)
+    return doc, doc, None, None
+
+# Callbacks with a coalesced run already queued for the next idle cycle.
+_COALESCED_TRACE_PENDING = set()
+
+def _run_coalesced_on_idle(var, callback):
+    """Queue callback for the next idle cycle unless a run is already pending."""
+    if callback in _COALESCED_TRACE_PENDING:
+        return
+    root = getattr(var, "_root", None) or tk._default_root
+    if root is None:
+        callback()
+        return
+
+    def _flush():
+        _COALESCED_TRACE_PENDING.discard(callback)
+        callback()
+
+    _COALESCED_TRACE_PENDING.add(callback)
     try:
-        var.trace_add("write", lambda *a: callback())
+        root.after_idle(_flush)
+    except Exception:
+        _COALESCED_TRACE_PENDING.discard(callback)
+        callback()
+
+def _trace_var_write(var, callback, coalesce=False):
+    """Call callback when var is written; with coalesce=True, a burst of writes
+    (e.g. "Check All" over many vars sharing one callback) runs it once per idle cycle."""
+    if coalesce:
+        handler = lambda *a: _run_coalesced_on_idle(var, callback)
+    else:
+        handler = lambda *a: callback()
+    try:
+        var.trace_add("write", handler)
     except Exception:
         try:
-            var.trace("w", lambda *a: callback())
+            var.trace("w", handler)
         except Exception:
             pass
 
@@ -20875,40 +21334,48 @@ def find_and_modify_upgrades(save_path, selected_region_codes, notify=True, make
         with open(save_path, "r", encoding="utf-8") as f:
             content = f.read()
 
-        match = re.search(r'"upgradesGiverData"\s*:\s*{', content)
-        if not match:
+        start_index = _find_key_object_start(content, "upgradesGiverData", _UPGRADES_GIVER_DATA_RE)
+        if start_index < 0:
             return _action_error("No upgradesGiverData found in file.", notify=notify)
 
-        start_index = match.end() - 1
-        block, block_start, block_end = extract_brace_block(content, start_index)
-        upgrades_data = json.loads(block)
+        upgrades_data, block_start, block_end = _decode_json_value_at(content, start_index)
         added = _ensure_upgrades_defaults(upgrades_data)
         updated = 0
+        changed_maps = {}
 
+        level_tokens = _region_level_tokens(selected_region_codes)
         for map_key, upgrades in upgrades_data.items():
             if not isinstance(upgrades, dict):
                 continue
-            for code in selected_region_codes:
-                if f"level_{code.lower()}" in map_key.lower():
-                    for upgrade_key, value in upgrades.items():
-                        if value in (0, 1):
-                            upgrades[upgrade_key] = 2
-                            updated += 1
-                    break
+            if not _level_key_matches_regions(map_key, selected_region_codes, level_tokens):
+                continue
+            pending = sum(1 for value in upgrades.values() if value in _ZERO_OR_ONE)
+            if pending:
+                changed_maps[map_key] = upgrades
+                upgrades_data[map_key] = {
+                    upgrade_key: (2 if value in _ZERO_OR_ONE else value)
+                    for upgrade_key, value in upgrades.items()
+                }
+                updated += pending
 
-        new_block = json.dumps(upgrades_data, separators=(",", ":"))
-        content = content[:block_start] + new_block + content[block_end:]
+        # When no defaults were added, only the changed maps need re-encoding;
+        # everything else in upgradesGiverData keeps its original text.
+        edits = None
+        if not added:
+            edits = _changed_map_block_edits(content, block_start, block_end, changed_maps, upgrades_data)
+        if edits is None:
+            edits = [(block_start, block_end, _json_dumps_compact(upgrades_data))]
 
         discovered_added = 0
         discovered_updated = 0
-        pp_match = re.search(r'"persistentProfileData"\s*:\s*{', content)
-        if pp_match:
-            pp_block, pp_start, pp_end = extract_brace_block(content, pp_match.end() - 1)
-            du_match = re.search(r'"discoveredUpgrades"\s*:\s*{', pp_block)
-            if du_match:
-                du_block, du_start, du_end = extract_brace_block(pp_block, du_match.end() - 1)
+        pp_index = _find_key_object_start(content, "persistentProfileData", _PERSISTENT_PROFILE_DATA_RE)
+        if pp_index >= 0:
+            pp_block, pp_start, pp_end = extract_brace_block(content, pp_index)
+            du_index = _find_key_object_start(pp_block, "discoveredUpgrades", _DISCOVERED_UPGRADES_RE)
+            if du_index >= 0:
+                du_block, du_start, du_end = extract_brace_block(pp_block, du_index)
                 try:
-                    du_data = json.loads(du_block)
+                    du_data = _json_loads_block(du_block)
                 except Exception:
                     du_data = {}
             else:
@@ -20918,7 +21385,7 @@ def find_and_modify_upgrades(save_path, selected_region_codes, notify=True, make
             discovered_added, du_data = _ensure_discovered_upgrades_defaults(du_data, selected_region_codes)
             if isinstance(du_data, dict):
                 for map_key, entry in du_data.items():
-                    if not _level_key_matches_regions(map_key, selected_region_codes):
+                    if not _level_key_matches_regions(map_key, selected_region_codes, level_tokens):
                         continue
                     if not isinstance(entry, dict):
                         entry = {"current": 0, "all": 0}
@@ -20928,15 +21395,16 @@ def find_and_modify_upgrades(save_path, selected_region_codes, notify=True, make
                     if entry.get("current") != before_current:
                         discovered_updated += 1
 
-            new_du_block = json.dumps(du_data, separators=(",", ":"))
+            new_du_block = _json_dumps_compact(du_data)
             if du_start is not None and du_end is not None:
                 pp_block = pp_block[:du_start] + new_du_block + pp_block[du_end:]
             else:
                 pp_block = _set_key_in_text(pp_block, "discoveredUpgrades", new_du_block)
-            content = content[:pp_start] + pp_block + content[pp_end:]
+            edits.append((pp_start, pp_end, pp_block))
 
-        with open(save_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        # stream prefix / edited blocks / suffix straight to disk instead of
+        # concatenating a full copy of the save per edited block
+        _write_text_chunks_atomic(save_path, _iter_spliced_text(content, edits), encoding="utf-8")
 
         msg = f"Updated {updated} upgrades."
         if added:
@@ -20989,41 +21457,47 @@ ACHIEVEMENT_NAMES = {
     "ModelCollector_AllTrucks": "Model Collector",
     "OneWithTruck_ComplAllAchiev": "One With The Truck",
 }
+# Checkbox order (display name, case-insensitive), computed once.
+_ACHIEVEMENT_SORT_KEYS = {key: name.lower() for key, name in ACHIEVEMENT_NAMES.items()}
+
+def _achievement_sort_key(key):
+    sort_key = _ACHIEVEMENT_SORT_KEYS.get(key)
+    return key.lower() if sort_key is None else sort_key
 # ---------------- Exact completed blocks mapping ----------------
 # When a checkbox is checked, we will write the corresponding dictionary below (exact fields).
-PRESET_COMPLETED_BLOCKS = {
+_PRESET_COMPLETED_BLOCKS_JSON = """{
     "YouCanDrive_CompleteTutorial": {
         "$type": "IntAchievementState",
         "currentValue": 1,
-        "isUnlocked": True
+        "isUnlocked": true
     },
     "GetOverHere_Winch": {
         "$type": "PlatformtIntAchievementState",
-        "isUnlocked": True,
+        "isUnlocked": true,
         "commonValue": 6,
         "psValue": 6,
-        "psIsUnlocked": False
+        "psIsUnlocked": false
     },
     "StepLightly_10Rec": {
         "$type": "PlatformtIntAchievementState",
-        "isUnlocked": True,
+        "isUnlocked": true,
         "commonValue": 10,
         "psValue": 10,
-        "psIsUnlocked": False
+        "psIsUnlocked": false
     },
     "UncleScrooge_100000money": {
         "$type": "PlatformtIntAchievementState",
-        "isUnlocked": True,
+        "isUnlocked": true,
         "commonValue": 136150,
         "psValue": 136150,
-        "psIsUnlocked": False
+        "psIsUnlocked": false
     },
     "TheBlueHall_WaterDrive": {
         "$type": "PlatformtIntAchievementState",
-        "isUnlocked": True,
+        "isUnlocked": true,
         "commonValue": 1000,
         "psValue": 1000,
-        "psIsUnlocked": False
+        "psIsUnlocked": false
     },
     "Gallo24_AddonsPrice": {
         "$type": "UpgradeAchievementState",
@@ -21047,28 +21521,28 @@ PRESET_COMPLETED_BLOCKS = {
             "ws_6900xd_twin": 6700
         },
         "currentValue": 1,
-        "isUnlocked": True
+        "isUnlocked": true
     },
     "PlayYourWay_2000Dmg": {
         "$type": "PlatformtIntAchievementState",
-        "isUnlocked": True,
+        "isUnlocked": true,
         "commonValue": 2064,
         "psValue": 2064,
-        "psIsUnlocked": False
+        "psIsUnlocked": false
     },
     "Untouch_TaskConWithoutDmg": {
         "psValuesArray": [],
         "$type": "PlatformIntWithStringArrayAchievementState",
-        "isUnlocked": True,
+        "isUnlocked": true,
         "commonValue": 10,
         "psValue": 10,
         "commonValuesArray": [],
-        "psIsUnlocked": False
+        "psIsUnlocked": false
     },
     "DeerHunt_FindAllUpgMichig": {
         "$type": "IntWithStringArrayAchievementState",
         "currentValue": 21,
-        "isUnlocked": True,
+        "isUnlocked": true,
         "valuesArray": [
             "chevrolet_ck1500_suspension_high","international_fleetstar_f2070a_transferbox_allwheels","g_scout_offroad",
             "us_truck_old_engine_1","gmc9500_suspension_high","fleetstar_f2070a_suspension_high","us_scout_old_engine_ck1500",
@@ -21080,22 +21554,22 @@ PRESET_COMPLETED_BLOCKS = {
     },
     "BeringStraight_StateTruckInGarAlaska": {
         "$type": "PlatformtIntAchievementState",
-        "isUnlocked": True,
+        "isUnlocked": true,
         "commonValue": 1,
         "psValue": 1,
-        "psIsUnlocked": False
+        "psIsUnlocked": false
     },
     "ThroughBlood_ManualLoad": {
         "$type": "PlatformtIntAchievementState",
-        "isUnlocked": True,
+        "isUnlocked": true,
         "commonValue": 4,
         "psValue": 4,
-        "psIsUnlocked": False
+        "psIsUnlocked": false
     },
     "18Wheels_OwnAzov4220Antarctic": {
         "$type": "IntAchievementState",
         "currentValue": 1,
-        "isUnlocked": True
+        "isUnlocked": true
     },
     "Simply_DeliverEveryTypeCargo": {
         "psValuesArray": [
@@ -21104,7 +21578,7 @@ PRESET_COMPLETED_BLOCKS = {
             "CargoBarrels","CargoContainerLargeDrilling","CargoBags","CargoBarrelsOil","CargoContainerSmall","CargoPipesSmall"
         ],
         "$type": "PlatformIntWithStringArrayAchievementState",
-        "isUnlocked": True,
+        "isUnlocked": true,
         "commonValue": 21,
         "psValue": 16,
         "commonValuesArray": [
@@ -21113,12 +21587,12 @@ PRESET_COMPLETED_BLOCKS = {
             "CargoBarrels","CargoContainerLargeDrilling","CargoBags","CargoBarrelsOil","CargoContainerSmall","CargoPipesSmall",
             "CargoContainerLarge","CargoPipesMedium","CargoPipeLarge","CargoRadioactive","CargoContainerSmallSpecial"
         ],
-        "psIsUnlocked": False
+        "psIsUnlocked": false
     },
     "Garages_ExploreAll": {
         "$type": "IntWithStringArrayAchievementState",
         "currentValue": 6,
-        "isUnlocked": True,
+        "isUnlocked": true,
         "valuesArray": [
             "level_us_01_01 || US_01_01_GARAGE_ENTRANCE","level_us_02_01 || US_02_01_GARAGE_ENTRANCE",
             "level_us_01_02 || GARAGE_ENTRANCE_0","level_ru_02_02 || RU_02_02_GARAGE_ENTRANCE",
@@ -21128,26 +21602,26 @@ PRESET_COMPLETED_BLOCKS = {
     "DreamsCT_RepairAllPipes": {
         "$type": "IntWithStringArrayAchievementState",
         "currentValue": 4,
-        "isUnlocked": True,
+        "isUnlocked": true,
         "valuesArray": ["US_02_01_PIPELINE_OBJ","US_02_04_PIPELINE_BUILDING_CNT","US_02_02_PIPELINE_OBJ","US_02_03_PIPELINE_OBJ"]
     },
     "TheBlackShuck_TruckDistance": {
         "$type": "PlatformtIntAchievementState",
-        "isUnlocked": True,
+        "isUnlocked": true,
         "commonValue": 1000006,
         "psValue": 621377,
-        "psIsUnlocked": False
+        "psIsUnlocked": false
     },
     "EatSlDR_DeliverOilRigToDrill": {
         "$type": "IntWithStringArrayAchievementState",
         "currentValue": 3,
-        "isUnlocked": True,
+        "isUnlocked": true,
         "valuesArray": ["US_02_01_DISASS_OBJ","US_02_02_DISASS_OBJ","US_02_03_DISASS_OBJ"]
     },
     "WatchPoints_ExploreAll": {
         "$type": "IntWithStringArrayAchievementState",
         "currentValue": 54,
-        "isUnlocked": True,
+        "isUnlocked": true,
         "valuesArray": [
             "level_us_01_01_US_01_01_W9","level_us_01_01_US_01_01_W3","level_us_01_01_US_01_01_W6","level_us_01_01_US_01_01_W7",
             "level_us_01_01_US_01_01_W1","level_us_01_01_US_01_01_W8","level_us_01_01_US_01_01_W5","level_us_01_01_US_01_01_W4",
@@ -21167,22 +21641,22 @@ PRESET_COMPLETED_BLOCKS = {
     },
     "BrokenHorse_BrokenWheels": {
         "$type": "PlatformtIntAchievementState",
-        "isUnlocked": True,
+        "isUnlocked": true,
         "commonValue": 1019,
         "psValue": 0,
-        "psIsUnlocked": False
+        "psIsUnlocked": false
     },
     "TheDuel_GetLessDmgOnRedScout": {
         "$type": "PlatformtIntAchievementState",
-        "isUnlocked": True,
+        "isUnlocked": true,
         "commonValue": 1,
         "psValue": 1,
-        "psIsUnlocked": False
+        "psIsUnlocked": false
     },
     "Moosehunt_FindAllUpgAlaska": {
         "$type": "IntWithStringArrayAchievementState",
         "currentValue": 23,
-        "isUnlocked": True,
+        "isUnlocked": true,
         "valuesArray": [
             "us_special_engine_1","hummer_h2_suspension_high","cat_ct680_transferbox_allwheels","hummer_h2_diff_lock",
             "us_scout_modern_engine_1","g_truck_highrange","us_truck_old_engine_2","us_special_engine_2","g_special_offroad",
@@ -21194,15 +21668,15 @@ PRESET_COMPLETED_BLOCKS = {
     },
     "WhyProblem_PullVehicleOutWater": {
         "$type": "PlatformtIntAchievementState",
-        "isUnlocked": True,
+        "isUnlocked": true,
         "commonValue": 1,
         "psValue": 1,
-        "psIsUnlocked": False
+        "psIsUnlocked": false
     },
     "BearHunt_FindAllUpgTaymir": {
         "$type": "IntWithStringArrayAchievementState",
         "currentValue": 21,
-        "isUnlocked": True,
+        "isUnlocked": true,
         "valuesArray": [
             "ru_truck_modern_engine_1","ru_truck_modern_engine_2","ru_scout_old_engine_2","khan_lo4f_suspension_high",
             "ru_truck_old_heavy_engine_2","ru_special_engine_2","ru_special_engine_1","don_71_suspension_high",
@@ -21214,7 +21688,7 @@ PRESET_COMPLETED_BLOCKS = {
     "FrontierElite_CompleteAllContracts": {
         "$type": "IntWithStringArrayAchievementState",
         "currentValue": 65,
-        "isUnlocked": True,
+        "isUnlocked": true,
         "valuesArray": [
             "US_01_01_EXPLORING_WATCHTOWER_OBJ","US_01_01_EXPLORING_TRUCK_OBJ","US_01_01_BUILD_A_BRIDGE_OBJ","US_01_01_EXPLORE_GARAGE_OBJ",
             "US_01_01_FARM_DELIVERY_OBJ","US_01_01_SUPPLIES_FOR_FARMERS_OBJ","US_01_01_FACTORY_RECOVERY_OBJ","US_01_01_DRILLING_RECOVERY_OBJ",
@@ -21236,42 +21710,42 @@ PRESET_COMPLETED_BLOCKS = {
     },
     "Pedal_TravelFromOneGate": {
         "$type": "PlatformtIntAchievementState",
-        "isUnlocked": True,
+        "isUnlocked": true,
         "commonValue": 1,
         "psValue": 1,
-        "psIsUnlocked": False
+        "psIsUnlocked": false
     },
     "WorkersUnite_VisitZone": {
         "psValuesArray": ["level_ru_02_03 || RU_02_03_LENIN_ZONE","level_ru_02_02 || RU_02_02_STATUE"],
         "$type": "PlatformIntWithStringArrayAchievementState",
-        "isUnlocked": True,
+        "isUnlocked": true,
         "commonValue": 2,
         "psValue": 2,
         "commonValuesArray": ["level_ru_02_03 || RU_02_03_LENIN_ZONE","level_ru_02_02 || RU_02_02_STATUE"],
-        "psIsUnlocked": False
+        "psIsUnlocked": false
     },
     "WhatsAMile_MAZ500": {
         "$type": "PlatformtIntAchievementState",
-        "isUnlocked": True,
+        "isUnlocked": true,
         "commonValue": 10,
         "psValue": 10,
-        "psIsUnlocked": False
+        "psIsUnlocked": false
     },
     "MasterFuel_TravelReg1tank": {
         "psValuesArray": ["level_ru_03_01","level_ru_03_02","level_ru_05_01","level_us_11_01","level_ru_08_01","level_us_01_02","level_us_02_01","level_us_02_02_new","level_us_02_04_new","level_us_02_03_new","level_us_01_01","level_us_01_03","level_us_01_04_new","level_ru_02_02","level_ru_02_01_crop","level_ru_02_04","level_ru_02_03"],
         "$type": "PlatformIntWithStringArrayAchievementState",
-        "isUnlocked": True,
+        "isUnlocked": true,
         "commonValue": 3,
         "psValue": 3,
         "commonValuesArray": ["level_ru_03_01","level_ru_03_02","level_ru_05_01","level_us_11_01","level_ru_08_01","level_us_01_02","level_us_02_01","level_us_02_02_new","level_us_02_04_new","level_us_02_03_new","level_us_01_01","level_us_01_03","level_us_01_04_new","level_ru_02_02","level_ru_02_01_crop","level_ru_02_04","level_ru_02_03"],
-        "psIsUnlocked": False
+        "psIsUnlocked": false
     },
     "Goliath_RaiseTrailerWithCrane": {
         "$type": "PlatformtIntAchievementState",
-        "isUnlocked": True,
+        "isUnlocked": true,
         "commonValue": 1,
         "psValue": 1,
-        "psIsUnlocked": False
+        "psIsUnlocked": false
     },
     "WhereAreLogs_VisitEvLogAr": {
         "psValuesArray": [
@@ -21281,7 +21755,7 @@ PRESET_COMPLETED_BLOCKS = {
             "level_ru_02_02 || RU_02_02_LUMBER_MILL","level_ru_02_01_crop || RU_02_01_OLD_LUMBERMILL","level_ru_02_03 || RU_02_03_SAWMILL_2_PICKUP"
         ],
         "$type": "PlatformIntWithStringArrayAchievementState",
-        "isUnlocked": True,
+        "isUnlocked": true,
         "commonValue": 12,
         "psValue": 12,
         "commonValuesArray": [
@@ -21290,26 +21764,26 @@ PRESET_COMPLETED_BLOCKS = {
             "level_us_02_03_new || US_02_03_LOG_STATION_01","level_us_02_02_new || US_02_02_MILL","level_us_02_03_new || US_02_03_MILL",
             "level_ru_02_02 || RU_02_02_LUMBER_MILL","level_ru_02_01_crop || RU_02_01_OLD_LUMBERMILL","level_ru_02_03 || RU_02_03_SAWMILL_2_PICKUP"
         ],
-        "psIsUnlocked": False
+        "psIsUnlocked": false
     },
     "Convoy_BrokenEngine": {
         "$type": "PlatformtIntAchievementState",
-        "isUnlocked": True,
+        "isUnlocked": true,
         "commonValue": 1,
         "psValue": 1,
-        "psIsUnlocked": False
+        "psIsUnlocked": false
     },
     "WesternWind_PacP12": {
         "$type": "PlatformtIntAchievementState",
-        "isUnlocked": True,
+        "isUnlocked": true,
         "commonValue": 10,
         "psValue": 0,
-        "psIsUnlocked": False
+        "psIsUnlocked": false
     },
     "MoreThanTwo_AllUsTrucks": {
         "$type": "IntWithStringArrayAchievementState",
         "currentValue": 23,
-        "isUnlocked": True,
+        "isUnlocked": true,
         "valuesArray": [
             "chevrolet_ck1500","gmc_9500","international_fleetstar_f2070a","chevrolet_kodiakc70","international_scout_800",
             "international_transtar_4070a","pacific_p12w","ws_6900xd_twin","ws_4964_white","international_loadstar_1700",
@@ -21320,7 +21794,7 @@ PRESET_COMPLETED_BLOCKS = {
     "AintNoRest_CompleteAllTaskCont": {
         "$type": "IntWithStringArrayAchievementState",
         "currentValue": 150,
-        "isUnlocked": True,
+        "isUnlocked": true,
         "valuesArray": [
             "US_01_01_KING_OF_HILLS_TSK",
             "US_01_01_DROWNED_TRUCK_02_TSK",
@@ -21477,7 +21951,7 @@ PRESET_COMPLETED_BLOCKS = {
     "VictoryParade_AllRuTrucks": {
         "$type": "IntWithStringArrayAchievementState",
         "currentValue": 18,
-        "isUnlocked": True,
+        "isUnlocked": true,
         "valuesArray": [
             "yar_87","zikz_5368","khan_lo4f","don_71","azov_64131","voron_d53233","kolob_74941","voron_ae4380","azov_5319",
             "tuz_420_tatarin","azov_73210","azov_4220_antarctic","kolob_74760","tayga_6436","tuz_166","voron_grad","step_310e","dan_96320"
@@ -21485,15 +21959,15 @@ PRESET_COMPLETED_BLOCKS = {
     },
     "Farmer_SmashPumpkins": {
         "$type": "PlatformtIntAchievementState",
-        "isUnlocked": True,
+        "isUnlocked": true,
         "commonValue": 500,
         "psValue": 82,
-        "psIsUnlocked": False
+        "psIsUnlocked": false
     },
     "ModelCollector_AllTrucks": {
         "$type": "IntWithStringArrayAchievementState",
         "currentValue": 41,
-        "isUnlocked": True,
+        "isUnlocked": true,
         "valuesArray": [
             "chevrolet_ck1500","gmc_9500","international_fleetstar_f2070a","chevrolet_kodiakc70","international_scout_800","international_transtar_4070a",
             "yar_87","pacific_p12w","zikz_5368","khan_lo4f","don_71","ws_6900xd_twin","ws_4964_white","international_loadstar_1700","international_paystar_5070",
@@ -21503,13 +21977,49 @@ PRESET_COMPLETED_BLOCKS = {
     "OneWithTruck_ComplAllAchiev": {
         "psValuesArray": ["GetOverHere_Winch","YouCanDrive_CompleteTutorial","StepLightly_10Rec","UncleScrooge_100000money","TheBlueHall_WaterDrive","PlayYourWay_2000Dmg","Goliath_RaiseTrailerWithCrane","Gallo24_AddonsPrice","TheDuel_GetLessDmgOnRedScout","WhyProblem_PullVehicleOutWater","Convoy_BrokenEngine","WhatsAMile_MAZ500","Untouch_TaskConWithoutDmg","BeringStraight_StateTruckInGarAlaska","Pedal_TravelFromOneGate","MasterFuel_TravelReg1tank","WorkersUnite_VisitZone","ThroughBlood_ManualLoad"],
         "$type": "PlatformIntWithStringArrayAchievementState",
-        "isUnlocked": True,
+        "isUnlocked": true,
         "commonValue": 37,
         "psValue": 18,
         "commonValuesArray": ["GetOverHere_Winch","YouCanDrive_CompleteTutorial","StepLightly_10Rec","UncleScrooge_100000money","TheBlueHall_WaterDrive","PlayYourWay_2000Dmg","Goliath_RaiseTrailerWithCrane","Gallo24_AddonsPrice","TheDuel_GetLessDmgOnRedScout","WhyProblem_PullVehicleOutWater","Convoy_BrokenEngine","WhatsAMile_MAZ500","Untouch_TaskConWithoutDmg","BeringStraight_StateTruckInGarAlaska","Pedal_TravelFromOneGate","MasterFuel_TravelReg1tank","WorkersUnite_VisitZone","ThroughBlood_ManualLoad","DeerHunt_FindAllUpgMichig","EatSlDR_DeliverOilRigToDrill","DreamsCT_RepairAllPipes","18Wheels_OwnAzov4220Antarctic","TheBlackShuck_TruckDistance","Moosehunt_FindAllUpgAlaska","WesternWind_PacP12","MoreThanTwo_AllUsTrucks","ModelCollector_AllTrucks","VictoryParade_AllRuTrucks","Garages_ExploreAll","BearHunt_FindAllUpgTaymir","FrontierElite_CompleteAllContracts","AintNoRest_CompleteAllTaskCont","WatchPoints_ExploreAll","BrokenHorse_BrokenWheels","Simply_DeliverEveryTypeCargo","WhereAreLogs_VisitEvLogAr","Farmer_SmashPumpkins"],
-        "psIsUnlocked": False
+        "psIsUnlocked": false
     }
-}
+}"""
+
+_PRESET_COMPLETED_BLOCKS_CACHE = None
+
+def _share_preset_value_arrays(blocks):
+    """
+    Intern every preset string (the same truck/region ids repeat across many
+    arrays, and "$type" names across all entries) and let identical
+    ps/common arrays share one list.
+    """
+    intern = sys.intern
+    for entry in blocks.values():
+        if not isinstance(entry, dict):
+            continue
+        for field, value in entry.items():
+            if isinstance(value, str):
+                entry[field] = intern(value)
+            elif isinstance(value, list):
+                value[:] = [intern(v) if isinstance(v, str) else v for v in value]
+        common = entry.get("commonValuesArray")
+        if isinstance(common, list) and entry.get("psValuesArray") == common:
+            entry["psValuesArray"] = common
+    return blocks
+
+def _preset_completed_blocks():
+    """
+    Exact completed achievement blocks, parsed on first use with isUnlocked
+    forced on. The dicts are shared by every save: treat them as read-only.
+    """
+    global _PRESET_COMPLETED_BLOCKS_CACHE
+    if _PRESET_COMPLETED_BLOCKS_CACHE is None:
+        blocks = _share_preset_value_arrays(_json_loads_block(_PRESET_COMPLETED_BLOCKS_JSON))
+        for entry in blocks.values():
+            if isinstance(entry, dict):
+                entry["isUnlocked"] = True
+        _PRESET_COMPLETED_BLOCKS_CACHE = blocks
+    return _PRESET_COMPLETED_BLOCKS_CACHE
 
 
 # TAB: Achievements (launch_gui -> tab_achievements)
@@ -21558,57 +22068,108 @@ def create_achievements_tab(tab, save_path_var, plugin_loaders):
     # internal containers
     ach_vars = {}   # id -> IntVar
     ach_states = {} # id -> state dict
+    ach_checkboxes = []  # grid order; reused across reloads
+    # last read of the CommonSslSave (see _read_achievements_file); Save
+    # reuses it while the file's (mtime_ns, size) stamp is unchanged
+    ssl_cache = {"path": None}
+
+    def _file_stamp(path):
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+
+    def _read_achievements_file(p):
+        """
+        Read achievementStates from p. Usually only that object is decoded,
+        "ach_text" keeps its text and "head"/"tail" hold the file text around
+        it, so a save just splices the new object in. When the key can't be
+        located unambiguously the whole CommonSslSave is parsed instead: "doc"
+        is the parsed document, "ach_parent" the dict holding
+        achievementStates, and head/tail wrap doc.
+        """
+        stamp = _file_stamp(p)
+        with open(p, "r", encoding="utf-8") as f:
+            content = f.read()
+        entry = {"path": p, "stamp": stamp, "doc": None, "ach_parent": None, "ach_text": None}
+        ach_index = _find_unique_key_object_start(content, "achievementStates")
+        if ach_index >= 0:
+            ach, start, end = _decode_json_value_at(content, ach_index)
+            if isinstance(ach, dict):
+                entry.update(ach=ach, ach_text=content[start:end], head=content[:start], tail=content[end:])
+                return entry
+
+        doc, parsed, bs, be = _parse_common_ssl_content(content)
+        if not isinstance(parsed, dict):
+            raise ValueError("CommonSslSave block not found.")
+        ssl_val = parsed.get("SslValue")
+        ach_parent = ssl_val if isinstance(ssl_val, dict) else parsed
+        ach = ach_parent.get("achievementStates") or {}
+        if not isinstance(ach, dict):
+            ach = {}
+        head, tail = (content[:bs], content[be:]) if bs is not None else ("", "")
+        entry.update(ach=ach, head=head, tail=tail, doc=doc, ach_parent=ach_parent)
+        return entry
 
     def _create_checkboxes(ach_dict):
-        # clears previous
-        for w in grid_frame.winfo_children():
-            w.destroy()
+        keys = sorted(ach_dict, key=_achievement_sort_key)
+        states = {}
+        for key in keys:
+            st = ach_dict.get(key, {})
+            states[key] = st if isinstance(st, dict) else {"isUnlocked": bool(st)}
+
+        # same achievements as the current grid (reload after a save or a
+        # re-sync): keep the widgets and only refresh their variables
+        if keys == list(ach_vars):
+            for key in keys:
+                ach_vars[key].set(1 if states[key].get("isUnlocked") else 0)
+            ach_states.clear()
+            ach_states.update(states)
+            return
+
+        # different achievement set: relabel the checkboxes already in the
+        # grid, keeping each achievement's variable when it is still listed,
+        # and only create (or destroy) the difference
+        old_vars = dict(ach_vars)
         ach_vars.clear()
         ach_states.clear()
-
-        keys = sorted(ach_dict.keys(), key=lambda k: ACHIEVEMENT_NAMES.get(k, k).lower())
-        # layout into 3 columns
-        cols = 3
+        checkboxes = []
         for idx, key in enumerate(keys):
-            st = ach_dict.get(key, {})
-            is_unlocked = bool(st.get("isUnlocked")) if isinstance(st, dict) else bool(st)
-            var = tk.IntVar(value=1 if is_unlocked else 0)
-            display = ACHIEVEMENT_NAMES.get(key, key)
-            cb = ttk.Checkbutton(grid_frame, text=display, variable=var)
-            r = idx // cols
-            c = idx % cols
-            cb.grid(row=r, column=c, sticky="w", padx=12, pady=6)
+            value = 1 if states[key].get("isUnlocked") else 0
+            var = old_vars.get(key)
+            if var is None:
+                var = tk.IntVar(value=value)
+            else:
+                var.set(value)
             ach_vars[key] = var
-            ach_states[key] = st if isinstance(st, dict) else {"isUnlocked": is_unlocked}
+            display = ACHIEVEMENT_NAMES.get(key, key)
+            if idx < len(ach_checkboxes):
+                ach_checkboxes[idx].configure(text=display, variable=var)
+            else:
+                checkboxes.append(ttk.Checkbutton(grid_frame, text=display, variable=var))
+        ach_states.update(states)
+        for cb in ach_checkboxes[len(keys):]:
+            cb.destroy()
+        del ach_checkboxes[len(keys):]
+
+        # new checkboxes are created first, then gridded in one pass
+        # (layout into 3 columns)
+        cols = 3
+        for idx, cb in enumerate(checkboxes, start=len(ach_checkboxes)):
+            cb.grid(row=idx // cols, column=idx % cols, sticky="w", padx=12, pady=6)
+        ach_checkboxes.extend(checkboxes)
 
     def load_achievements_from_file(path=None):
         p = path or achievements_path_var.get()
         if not p or not os.path.exists(p):
             return
         try:
-            with open(p, "r", encoding="utf-8") as f:
-                content = f.read()
-            m = re.search(r'"CommonSslSave"\s*:\s*{', content)
-            if not m:
-                # try directly if this file *is* a CommonSslSave JSON dump
-                try:
-                    parsed_direct = json.loads(content)
-                    ssl_val = parsed_direct.get("SslValue") or parsed_direct
-                    ach = ssl_val.get("achievementStates", {})
-                    if isinstance(ach, dict):
-                        _create_checkboxes(ach)
-                        achievements_path_var.set(p)
-                        return
-                except Exception:
-                    pass
+            ssl_cache["path"] = None
+            try:
+                entry = _read_achievements_file(p)
+            except ValueError:
                 return messagebox.showerror("Error", "CommonSslSave block not found in file.")
-            block_str, bs, be = extract_brace_block(content, m.end() - 1)
-            parsed = json.loads(block_str)
-            ssl_value = parsed.get("SslValue") or parsed
-            ach = ssl_value.get("achievementStates", {}) if isinstance(ssl_value, dict) else {}
-            if not isinstance(ach, dict):
-                ach = {}
-            _create_checkboxes(ach)
+            ssl_cache.clear()
+            ssl_cache.update(entry)
+            _create_checkboxes(entry["ach"])
             achievements_path_var.set(p)
         except Exception as e:
             return messagebox.showerror("Error", f"Failed to load achievements:\n{e}")
@@ -21626,7 +22187,7 @@ def create_achievements_tab(tab, save_path_var, plugin_loaders):
     # Save function (writes only achievementStates shallow merge; keeps other parts untouched)
     def save_achievements_to_file():
         """
-        Save: for each checked achievement, write the exact completed block from PRESET_COMPLETED_BLOCKS.
+        Save: for each checked achievement, write the exact completed block from _preset_completed_blocks().
         For checked keys without a preset, preserve original entry if present or use fallback templates.
         Unchecked achievements are left unchanged.
         """
@@ -21639,89 +22200,71 @@ def create_achievements_tab(tab, save_path_var, plugin_loaders):
             except Exception:
                 pass
 
-            with open(p, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            m = re.search(r'"CommonSslSave"\s*:\s*{', content)
-            orig_parsed = None
-            orig_ach = {}
-            bs = be = None
-
-            if m:
-                block_str, bs, be = extract_brace_block(content, m.end() - 1)
+            # a parsed document in the cache is edited in place below, so
+            # drop the cache up front
+            entry = dict(ssl_cache)
+            ssl_cache.clear()
+            ssl_cache["path"] = None
+            if entry.get("path") != p or entry.get("stamp") != _file_stamp(p):
                 try:
-                    orig_parsed = json.loads(block_str)
-                except Exception:
-                    orig_parsed = None
-                if orig_parsed:
-                    ssl_val = orig_parsed.get("SslValue") or orig_parsed
-                    if isinstance(ssl_val, dict):
-                        orig_ach = ssl_val.get("achievementStates", {}) or {}
-                    else:
-                        orig_ach = {}
-            else:
-                # attempt direct SslValue JSON
-                try:
-                    parsed_direct = json.loads(content)
-                    ssl_val = parsed_direct.get("SslValue") or parsed_direct
-                    orig_ach = (ssl_val.get("achievementStates") if isinstance(ssl_val, dict) else {}) or {}
-                    bs = be = None
-                    orig_parsed = parsed_direct
-                except Exception:
+                    entry = _read_achievements_file(p)
+                except ValueError:
                     return messagebox.showerror("Error", "CommonSslSave block not found; cannot save.")
+            orig_ach = entry["ach"]
+
+            # Collect only the entries that change; unchecked achievements and
+            # ones already in the target state are left as they are
+            preset_blocks = _preset_completed_blocks()
+
+            # read every checkbox in one Tcl round trip; unchecked keys are not modified
+            checked_keys = _collect_checked_values(ach_vars.items())
+
+            # Split the checked keys once with set operations:
+            # - exact completed block from the presets (isUnlocked already forced on)
+            # - else the original entry with isUnlocked toggled on, other fields kept
+            # - otherwise a fallback shape (use previous heuristics)
+            checked = set(checked_keys)
+            preset_keys = checked & preset_blocks.keys()
+            orig_keys = {
+                key for key in (checked - preset_keys) & orig_ach.keys()
+                if isinstance(orig_ach[key], dict)
+            }
+            new_values = {key: preset_blocks[key] for key in preset_keys}
+            for key in orig_keys:
+                new_values[key] = dict(orig_ach[key], isUnlocked=True)
+            for key in checked - preset_keys - orig_keys:
+                new_values[key] = build_fallback_for_key_local(key, True)
+
+            # keep UI order so keys new to the file are appended predictably
+            changes = {
+                key: new_values[key] for key in checked_keys
+                if key not in orig_ach or orig_ach[key] != new_values[key]
+            }
 
-            # Build new_ach starting from original so unchecked achievements are preserved
-            new_ach = dict(orig_ach)
-
-            # iterate UI keys and for those checked, replace with exact completed block if available
-            for key, var in ach_vars.items():
-                try:
-                    checked = bool(var.get())
-                except Exception:
-                    checked = False
-                if not checked:
-                    # don't modify if unchecked
-                    continue
-
-                # if preset exact completed block exists, use it (ensure isUnlocked true)
-                if key in PRESET_COMPLETED_BLOCKS:
-                    block = dict(PRESET_COMPLETED_BLOCKS[key])
-                    # force isUnlocked True in case preset missed it
-                    block["isUnlocked"] = True
-                    new_ach[key] = block
-                    continue
-
-                # else if original entry exists, toggle its isUnlocked True and keep other fields
-                if key in orig_ach and isinstance(orig_ach[key], dict):
-                    base = dict(orig_ach[key])
-                    base["isUnlocked"] = True
-                    new_ach[key] = base
-                    continue
-
-                # otherwise, build a fallback shape (use previous heuristics)
-                fallback = build_fallback_for_key_local(key, True)
-                new_ach[key] = fallback
-
-            # Put new_ach into orig_parsed and write back
-            if orig_parsed is None:
-                out_block = {"SslType": "CommonSaveObject", "SslValue": {"achievementStates": new_ach}}
-                new_block_str = json.dumps(out_block, separators=(",", ":"))
-                _write_text_file_atomic(p, new_block_str, encoding="utf-8")
-                show_info("Saved", "Achievements saved to file (rewrote file).")
-                return
-
-            parsed_to_write = dict(orig_parsed)
-            if "SslValue" in parsed_to_write and isinstance(parsed_to_write["SslValue"], dict):
-                parsed_to_write["SslValue"]["achievementStates"] = new_ach
-            else:
-                parsed_to_write["achievementStates"] = new_ach
-
-            new_block_str = json.dumps(parsed_to_write, separators=(",", ":"))
-            if bs is not None and be is not None:
-                new_content = content[:bs] + new_block_str + content[be:]
-                _write_text_file_atomic(p, new_content, encoding="utf-8")
+            # Rewrite just the changed entries inside the achievementStates
+            # text when they can all be located; otherwise re-encode the
+            # object (or the whole document when that had to be parsed).
+            # The untouched text around it is written as separate pieces
+            # rather than joining a second full-size copy of the file.
+            edits = None
+            if entry["ach_text"] is not None and all(isinstance(orig_ach.get(key), dict) for key in changes):
+                ach_text = entry["ach_text"]
+                edits = _changed_map_block_edits(
+                    ach_text, 0, len(ach_text), {key: orig_ach[key] for key in changes}, changes
+                )
+            orig_ach.update(changes)
+            if edits is not None:
+                new_block_str = "".join(_iter_spliced_text(entry["ach_text"], edits))
+            elif entry["doc"] is not None:
+                entry["ach_parent"]["achievementStates"] = orig_ach
+                new_block_str = _json_dumps_compact(entry["doc"])
             else:
-                _write_text_file_atomic(p, new_block_str, encoding="utf-8")
+                new_block_str = _json_dumps_compact(orig_ach)
+            _write_text_chunks_atomic(p, (entry["head"], new_block_str, entry["tail"]), encoding="utf-8")
+            if entry["doc"] is None:
+                entry["ach_text"] = new_block_str
+            entry["stamp"] = _file_stamp(p)
+            ssl_cache.update(entry)
 
             try:
                 cfg = load_config() or {}
@@ -21771,17 +22314,19 @@ def create_achievements_tab(tab, save_path_var, plugin_loaders):
     return
 
 
+PROS_URL = "https://prismray.io/games/snowrunner"
+# (label, givenProsEntitlements id)
+PROS_ENTITLEMENTS = (
+    ("Mammoth Ornament & Stickers", "ProsRegistrationReward"),
+    ("An exclusive Voron-AE4380 skin and three unique stickers", "ProsRoadcraftReward"),
+)
+
 # TAB: PROS (launch_gui -> tab_pros)
 def create_pros_tab(tab, save_path_var, plugin_loaders):
     """
     PROS tab — manages givenProsEntitlements in CommonSslSave.
     Auto-detects CommonSslSave in the same folder as the main save.
     """
-    PROS_URL = "https://prismray.io/games/snowrunner"
-    PROS_ENTITLEMENTS = [
-        ("Mammoth Ornament & Stickers", "ProsRegistrationReward"),
-        ("An exclusive Voron-AE4380 skin and three unique stickers", "ProsRoadcraftReward"),
-    ]
 
     pros_path_var = tk.StringVar()
     try:
@@ -21854,21 +22399,6 @@ def create_pros_tab(tab, save_path_var, plugin_loaders):
         pros_vars[key] = var
 
     # --- helpers ---
-    def _parse_common_ssl(content):
-        """
-        Returns (parsed_obj, block_start, block_end) where block_start/end are
-        only set if CommonSslSave block is found. parsed_obj is the parsed JSON
-        for the CommonSslSave block or the whole file.
-        """
-        m = re.search(r'"CommonSslSave"\s*:\s*{', content)
-        if m:
-            block_str, bs, be = extract_brace_block(content, m.end() - 1)
-            parsed = json.loads(block_str)
-            return parsed, bs, be
-        # fallback: try direct JSON
-        parsed = json.loads(content)
-        return parsed, None, None
-
     def _get_entitlements_from_parsed(parsed_obj):
         if isinstance(parsed_obj, dict) and isinstance(parsed_obj.get("SslValue"), dict):
             return parsed_obj["SslValue"].get("givenProsEntitlements", [])
@@ -21889,7 +22419,7 @@ def create_pros_tab(tab, save_path_var, plugin_loaders):
         try:
             with open(p, "r", encoding="utf-8") as f:
                 content = f.read()
-            parsed, _, _ = _parse_common_ssl(content)
+            _doc, parsed, _, _ = _parse_common_ssl_content(content)
             ent = _get_entitlements_from_parsed(parsed)
             if not isinstance(ent, list):
                 ent = []
@@ -21901,7 +22431,7 @@ def create_pros_tab(tab, save_path_var, plugin_loaders):
 
     def save_pros():
         path = pros_path_var.get()
-        if not path or not os.path.exists(path):
+        if not path or not _path_exists_cached(path):
             return messagebox.showerror("Error", "CommonSslSave file not found.")
         try:
             try:
@@ -21913,29 +22443,38 @@ def create_pros_tab(tab, save_path_var, plugin_loaders):
             with open(path, "r", encoding="utf-8") as f:
                 content = f.read()
 
-            parsed, bs, be = _parse_common_ssl(content)
-            ent = _get_entitlements_from_parsed(parsed)
+            # Usually only the givenProsEntitlements array is decoded and
+            # spliced back; the whole CommonSslSave is parsed only when that
+            # array can't be located unambiguously
+            ent_index = _find_unique_key_object_start(content, "givenProsEntitlements", opener="[")
+            if ent_index >= 0:
+                doc = None
+                ent, ent_start, ent_end = _decode_json_value_at(content, ent_index)
+            else:
+                doc, parsed, bs, be = _parse_common_ssl_content(content)
+                ent = _get_entitlements_from_parsed(parsed)
             if not isinstance(ent, list):
                 ent = []
 
-            # Update entries (preserve any other entitlements)
-            for _, key in PROS_ENTITLEMENTS:
-                checked = bool(pros_vars[key].get())
-                if checked:
-                    if key not in ent:
-                        ent.append(key)
-                else:
-                    ent = [x for x in ent if x != key]
-
-            _set_entitlements_on_parsed(parsed, ent)
+            # Update entries (preserve any other entitlements and their order):
+            # drop every unchecked key in one pass, then append missing checked ones
+            checked = {key for _, key in PROS_ENTITLEMENTS if pros_vars[key].get()}
+            unchecked = {key for _, key in PROS_ENTITLEMENTS if key not in checked}
+            ent = [x for x in ent if not isinstance(x, str) or x not in unchecked]
+            present = {x for x in ent if isinstance(x, str)}
+            ent.extend(key for _, key in PROS_ENTITLEMENTS if key in checked and key not in present)
 
-            new_block_str = json.dumps(parsed, separators=(",", ":"))
-            if bs is not None and be is not None:
-                new_content = content[:bs] + new_block_str + content[be:]
+            if doc is None:
+                chunks = (content[:ent_start], _json_dumps_compact(ent), content[ent_end:])
             else:
-                new_content = new_block_str
+                _set_entitlements_on_parsed(parsed, ent)
+                new_block_str = _json_dumps_compact(doc)
+                if bs is not None and be is not None:
+                    chunks = (content[:bs], new_block_str, content[be:])
+                else:
+                    chunks = (new_block_str,)
 
-            _write_text_file_atomic(path, new_content, encoding="utf-8")
+            _write_text_chunks_atomic(path, chunks, encoding="utf-8")
 
             _save_common_ssl_path_to_config(path)
 
@@ -21979,24 +22518,29 @@ def create_pros_tab(tab, save_path_var, plugin_loaders):
     return
 
 
+_FINISHED_TRIALS_RE = re.compile(r'"finishedTrials"\s*:\s*\[', re.ASCII)
+
+# (display name, finishedTrials code)
+TRIALS_LIST = (
+    ("Ride-on King", "TRIAL_01_01_SCOUTING_CNT"),
+    ("Lost in wilderness", "TRIAL_01_02_TRUCK_TSK"),
+    ("Snowbound Valley", "TRIAL_02_01_DELIVERING"),
+    ("Zalukodes", "TRIAL_02_02_SEARCH_CNT"),
+    ("Northern Thread", "TRIAL_03_01_SCOUTING_CNT"),
+    ("Wolves' Bog", "TRIAL_03_03_SCOUTING_CNT"),
+    ("The Slope", "TRIAL_04_02_TSK"),
+    ("Escape from Tretyakov", "TRIAL_04_01_SCOUTING_CNT"),
+    ("Aftermath", "TRIAL_05_01_TSK"),
+    ("Tumannaya Pass", "TRIAL_03_02_DELIVERY_CNT"),
+)
+_TRIALS_CODES = tuple(code for _, code in TRIALS_LIST)
+
 # TAB: Trials (launch_gui -> tab_trials)
 def create_trials_tab(tab, save_path_var, plugin_loaders):
     """
     Trials tab — no scrollbar, checkbox block uses available vertical space and is
     horizontally centered. Checkbox labels remain left-aligned inside the block.
     """
-    TRIALS_LIST = [
-        ("Ride-on King", "TRIAL_01_01_SCOUTING_CNT"),
-        ("Lost in wilderness", "TRIAL_01_02_TRUCK_TSK"),
-        ("Snowbound Valley", "TRIAL_02_01_DELIVERING"),
-        ("Zalukodes", "TRIAL_02_02_SEARCH_CNT"),
-        ("Northern Thread", "TRIAL_03_01_SCOUTING_CNT"),
-        ("Wolves' Bog", "TRIAL_03_03_SCOUTING_CNT"),
-        ("The Slope", "TRIAL_04_02_TSK"),
-        ("Escape from Tretyakov", "TRIAL_04_01_SCOUTING_CNT"),
-        ("Aftermath", "TRIAL_05_01_TSK"),
-        ("Tumannaya Pass", "TRIAL_03_02_DELIVERY_CNT"),
-    ]
 
     trials_path_var = tk.StringVar()
     try:
@@ -22064,10 +22608,24 @@ def create_trials_tab(tab, save_path_var, plugin_loaders):
         # place it horizontally centered; vertically align it to the top of the container to keep spacing natural
         content.place_configure(relx=0.5, rely=0.0, anchor="n")
 
-        # final layout pass
-        tab.update_idletasks()
+    # <Configure> fires for every step of a window drag; re-center once the
+    # resize settles instead of on each event
+    _place_center_job = {"id": None}
+    def _schedule_place_center(_event=None):
+        try:
+            if _place_center_job.get("id") is not None:
+                tab.after_cancel(_place_center_job["id"])
+        except Exception:
+            pass
+        try:
+            _place_center_job["id"] = tab.after(
+                50,
+                lambda: (_place_center_job.__setitem__("id", None), _place_center()),
+            )
+        except Exception:
+            _place_center()
 
-    body_outer.bind("<Configure>", _place_center)
+    body_outer.bind("<Configure>", _schedule_place_center)
 
     # increase font size slightly for readability (unchanged)
     try:
@@ -22095,59 +22653,109 @@ def create_trials_tab(tab, save_path_var, plugin_loaders):
 
 
     # --- helpers to parse/write finishedTrials (unchanged) ---
+    def _find_finished_trials_start(text):
+        # index of the '[' opening finishedTrials, or -1
+        if '"finishedTrials"' not in text:
+            return -1
+        return _find_key_object_start(text, "finishedTrials", _FINISHED_TRIALS_RE, opener="[")
+
     def _parse_finished_trials_from_text(text):
-        m = re.search(r'"finishedTrials"\s*:\s*(\[[^\]]*\])', text, flags=re.DOTALL)
-        if not m:
-            return []
+        """Return (finishedTrials list, (start, end) span of the array or None)."""
+        arr_index = _find_finished_trials_start(text)
+        if arr_index < 0:
+            return [], None
         try:
-            arr = json.loads(m.group(1))
+            arr, start, end = _decode_json_value_at(text, arr_index)
             if isinstance(arr, list):
-                return arr
+                return arr, (start, end)
         except Exception:
             pass
-        return []
+        return [], None
 
-    def _write_finished_trials_into_text(text, finished_list):
+    def _finished_trials_text_chunks(text, finished_list, span=None):
+        """Pieces of text with finishedTrials replaced (or inserted), for a chunked write.
+
+        span is the array's (start, end) from the last parse of the same text;
+        without it the array is located again.
+        """
         arr_text = json.dumps(finished_list)
-        if re.search(r'"finishedTrials"\s*:\s*\[', text, flags=re.DOTALL):
-            return re.sub(r'"finishedTrials"\s*:\s*\[[^\]]*\]', f'"finishedTrials":{arr_text}', text, flags=re.DOTALL)
+        if span is None:
+            # locate the array once and scan to its closing bracket (strings
+            # aware), then splice; no regex substitution pass over the file
+            arr_index = _find_finished_trials_start(text)
+            if arr_index >= 0:
+                _, start, end = extract_bracket_block(text, arr_index)
+                span = (start, end)
+        if span is not None:
+            start, end = span
+            return (text[:start], arr_text, text[end:])
         idx = text.find("{")
         if idx != -1:
             insert_pos = idx + 1
-            return text[:insert_pos] + f'\n"finishedTrials":{arr_text},' + text[insert_pos:]
-        return text + f'\n"finishedTrials":{arr_text}\n'
+            return (text[:insert_pos], f'\n"finishedTrials":{arr_text},', text[insert_pos:])
+        return (text, f'\n"finishedTrials":{arr_text}\n')
+
+    # finishedTrials as last read, with the file's (mtime_ns, size) stamp,
+    # its text and the array span; lets Save skip the rewrite when nothing
+    # would change and splice without re-reading or re-scanning the file
+    loaded_trials = {"path": None, "stamp": None, "finished": None, "text": None, "span": None}
+
+    def _trials_file_stamp(path):
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
 
     def load_trials_file(path):
-        if not path or not os.path.exists(path):
+        if not path or not _path_exists_cached(path):
             return
         try:
+            loaded_trials["path"] = None
+            stamp = _trials_file_stamp(path)
             with open(path, "r", encoding="utf-8") as f:
                 content = f.read()
-            finished = _parse_finished_trials_from_text(content)
-            for _, code in TRIALS_LIST:
-                trial_vars[code].set(1 if code in finished else 0)
+            finished, span = _parse_finished_trials_from_text(content)
+            loaded_trials.update(path=path, stamp=stamp, finished=list(finished), text=content, span=span)
+            finished_codes = frozenset(code for code in finished if isinstance(code, str))
+            for code in _TRIALS_CODES:
+                trial_vars[code].set(1 if code in finished_codes else 0)
             _save_common_ssl_path_to_config(path)
-            # re-layout to adapt center size
-            tab.update_idletasks()
-            _place_center()
+            # re-layout to adapt center size; debounced so the save-path trace
+            # and the plugin loader firing together only lay out once
+            _schedule_place_center()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to read CommonSslSave:\n{e}")
 
     def save_trials():
         path = trials_path_var.get()
-        if not path or not os.path.exists(path):
+        if not path or not _path_exists_cached(path):
             return messagebox.showerror("Error", "CommonSslSave file not found.")
-        finished = [code for _, code in TRIALS_LIST if trial_vars[code].get()]
+        finished = [code for code in _TRIALS_CODES if trial_vars[code].get()]
         try:
+            fresh = loaded_trials["path"] == path and loaded_trials["stamp"] == _trials_file_stamp(path)
+            if fresh and loaded_trials["finished"] == finished:
+                return show_info("Saved", "No changes to save.")
             try:
                 if "make_backup_if_enabled" in globals() and callable(globals()["make_backup_if_enabled"]):
                     make_backup_if_enabled(path)
             except Exception:
                 print("[Warning] backup failed while saving trials")
-            with open(path, "r", encoding="utf-8") as f:
-                text = f.read()
-            new_text = _write_finished_trials_into_text(text, finished)
-            _write_text_file_atomic(path, new_text, encoding="utf-8")
+            if fresh and loaded_trials["text"] is not None:
+                text, span = loaded_trials["text"], loaded_trials["span"]
+            else:
+                with open(path, "r", encoding="utf-8") as f:
+                    text = f.read()
+                span = None
+            chunks = _finished_trials_text_chunks(text, finished, span)
+            _write_text_chunks_atomic(path, chunks, encoding="utf-8")
+            new_span = None
+            if len(chunks) == 3 and chunks[1].startswith("["):
+                new_span = (len(chunks[0]), len(chunks[0]) + len(chunks[1]))
+            loaded_trials.update(
+                path=path,
+                stamp=_trials_file_stamp(path),
+                finished=list(finished),
+                text="".join(chunks),
+                span=new_span,
+            )
             _save_common_ssl_path_to_config(path)
             show_info("Saved", "Trials saved successfully.")
         except Exception as e:
@@ -22194,16 +22802,38 @@ def create_upgrades_tab(tab, save_path_var):
 
     def on_apply():
         path = save_path_var.get()
-        if not os.path.exists(path):
+        if not _path_exists_cached(path):
             messagebox.showerror("Error", "Save file not found.")
             return
         selected_regions = _collect_selected_regions(season_vars, map_vars, other_season_var)
         if not selected_regions:
             show_info("Info", "No seasons or maps selected.")
             return
-        find_and_modify_upgrades(path, selected_regions)
+        # backup reads Tk settings, so it stays on the UI thread; the file
+        # read/parse/write runs in a worker (see _run_in_worker)
+        make_backup_if_enabled(path)
+        apply_button.state(["disabled"])
 
-    ttk.Button(tab, text="Unlock Upgrades", command=on_apply).pack(pady=(10, 5))
+        def _finish(result):
+            try:
+                apply_button.state(["!disabled"])
+            except Exception:
+                pass
+            if isinstance(result, Exception):
+                result = {"ok": False, "title": "Error", "message": str(result)}
+            if result.get("ok"):
+                show_info(result.get("title") or "Success", result.get("message", ""))
+            else:
+                messagebox.showerror(result.get("title") or "Error", result.get("message", ""))
+
+        _run_in_worker(
+            tab,
+            lambda: find_and_modify_upgrades(path, selected_regions, notify=False, make_backup=False),
+            _finish,
+        )
+
+    apply_button = ttk.Button(tab, text="Unlock Upgrades", command=on_apply)
+    apply_button.pack(pady=(10, 5))
     _add_check_all_checkbox(tab, all_check_vars)
 
     ttk.Label(tab, text="At least one upgrade must be marked or collected in-game for this to work.",
@@ -22243,6 +22873,48 @@ GAME_STAT_FIELD_ORDER = [
 ]
 
 
+_GAME_STAT_PLURAL_NAMES = {
+    "Truck Sold": "Trucks Sold",
+    "Truck Bought": "Trucks Bought",
+    "Trailer Sold": "Trailers Sold",
+    "Trailer Bought": "Trailers Bought",
+    "Addon Sold": "Addons Sold",
+    "Addon Bought": "Addons Bought",
+}
+# raw stat key -> display name; stat keys come from a small fixed vocabulary
+_GAME_STAT_NICE_NAME_CACHE = {}
+
+def _game_stat_nice_name(raw_key: str) -> str:
+    """Turn MONEY_SPENT → Money Spent and fix plural forms"""
+    name = _GAME_STAT_NICE_NAME_CACHE.get(raw_key)
+    if name is None:
+        name = GAME_STAT_LABEL_OVERRIDES.get(str(raw_key or "").strip().upper())
+        if not name:
+            name = raw_key.replace("_", " ").title()
+            name = _GAME_STAT_PLURAL_NAMES.get(name, name)
+        _GAME_STAT_NICE_NAME_CACHE[raw_key] = name
+    return name
+
+def _coerce_stat_entry(text: str):
+    """Entry text -> int, else float, else the text unchanged (as int()/float() would take it)."""
+    t = text.strip()
+    digits = t[1:] if t[:1] in "+-" else t
+    # plain integers are the usual case; skip the int()/float() ValueError chain
+    if digits.isdecimal():
+        return int(t)
+    if "_" in t:
+        try:
+            return int(t)
+        except ValueError:
+            pass
+    try:
+        return float(t)
+    except ValueError:
+        return text
+
+_GAME_STAT_RE = re.compile(r'"gameStat"\s*:\s*{')
+_DISTANCE_RE = re.compile(r'"distance"\s*:\s*{')
+
 # TAB: Game Stats (launch_gui -> tab_stats)
 def create_game_stats_tab(tab, save_path_var, plugin_loaders):
 
@@ -22251,22 +22923,10 @@ def create_game_stats_tab(tab, save_path_var, plugin_loaders):
 
     # Full mapping for region codes -> full names (uppercase keys)
     REGION_ORDER = list(REGION_LONG_NAME_MAP.keys())
+    # keys that mark a "distance" object as the per-region odometer
+    DISTANCE_REGION_KEYS = frozenset(REGION_ORDER) | {"TRIALS"}
 
-    def nice_name(raw_key: str) -> str:
-        """Turn MONEY_SPENT → Money Spent and fix plural forms"""
-        override = GAME_STAT_LABEL_OVERRIDES.get(str(raw_key or "").strip().upper())
-        if override:
-            return override
-        name = raw_key.replace("_", " ").title()
-        replacements = {
-            "Truck Sold": "Trucks Sold",
-            "Truck Bought": "Trucks Bought",
-            "Trailer Sold": "Trailers Sold",
-            "Trailer Bought": "Trailers Bought",
-            "Addon Sold": "Addons Sold",
-            "Addon Bought": "Addons Bought",
-        }
-        return replacements.get(name, name)
+    nice_name = _game_stat_nice_name
 
     def _ordered_distance_entries(parsed: Dict[str, Any]) -> List[Tuple[str, Any]]:
         data = parsed if isinstance(parsed, dict) else {}
@@ -22306,25 +22966,56 @@ def create_game_stats_tab(tab, save_path_var, plugin_loaders):
         extras.sort(key=lambda item: nice_name(item[0]).lower())
         return entries + extras
 
+    def _iter_distance_block_starts(content):
+        # '{' of each "distance":{ candidate; compact saves match the literal,
+        # the whitespace-tolerant pattern only runs when it never occurs
+        needle = '"distance":{'
+        idx = content.find(needle)
+        if idx < 0:
+            for m in _DISTANCE_RE.finditer(content):
+                yield m.end() - 1
+            return
+        while idx >= 0:
+            yield idx + len(needle) - 1
+            idx = content.find(needle, idx + len(needle))
+
     # Find best distance block
     def _find_best_distance_block(content):
-        matches = list(re.finditer(r'"distance"\s*:\s*{', content))
-        if not matches:
-            return None
+        # candidates are decoded lazily, in one pass each; a block that
+        # already holds every region key can't be beaten, so stop there
         best = None
         best_count = -1
-        for m in matches:
+        for brace_index in _iter_distance_block_starts(content):
             try:
-                block, bstart, bend = extract_brace_block(content, m.end() - 1)
-                parsed = json.loads(block)
-                cnt = sum(1 for k in parsed.keys() if str(k).upper() in REGION_ORDER or str(k).upper() == "TRIALS")
+                parsed, bstart, bend = _decode_json_value_at(content, brace_index)
+                cnt = sum(1 for k in parsed.keys() if str(k).upper() in DISTANCE_REGION_KEYS)
                 if cnt > best_count:
                     best_count = cnt
                     best = (parsed, bstart, bend)
+                    if cnt >= len(DISTANCE_REGION_KEYS):
+                        break
             except Exception:
                 continue
         return best
 
+    def _find_game_stat_block(content):
+        # (parsed gameStat, start, end) or None
+        brace_index = _find_key_object_start(content, "gameStat", _GAME_STAT_RE)
+        if brace_index < 0:
+            return None
+        block, start, end = extract_brace_block(content, brace_index)
+        return _json_loads_block(block), start, end
+
+    # text and blocks found by the last refresh_ui (or written by save_all),
+    # with the file's (mtime_ns, size) stamp; reused while the file is
+    # unchanged. content is None after a save: the spans are still valid,
+    # only the text has to be read again before the next splice
+    parsed_save = {"path": None, "stamp": None, "content": None, "stat": None, "distance": None}
+
+    def _stats_file_stamp(path):
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+
     # === UI setup ===
     outer_frame = ttk.Frame(tab)
     outer_frame.pack(fill="both", expand=True, pady=20)
@@ -22337,36 +23028,61 @@ def create_game_stats_tab(tab, save_path_var, plugin_loaders):
     for idx in range(5):
         center_frame.grid_columnconfigure(idx, weight=0, pad=10)
 
-    # === Refresh function ===
-    def refresh_ui(path):
+    # (distance keys, stat keys) of the rows currently built
+    shown_layout = {"key": None}
+
+    def _clear_rows():
         for child in center_frame.winfo_children():
             child.destroy()
         stats_vars.clear()
         distance_vars.clear()
+        shown_layout["key"] = None
 
-        if not os.path.exists(path):
+    # === Refresh function ===
+    def refresh_ui(path, content=None):
+        if not _path_exists_cached(path):
+            _clear_rows()
             return
 
-        with open(path, "r", encoding="utf-8") as f:
-            content = f.read()
+        stamp = _stats_file_stamp(path)
+        if parsed_save["path"] == path and parsed_save["stamp"] == stamp:
+            stat_found = parsed_save["stat"]
+            found = parsed_save["distance"]
+        else:
+            parsed_save["path"] = None
+            if content is None:
+                with open(path, "r", encoding="utf-8") as f:
+                    content = f.read()
+            # parse gameStat and distance
+            stat_found = _find_game_stat_block(content)
+            found = _find_best_distance_block(content)
+            parsed_save.update(path=path, stamp=stamp, content=content, stat=stat_found, distance=found)
+        game_stat = stat_found[0] if stat_found else {}
+        distance_parsed = found[0] if found else {}
 
-        # parse gameStat
-        game_stat = {}
-        m_stat = re.search(r'"gameStat"\s*:\s*{', content)
-        if m_stat:
-            block, _, _ = extract_brace_block(content, m_stat.end() - 1)
-            game_stat = json.loads(block)
+        dist_items = _ordered_distance_entries(distance_parsed)
+        stat_items = _ordered_stat_entries(game_stat)
 
-        # parse distance
-        found = _find_best_distance_block(content)
-        distance_parsed = found[0] if found else {}
+        # same rows as already shown (e.g. the refresh after Save All):
+        # keep the widgets and only update the entry values
+        layout_key = (tuple(k for k, _ in dist_items), tuple(k for k, _ in stat_items))
+        if layout_key == shown_layout["key"]:
+            for region, value in dist_items:
+                distance_vars[region].set(str(value))
+            for key, value in stat_items:
+                stats_vars[key].set(str(value))
+            return
+
+        # rebuild with the frame unmapped so Tk lays it out once when it is
+        # packed again, not after every row
+        center_frame.pack_forget()
+        _clear_rows()
 
         # headers
         ttk.Label(center_frame, text="Distance Driven", font=("TkDefaultFont", 12, "bold")).grid(row=0, column=0, columnspan=2, pady=(0, 15), sticky="w")
         ttk.Label(center_frame, text="Game Statistics", font=("TkDefaultFont", 12, "bold")).grid(row=0, column=3, columnspan=2, pady=(0, 15), sticky="w")
 
         # distance rows
-        dist_items = _ordered_distance_entries(distance_parsed)
         for i, (region, value) in enumerate(dist_items, start=1):
             region_up = str(region).upper()
             label_text = REGION_LONG_NAME_MAP.get(region_up, region)
@@ -22376,7 +23092,6 @@ def create_game_stats_tab(tab, save_path_var, plugin_loaders):
             ttk.Entry(center_frame, textvariable=var, width=12).grid(row=i, column=1, sticky="w", pady=2)
 
         # stats rows
-        stat_items = _ordered_stat_entries(game_stat)
         for j, (key, value) in enumerate(stat_items, start=1):
             ttk.Label(center_frame, text=nice_name(key) + ":", anchor="w", justify="left").grid(row=j, column=3, sticky="w", padx=(0, 6), pady=3)
             var = tk.StringVar(value=str(value))
@@ -22391,10 +23106,12 @@ def create_game_stats_tab(tab, save_path_var, plugin_loaders):
             _editor_apply_language_to_widget_tree(center_frame)
         except Exception:
             pass
+        center_frame.pack(anchor="center")
+        shown_layout["key"] = layout_key
 
     def save_all():
         path = save_path_var.get()
-        if not os.path.exists(path):
+        if not _path_exists_cached(path):
             return messagebox.showerror("Error", "Save file not found.")
 
         # Make a backup first (use the central, existing function)
@@ -22413,79 +23130,102 @@ def create_game_stats_tab(tab, save_path_var, plugin_loaders):
         except Exception as e:
             print(f"[Backup] Exception while attempting backup: {e}")
 
-        # read file
-        with open(path, "r", encoding="utf-8") as f:
-            content = f.read()
+        # reuse what the last refresh found if the file hasn't changed since,
+        # otherwise read and locate both blocks again
+        if parsed_save["path"] == path and parsed_save["stamp"] == _stats_file_stamp(path):
+            content = parsed_save["content"]
+            if content is None:
+                with open(path, "r", encoding="utf-8") as f:
+                    content = f.read()
+            stat_found = parsed_save["stat"]
+            found = parsed_save["distance"]
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                content = f.read()
+            stat_found = _find_game_stat_block(content)
+            found = _find_best_distance_block(content)
+
+        # both blocks are located in the original text and spliced in a
+        # single pass while writing, instead of rebuilding the file per block
+        edits = []
+        new_stat = new_distance = None
+        parsed_save["path"] = None
 
         # update gameStat
-        m_stat = re.search(r'"gameStat"\s*:\s*{', content)
-        if m_stat:
-            block, start, end = extract_brace_block(content, m_stat.end() - 1)
-            data = json.loads(block)
+        if stat_found:
+            data, start, end = stat_found
+            data = dict(data)
             for key, var in stats_vars.items():
-                try:
-                    data[key] = int(var.get())
-                except ValueError:
-                    try:
-                        data[key] = float(var.get())
-                    except ValueError:
-                        data[key] = var.get()
-            new_block = json.dumps(data, separators=(",", ":"))
-            content = content[:start] + new_block + content[end:]
+                data[key] = _coerce_stat_entry(var.get())
+            stat_edit = (start, end, _json_dumps_compact(data))
+            edits.append(stat_edit)
+            new_stat = data
 
         # update distance
-        found = _find_best_distance_block(content)
+        if found and edits and found[1] < edits[0][1] and edits[0][0] < found[2]:
+            # distance block sits inside gameStat: apply that edit first and
+            # look it up again in the updated text
+            content = "".join(_iter_spliced_text(content, edits))
+            edits = []
+            new_stat = None
+            found = _find_best_distance_block(content)
         if found:
             dist_data, dstart, dend = found
+            dist_data = dict(dist_data)
             for key, var in distance_vars.items():
-                try:
-                    dist_data[key] = int(var.get())
-                except ValueError:
-                    try:
-                        dist_data[key] = float(var.get())
-                    except ValueError:
-                        dist_data[key] = var.get()
-            new_block = json.dumps(dist_data, separators=(",", ":"))
-            content = content[:dstart] + new_block + content[dend:]
+                dist_data[key] = _coerce_stat_entry(var.get())
+            dist_edit = (dstart, dend, _json_dumps_compact(dist_data))
+            edits.append(dist_edit)
+            new_distance = dist_data
 
         # write back
-        _write_text_file_atomic(path, content, encoding="utf-8")
+        _write_text_chunks_atomic(path, _iter_spliced_text(content, edits), encoding="utf-8")
+
+        # remember the written blocks and where they now sit, so the refresh
+        # below (and the next save) need not read and parse them again;
+        # skipped when a nested distance block made the gameStat span stale
+        if new_stat is not None or not stat_found:
+            def _written(block, edit):
+                start, _, replacement = edit
+                start += sum(len(r) - (e - s) for s, e, r in edits if s < start)
+                return block, start, start + len(replacement)
+
+            parsed_save.update(
+                path=path,
+                stamp=_stats_file_stamp(path),
+                content=None,
+                stat=_written(new_stat, stat_edit) if new_stat is not None else None,
+                distance=_written(new_distance, dist_edit) if new_distance is not None else None,
+            )
 
         show_info("Success", "Stats and distances updated.")
         refresh_ui(path)
 
     # loader hook
+    refresh_ui.accepts_content = True
     plugin_loaders.append(refresh_ui)
 
     if os.path.exists(save_path_var.get()):
         refresh_ui(save_path_var.get())
-# TAB: Watchtowers (launch_gui -> tab_watchtowers)
-def create_watchtowers_tab(tab, save_path_var):
-    seasons = [(label, code) for _, (code, label) in SEASON_ENTRIES]
-    maps = [(name, code) for code, name in BASE_MAPS]
-    selector = _build_region_selector(tab, seasons, maps)
-    season_vars = selector["season_vars"]
-    map_vars = selector["map_vars"]
-    all_check_vars = selector["all_check_vars"]
-    other_season_var = selector["other_var"]
 
-    def on_apply():
-        path = save_path_var.get()
-        if not os.path.exists(path):
-            return messagebox.showerror("Error", "Save file not found.")
-        selected_regions = _collect_selected_regions(season_vars, map_vars, other_season_var)
-        if not selected_regions:
-            return show_info("Info", "No seasons or maps selected.")
-        unlock_watchtowers(path, selected_regions)
 
-    ttk.Button(tab, text="Unlock Watchtowers", command=on_apply).pack(pady=(10, 5))
-    _add_check_all_checkbox(tab, all_check_vars)
-    ttk.Label(tab, text="It will mark them as found but wont reveal the map use the Fog Tool for that.",
-              style="Warning.TLabel").pack()
+def _build_simple_region_action_tab(
+    tab,
+    save_path_var,
+    *,
+    button_text,
+    apply_regions,
+    help_text,
+    option_text=None,
+    help_label_kw=None,
+    help_pack_kw=None,
+):
+    """Region selector + one action button, shared by the single-action region tabs.
 
-# TAB: Discoveries (launch_gui -> tab_discoveries)
-def create_discoveries_tab(tab, save_path_var):
-    unlock_mission_trucks_var = tk.IntVar(value=0)
+    apply_regions(path, selected_regions) does the work; with option_text an
+    extra checkbox is shown and its state is passed as a third (bool) argument.
+    """
+    option_var = tk.IntVar(value=0) if option_text else None
     seasons = [(label, code) for _, (code, label) in SEASON_ENTRIES]
     maps = [(name, code) for code, name in BASE_MAPS]
     selector = _build_region_selector(tab, seasons, maps)
@@ -22496,93 +23236,78 @@ def create_discoveries_tab(tab, save_path_var):
 
     def on_apply():
         path = save_path_var.get()
-        if not os.path.exists(path):
+        if not _path_exists_cached(path):
             return messagebox.showerror("Error", "Save file not found.")
         selected_regions = _collect_selected_regions(season_vars, map_vars, other_season_var)
         if not selected_regions:
             return show_info("Info", "No seasons or maps selected.")
-        unlock_discoveries(
-            path,
-            selected_regions,
-            include_mission_trucks=bool(unlock_mission_trucks_var.get()),
-        )
+        if option_var is None:
+            apply_regions(path, selected_regions)
+        else:
+            apply_regions(path, selected_regions, bool(option_var.get()))
 
-    ttk.Button(tab, text="Unlock Discoveries", command=on_apply).pack(pady=(10, 5))
+    ttk.Button(tab, text=button_text, command=on_apply).pack(pady=(10, 5))
     _add_check_all_checkbox(tab, all_check_vars)
-    ttk.Checkbutton(
+    if option_var is not None:
+        ttk.Checkbutton(tab, text=option_text, variable=option_var).pack(anchor="center", pady=(4, 0))
+    ttk.Label(tab, text=help_text, style="Warning.TLabel", **(help_label_kw or {})).pack(**(help_pack_kw or {}))
+
+# TAB: Watchtowers (launch_gui -> tab_watchtowers)
+def create_watchtowers_tab(tab, save_path_var):
+    _build_simple_region_action_tab(
         tab,
-        text="Also unlock mission/reward trucks in shop",
-        variable=unlock_mission_trucks_var,
-    ).pack(anchor="center", pady=(4, 0))
-    ttk.Label(tab, text="Sets discovered trucks to their max and unlocks matching found-truck shop entries, but won't add them to garage.",
-              style="Warning.TLabel").pack()
+        save_path_var,
+        button_text="Unlock Watchtowers",
+        apply_regions=unlock_watchtowers,
+        help_text="It will mark them as found but wont reveal the map use the Fog Tool for that.",
+    )
+
+# TAB: Discoveries (launch_gui -> tab_discoveries)
+def create_discoveries_tab(tab, save_path_var):
+    _build_simple_region_action_tab(
+        tab,
+        save_path_var,
+        button_text="Unlock Discoveries",
+        apply_regions=lambda path, regions, mission_trucks: unlock_discoveries(
+            path, regions, include_mission_trucks=mission_trucks
+        ),
+        option_text="Also unlock mission/reward trucks in shop",
+        help_text="Sets discovered trucks to their max and unlocks matching found-truck shop entries, but won't add them to garage.",
+    )
 
 # TAB: Levels (launch_gui -> tab_levels)
 def create_levels_tab(tab, save_path_var):
-    seasons = [(label, code) for _, (code, label) in SEASON_ENTRIES]
-    maps = [(name, code) for code, name in BASE_MAPS]
-    selector = _build_region_selector(tab, seasons, maps)
-    season_vars = selector["season_vars"]
-    map_vars = selector["map_vars"]
-    all_check_vars = selector["all_check_vars"]
-    other_season_var = selector["other_var"]
-
-    def on_apply():
-        path = save_path_var.get()
-        if not os.path.exists(path):
-            return messagebox.showerror("Error", "Save file not found.")
-        selected_regions = _collect_selected_regions(season_vars, map_vars, other_season_var)
-        if not selected_regions:
-            return show_info("Info", "No seasons or maps selected.")
-        unlock_levels(path, selected_regions)
-
-    ttk.Button(tab, text="Unlock Levels", command=on_apply).pack(pady=(10, 5))
-    _add_check_all_checkbox(tab, all_check_vars)
-    ttk.Label(
+    _build_simple_region_action_tab(
         tab,
-        text="Lets you view regions you haven't visited yet.",
-        style="Warning.TLabel"
-    ).pack()
+        save_path_var,
+        button_text="Unlock Levels",
+        apply_regions=unlock_levels,
+        help_text="Lets you view regions you haven't visited yet.",
+    )
+
+_GARAGES_TAB_HELP_TEXT = (
+    "Garages will be unlocked but may be hidden under fog of war. To make it work correctly, "
+    "don’t open the map itself to go into the garage. Instead, in map-selection "
+    "put your cursor over the map you want — you should see a yellow-highlighted garage icon in the bottom part of the map labeled "
+    "'Garage Opened'. Click it to port into the garage instantly. The garage can still be hidden "
+    "under fog, so drive to the yellow garage box (entrance/move to garage) to reveal it on the map. "
+    "Recover feature on that map will be semi-broken until you find the garage entrance. Note: some garage entrances "
+    "are hidden behind a quest, so you may need to use Objectives+ or complete it yourself "
+    "(e.g., the garage in Amur – Chernokamensk)."
+)
 
 # TAB: Garages (launch_gui -> tab_garages)
 def create_garages_tab(tab, save_path_var):
-    upgrade_all_var = tk.IntVar()
-    seasons = [(label, code) for _, (code, label) in SEASON_ENTRIES]
-    maps = [(name, code) for code, name in BASE_MAPS]
-    selector = _build_region_selector(tab, seasons, maps)
-    season_vars = selector["season_vars"]
-    map_vars = selector["map_vars"]
-    all_check_vars = selector["all_check_vars"]
-    other_season_var = selector["other_var"]
-
-    def on_apply():
-        path = save_path_var.get()
-        if not os.path.exists(path):
-            return messagebox.showerror("Error", "Save file not found.")
-        selected_regions = _collect_selected_regions(season_vars, map_vars, other_season_var)
-        if not selected_regions:
-            return show_info("Info", "No seasons or maps selected.")
-        unlock_garages(path, selected_regions, upgrade_all=bool(upgrade_all_var.get()))
-
-    ttk.Button(tab, text="Unlock Garages", command=on_apply).pack(pady=(10, 5))
-    _add_check_all_checkbox(tab, all_check_vars)
-    ttk.Checkbutton(tab, text="Upgrade All Garages", variable=upgrade_all_var).pack(anchor="center", pady=(4, 0))
-    ttk.Label(
+    _build_simple_region_action_tab(
         tab,
-        text=(
-            "Garages will be unlocked but may be hidden under fog of war. To make it work correctly, "
-            "don’t open the map itself to go into the garage. Instead, in map-selection "
-            "put your cursor over the map you want — you should see a yellow-highlighted garage icon in the bottom part of the map labeled "
-            "'Garage Opened'. Click it to port into the garage instantly. The garage can still be hidden "
-            "under fog, so drive to the yellow garage box (entrance/move to garage) to reveal it on the map. "
-            "Recover feature on that map will be semi-broken until you find the garage entrance. Note: some garage entrances "
-            "are hidden behind a quest, so you may need to use Objectives+ or complete it yourself "
-            "(e.g., the garage in Amur – Chernokamensk)."
-        ),
-        style="Warning.TLabel",
-        wraplength=1000,
-        justify="left"
-    ).pack(pady=(6, 0), padx=12)
+        save_path_var,
+        button_text="Unlock Garages",
+        apply_regions=lambda path, regions, upgrade_all: unlock_garages(path, regions, upgrade_all=upgrade_all),
+        option_text="Upgrade All Garages",
+        help_text=_GARAGES_TAB_HELP_TEXT,
+        help_label_kw={"wraplength": 1000, "justify": "left"},
+        help_pack_kw={"pady": (6, 0), "padx": 12},
+    )
 
 
 def create_region_tools_tab(tab, save_path_var, enable_legacy_tabs_var=None):
@@ -22764,9 +23489,9 @@ def create_region_tools_tab(tab, save_path_var, enable_legacy_tabs_var=None):
         cb.pack(anchor="center")
 
         for var in feature_check_vars:
-            _trace_var_write(var, sync_all)
+            _trace_var_write(var, sync_all, coalesce=True)
         if enable_legacy_tabs_var is not None:
-            _trace_var_write(enable_legacy_tabs_var, sync_all)
+            _trace_var_write(enable_legacy_tabs_var, sync_all, coalesce=True)
         sync_all()
         return check_all_var
 
@@ -31476,6 +32201,8 @@ except NameError:
 
 # ---------- SAFE helpers ----------
 
+# (key, value regex) -> compiled '("key": )(value)' pattern; multi-key
+# patterns are stored under (sorted lower-cased keys, value regex)
 _key_pattern_cache = {}
 # -----------------------------------------------------------------------------
 # END SECTION: Tab Builders (UI construction)
@@ -31489,23 +32216,161 @@ def _value_pattern():
     # Matches: quoted string OR array OR object OR primitive (no comma/closing brace)
     return r'(?:"[^"]*"|\[[^\]]*\]|\{[^}]*\}|[^,}]+)'
 
+# value shapes matched after '"key":' by the rules sanitizers and sync
+_RULE_NULL_VALUE = r'null'
+_RULE_ZERO_VALUE = r'0\b'
+_RULE_ARRAY_VALUE = r'\[[^\]]*\]'
+_RULE_SCALAR_VALUE = r'".*?"|[-]?\d+(?:\.\d+)?|true|false|null'
+
+# Save keys are written in a fixed case, so the rule patterns match them
+# exactly (ASCII classes only); the case-insensitive variants are only
+# compiled when a key is missing and a differently-cased spelling exists.
+_SETTINGS_DICT_NULL_OR_ZERO_RE = re.compile(r'"settingsDictionaryForNGPScreen"\s*:\s*(null|0\b)', flags=re.ASCII)
+_SETTINGS_DICT_OBJECT_RE = re.compile(r'"settingsDictionaryForNGPScreen"\s*:\s*({[^}]*})', flags=re.ASCII)
+_DEPLOY_PRICE_OBJECT_RE = re.compile(r'"deployPrice"\s*:\s*({[^}]*})', flags=re.ASCII)
+
+def _key_value_pattern(key: str, value_regex: str, ignore_case=False):
+    """Compiled '("key": )(value)' pattern; built once per key, shape and case mode."""
+    cache_key = (key, value_regex, ignore_case)
+    pat = _key_pattern_cache.get(cache_key)
+    if pat is None:
+        flags = re.ASCII | (re.IGNORECASE if ignore_case else 0)
+        pat = re.compile(rf'("{re.escape(key)}"\s*:\s*)({value_regex})', flags=flags)
+        _key_pattern_cache[cache_key] = pat
+    return pat
+
+def _has_other_case_key(content: str, keys) -> bool:
+    """Slow path for missing keys: does content spell any of them in another case?"""
+    lowered = content.lower()
+    return any(f'"{key.lower()}"' in lowered for key in keys)
+
+def _key_has_null_or_zero(text: str, key: str, zero=True) -> bool:
+    """
+    Cheap pre-check for the null/0 sanitizers: does any exact '"key":' in
+    text hold null (or a 0 the `0\\b` patterns would match)?
+    """
+    needle = f'"{key}"'
+    pos = text.find(needle)
+    while pos >= 0:
+        end = pos + len(needle)
+        rest = text[end:end + 64].lstrip()
+        if rest.startswith(":"):
+            head = rest[1:].lstrip()[:5]
+            if head[:4].lower() == "null":
+                return True
+            if zero and head[:1] == "0" and not (head[1:2].isalnum() or head[1:2] == "_"):
+                return True
+        pos = text.find(needle, end)
+    return False
+
+def _keys_value_pattern(keys, value_regex: str, ignore_case=False):
+    """Like _key_value_pattern for any of several keys; group 2 is the key as written."""
+    names = {key.lower() for key in keys} if ignore_case else set(keys)
+    cache_key = (tuple(sorted(names)), value_regex, ignore_case)
+    pat = _key_pattern_cache.get(cache_key)
+    if pat is None:
+        alternation = "|".join(re.escape(name) for name in cache_key[0])
+        flags = re.ASCII | (re.IGNORECASE if ignore_case else 0)
+        pat = re.compile(rf'("({alternation})"\s*:\s*)({value_regex})', flags=flags)
+        _key_pattern_cache[cache_key] = pat
+    return pat
+
+def _insert_after_first_brace(content: str, text: str) -> str:
+    """Insert text right after the first '{' of content (unchanged if there is none)."""
+    i = content.find("{")
+    if i < 0:
+        return content
+    return content[:i + 1] + text + content[i + 1:]
+
 def _set_key_in_text(content: str, key: str, json_value: str) -> str:
     """
     Safely replace or insert '"key": <json_value>'.
     json_value must be a literal text (e.g. json.dumps(value)).
     Handles arrays/objects/strings/numbers/true/false.
     """
-    pat = _key_pattern_cache.get(key)
-    if pat is None:
-        vp = _value_pattern()
-        pat = re.compile(rf'("{re.escape(key)}"\s*:\s*)({vp})', flags=re.IGNORECASE)
-        _key_pattern_cache[key] = pat
-    if pat.search(content):
-        content = pat.sub(lambda m: m.group(1) + json_value, content)
-    else:
-        content = content.replace("{", f'{{"{key}": {json_value}, ', 1)
+    pat = _key_value_pattern(key, _value_pattern())
+    content, count = pat.subn(lambda m: m.group(1) + json_value, content)
+    if not count and _has_other_case_key(content, (key,)):
+        pat = _key_value_pattern(key, _value_pattern(), ignore_case=True)
+        content, count = pat.subn(lambda m: m.group(1) + json_value, content)
+    if not count:
+        content = _insert_after_first_brace(content, f'"{key}": {json_value}, ')
     return content
 
+def _set_keys_in_text(content: str, key_values, ignore_case=False) -> str:
+    """
+    _set_key_in_text for several keys in one scan of content.
+    key_values maps key -> JSON literal text; the result is the same as
+    calling _set_key_in_text for each item in order. Values that already
+    hold the wanted text are left alone, so an unchanged save is returned
+    as is without rebuilding the string.
+    """
+    if not key_values:
+        return content
+    fold = str.lower if ignore_case else str
+    by_name = {fold(key): json_value for key, json_value in key_values.items()}
+    pat = _keys_value_pattern(by_name, _value_pattern(), ignore_case=ignore_case)
+    found = set()
+    edits = []
+    for m in pat.finditer(content):
+        name = fold(m.group(2))
+        found.add(name)
+        json_value = by_name[name]
+        if m.group(3) != json_value:
+            edits.append((m.start(3), m.end(3), json_value))
+    missing_keys = [key for key in key_values if fold(key) not in found]
+    if missing_keys and not ignore_case and _has_other_case_key(content, missing_keys):
+        return _set_keys_in_text(content, key_values, ignore_case=True)
+    if edits:
+        content = "".join(_iter_spliced_text(content, edits))
+    # each missing key would have been inserted right after the first '{',
+    # so the later ones end up in front
+    missing = [f'"{key}": {key_values[key]}, ' for key in reversed(missing_keys)]
+    if missing:
+        content = _insert_after_first_brace(content, "".join(missing))
+    return content
+
+def _parse_rule_scalar(raw: str):
+    """Python value of a scalar matched by _RULE_SCALAR_VALUE."""
+    raw = raw.strip()
+    rl = raw.lower()
+    if rl == "true":
+        return True
+    if rl == "false":
+        return False
+    if rl == "null":
+        return None
+    if raw.startswith('"') and raw.endswith('"'):
+        return raw[1:-1]
+    try:
+        if "." in raw:
+            return float(raw)
+        return int(raw)
+    except Exception:
+        return raw
+
+def _read_scalar_keys(content: str, keys) -> dict:
+    """
+    Scalar value of each key's first '"key": <scalar>' occurrence, found in
+    one scan of content; keys that never occur with a scalar are left out.
+    """
+    values = {}
+    wanted = set(keys)
+    for m in _keys_value_pattern(wanted, _RULE_SCALAR_VALUE).finditer(content):
+        key = m.group(2)
+        if key not in values:
+            values[key] = _parse_rule_scalar(m.group(3))
+            if len(values) == len(wanted):
+                break
+    missing = [key for key in wanted if key not in values]
+    if missing and _has_other_case_key(content, missing):
+        by_name = {key.lower(): key for key in missing}
+        for m in _keys_value_pattern(by_name, _RULE_SCALAR_VALUE, ignore_case=True).finditer(content):
+            key = by_name.get(m.group(2).lower())
+            if key is not None and key not in values:
+                values[key] = _parse_rule_scalar(m.group(3))
+    return values
+
 def _choose_safe_default(options):
     for _, v in options.items():
         return v
@@ -31523,6 +32388,41 @@ def _rule_option_matches_value(option_value, raw_value):
         pass
     return str(option_value) == str(raw_value)
 
+def _rule_option_value_index(options):
+    """
+    Lookup table for _rule_option_label: the first label of each option value,
+    keyed the way _rule_option_matches_value compares them.
+    """
+    index = {}
+    for label, value in options.items():
+        if value == _RULE_RANDOM_VALUE:
+            continue
+        if isinstance(value, bool):
+            index.setdefault(("bool", value), label)
+            continue
+        if isinstance(value, (int, float)):
+            index.setdefault(("num", float(value)), label)
+        index.setdefault(("str", str(value)), label)
+    return index
+
+def _rule_option_label(options, index, raw_value):
+    """First label in options whose value matches raw_value, or None."""
+    if isinstance(raw_value, bool):
+        return index.get(("bool", raw_value))
+    if isinstance(raw_value, (int, float)):
+        try:
+            label = index.get(("num", float(raw_value)))
+        except Exception:
+            label = None
+        if label is not None:
+            return label
+        # near-equal floats (e.g. 1.20000005) only match within the tolerance
+        for label, value in options.items():
+            if _rule_option_matches_value(value, raw_value):
+                return label
+        return None
+    return index.get(("str", str(raw_value)))
+
 def _is_custom_multiplier_rule_key(key):
     return str(key or "").endswith("Factor")
 
@@ -31555,19 +32455,47 @@ def _json_rule_multiplier_value(raw_value):
         return int(round(value))
     return float(value)
 
-def _make_key_saver(key, options, var):
-    def saver(path):
+def _make_key_saver(key, options, var, safe_default=None):
+    """
+    Return saver(content) -> content with the rule's selected value written in.
+    saver.rule_key / saver.json_value() let callers batch several savers into
+    one _set_keys_in_text pass.
+    """
+    if safe_default is None:
+        safe_default = _choose_safe_default(options)
+
+    def json_value():
+        return json.dumps(options.get(var.get(), safe_default))
+
+    def saver(content):
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                content = f.read()
-            value = options.get(var.get(), _choose_safe_default(options))
-            json_value = json.dumps(value)
-            content = _set_key_in_text(content, key, json_value)
-            _write_text_file_atomic(path, content, encoding="utf-8")
+            return _set_key_in_text(content, key, json_value())
         except Exception as e:
             print(f"[rules saver] {key} failed: {e}")
+            return content
+    saver.rule_key = key
+    saver.json_value = json_value
     return saver
 
+def _run_rule_savers(content, savers):
+    """Apply savers in order; the ones from _make_key_saver are written in one pass."""
+    batch = {}
+    for saver in savers:
+        key = getattr(saver, "rule_key", None)
+        if key is not None:
+            try:
+                batch[key] = saver.json_value()
+            except Exception as e:
+                print(f"[rules saver] {key} failed: {e}")
+            continue
+        content = _set_keys_in_text(content, batch)
+        batch = {}
+        try:
+            content = saver(content)
+        except Exception as se:
+            print("rule saver error:", se)
+    return _set_keys_in_text(content, batch)
+
 def _make_backup(path):
     bakfunc = globals().get("make_backup_if_enabled")
     try:
@@ -31598,6 +32526,14 @@ def _build_default_settings_dict():
 
 _DEFAULT_SETTINGS_DICT = _build_default_settings_dict()
 _DEFAULT_DEPLOY_PRICE = {"Region":3500,"Map":1000}
+# companion keys the rules sync reads besides the rule keys themselves
+_RULE_SYNC_LINKED_KEYS = [
+    "truckAvailabilityLevel",
+    "internalAddonAmount",
+    "isGoldFailReason",
+    "regionRepairePointsFactor",
+    "isDLCVehiclesAvailable",
+]
 _DEFAULT_AUTOLOAD_PRICE = 150
 
 # ---------- UI builder ----------
@@ -32027,8 +32963,17 @@ def create_rules_tab(tab_rules, save_path_var):
             options = dict(options)
         if key != "gameDifficultyMode" and _RULE_RANDOM_LABEL not in options:
             options[_RULE_RANDOM_LABEL] = _RULE_RANDOM_VALUE
-        var = tk.StringVar(value=list(options.keys())[0])
-        rule = {"label": label, "key": key, "options": options, "var": var}
+        labels = list(options.keys())
+        var = tk.StringVar(value=labels[0])
+        rule = {
+            "label": label,
+            "key": key,
+            "options": options,
+            "labels": labels,
+            "value_index": _rule_option_value_index(options),
+            "safe_default": _choose_safe_default(options),
+            "var": var,
+        }
         if _is_custom_multiplier_rule(rule):
             default_value = _normalize_rule_multiplier_value(_get_rule_default_value(rule))
             rule["custom_scale_var"] = tk.DoubleVar(tab_rules, value=_slider_rule_multiplier_value(default_value))
@@ -32063,7 +33008,7 @@ def create_rules_tab(tab_rules, save_path_var):
         control_slot.pack(fill="x", pady=(6, 2))
         control_slot.pack_propagate(False)
         rule["control_slot"] = control_slot
-        cb = ttk.Combobox(control_slot, textvariable=var, values=list(opts.keys()), state="readonly")
+        cb = ttk.Combobox(control_slot, textvariable=var, values=rule["labels"], state="readonly")
         cb.pack(fill="x")
         cb.bind("<<ComboboxSelected>>", lambda _e, current_rule=rule: _on_rule_dropdown_selected(current_rule))
         rule["combo_widget"] = cb
@@ -32078,7 +33023,7 @@ def create_rules_tab(tab_rules, save_path_var):
             entry.pack(side="left", padx=(8, 0))
             rule["custom_frame"] = custom_frame
             rule["custom_control"] = _bind_custom_rule_control(rule, scale, scale_var, entry, entry_var)
-        rule_savers.append(_make_key_saver(key, opts, var))
+        rule_savers.append(_make_key_saver(key, opts, var, rule["safe_default"]))
 
         c += 1
         if c >= COLS:
@@ -32091,96 +33036,80 @@ def create_rules_tab(tab_rules, save_path_var):
     def _ensure_key_with_default_text(text, key, pyvalue, treat_zero_as_missing=False):
         """Replace explicit null or 0 (optionally) for key, or insert if missing."""
         json_value = json.dumps(pyvalue)
-        null_pat = re.compile(rf'("{re.escape(key)}"\s*:\s*)null', flags=re.IGNORECASE)
-        if null_pat.search(text):
-            text = null_pat.sub(lambda m: m.group(1) + json_value, text)
+        if f'"{key}"' not in text:
+            return _insert_after_first_brace(text, f'"{key}": {json_value}, ')
+        # the usual case is a valid value: a literal look at each occurrence
+        # decides whether the substitution passes need to run at all
+        if not _key_has_null_or_zero(text, key, zero=treat_zero_as_missing):
+            return text
+        text = _key_value_pattern(key, _RULE_NULL_VALUE).sub(lambda m: m.group(1) + json_value, text)
         if treat_zero_as_missing:
             # replace "key": 0 (word boundary)
-            zero_pat = re.compile(rf'("{re.escape(key)}"\s*:\s*)0\b', flags=re.IGNORECASE)
-            if zero_pat.search(text):
-                text = zero_pat.sub(lambda m: m.group(1) + json_value, text)
-        if f'"{key}"' not in text:
-            text = text.replace("{", f'{{"{key}": {json_value}, ', 1)
+            text = _key_value_pattern(key, _RULE_ZERO_VALUE).sub(lambda m: m.group(1) + json_value, text)
         return text
 
-    def _ensure_array_key(text, key, default_list):
+    def _array_value_is_valid(arr_text, default_list):
+        """False if not an array, too short, or indices 2..n are non-numeric or zero."""
+        try:
+            arr = json.loads(arr_text)
+        except Exception:
+            return False
+        if not isinstance(arr, list) or len(arr) < len(default_list):
+            return False
+        for i in range(2, len(default_list)):
+            val = arr[i]
+            if not isinstance(val, (int, float)) or val == 0:
+                return False
+        return True
+
+    def _ensure_array_keys(text, key_defaults):
         """
-        Ensure key : [ ... ] exists and is valid.
-        Replace if missing, not array, length too short, or indices 2..n are non-numeric or zero.
+        Ensure each key : [ ... ] exists and is valid; key_defaults maps key -> default list.
+        The first array of every key is found in one scan and all replacements are
+        written in one pass.
         """
-        pat = re.compile(rf'"{re.escape(key)}"\s*:\s*(\[[^\]]*\])', flags=re.IGNORECASE)
-        m = pat.search(text)
-        if m:
-            arr_text = m.group(1)
-            try:
-                arr = json.loads(arr_text)
-                if not isinstance(arr, list) or len(arr) < len(default_list):
-                    text = _set_key_in_text(text, key, json.dumps(default_list))
-                else:
-                    bad = False
-                    for i in range(2, len(default_list)):
-                        try:
-                            val = arr[i]
-                            if not isinstance(val, (int, float)) or val == 0:
-                                bad = True
-                                break
-                        except Exception:
-                            bad = True
-                            break
-                    if bad:
-                        text = _set_key_in_text(text, key, json.dumps(default_list))
-            except Exception:
-                text = _set_key_in_text(text, key, json.dumps(default_list))
-        else:
-            text = _set_key_in_text(text, key, json.dumps(default_list))
-        return text
+        present = [key for key in key_defaults if f'"{key}"' in text]
+        arrays = {}
+        if present:
+            for m in _keys_value_pattern(present, _RULE_ARRAY_VALUE).finditer(text):
+                key = m.group(2)
+                if key not in arrays:
+                    arrays[key] = m.group(3)
+        replacements = {}
+        for key, default_list in key_defaults.items():
+            arr_text = arrays.get(key)
+            if arr_text is None or not _array_value_is_valid(arr_text, default_list):
+                replacements[key] = json.dumps(default_list)
+        return _set_keys_in_text(text, replacements)
 
     def _ensure_settings_dictionary(text, default_dict):
+        """
+        Ensure settingsDictionaryForNGPScreen is an object.
+        Returns (text, obj): obj is the dictionary the text now holds, so callers
+        do not have to search for it again.
+        """
+        default_json = json.dumps(default_dict)
+        if '"settingsDictionaryForNGPScreen"' not in text:
+            # missing -> insert
+            return _set_key_in_text(text, "settingsDictionaryForNGPScreen", default_json), dict(default_dict)
         # explicit null or 0 -> replace
-        if re.search(r'"settingsDictionaryForNGPScreen"\s*:\s*null', text, flags=re.IGNORECASE) or re.search(r'"settingsDictionaryForNGPScreen"\s*:\s*0\b', text):
-            text = re.sub(r'"settingsDictionaryForNGPScreen"\s*:\s*(null|0\b)', f'"settingsDictionaryForNGPScreen": {json.dumps(default_dict)}', text, flags=re.IGNORECASE)
+        if _key_has_null_or_zero(text, "settingsDictionaryForNGPScreen"):
+            text = _SETTINGS_DICT_NULL_OR_ZERO_RE.sub(f'"settingsDictionaryForNGPScreen": {default_json}', text)
         # if present as object -> validate parse
-        m = re.search(r'"settingsDictionaryForNGPScreen"\s*:\s*({[^}]*})', text)
+        m = _SETTINGS_DICT_OBJECT_RE.search(text)
         if m:
             try:
                 obj = json.loads(m.group(1))
-                if not isinstance(obj, dict):
-                    text = _set_key_in_text(text, "settingsDictionaryForNGPScreen", json.dumps(default_dict))
+                if isinstance(obj, dict):
+                    return text, obj
             except Exception:
-                text = _set_key_in_text(text, "settingsDictionaryForNGPScreen", json.dumps(default_dict))
-        else:
-            # missing -> insert
-            text = _set_key_in_text(text, "settingsDictionaryForNGPScreen", json.dumps(default_dict))
-        return text
-
-    def _read_scalar_key(text: str, key: str):
-        m = re.search(
-            rf'"{re.escape(key)}"\s*:\s*(".*?"|[-]?\d+(\.\d+)?|true|false|null)',
-            text,
-            flags=re.IGNORECASE,
-        )
-        if not m:
-            return None
-        raw = m.group(1).strip()
-        rl = raw.lower()
-        if rl == "true":
-            return True
-        if rl == "false":
-            return False
-        if rl == "null":
-            return None
-        if raw.startswith('"') and raw.endswith('"'):
-            return raw[1:-1]
-        try:
-            if "." in raw:
-                return float(raw)
-            return int(raw)
-        except Exception:
-            return raw
+                pass
+        # not an object (or missing) -> replace/insert
+        return _set_key_in_text(text, "settingsDictionaryForNGPScreen", default_json), dict(default_dict)
 
     def _load_settings_dictionary(text: str, default_dict: dict):
         out = dict(default_dict)
-        m = re.search(r'"settingsDictionaryForNGPScreen"\s*:\s*({[^}]*})', text)
+        m = _SETTINGS_DICT_OBJECT_RE.search(text)
         if not m:
             return out
         try:
@@ -32194,7 +33123,7 @@ def create_rules_tab(tab_rules, save_path_var):
     def _resolve_rule_selection(rule: dict):
         opts = rule["options"]
         current_label = rule["var"].get()
-        current_value = opts.get(current_label, _choose_safe_default(opts))
+        current_value = opts.get(current_label, rule["safe_default"])
         if current_label != _RULE_RANDOM_LABEL and current_value != _RULE_RANDOM_VALUE:
             return current_label, current_value
 
@@ -32205,7 +33134,7 @@ def create_rules_tab(tab_rules, save_path_var):
             return safe_label, safe_value
 
         chosen_label = random.choice(concrete_labels)
-        chosen_value = opts.get(chosen_label, _choose_safe_default(opts))
+        chosen_value = opts.get(chosen_label, rule["safe_default"])
         try:
             # Update UI to the concrete value that was written to the save.
             rule["var"].set(chosen_label)
@@ -32220,13 +33149,6 @@ def create_rules_tab(tab_rules, save_path_var):
             messagebox.showerror("Error", "Please select a valid save file first.")
             return
 
-        tmp = path + ".rules_tmp"
-        try:
-            shutil.copy2(path, tmp)
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not create temporary copy: {e}")
-            return
-
         try:
             if random_rules_var.get():
                 _set_all_rules_to_random()
@@ -32259,7 +33181,7 @@ def create_rules_tab(tab_rules, save_path_var):
                     if rule["key"] == "gameDifficultyMode":
                         continue
                     default_label = _get_rule_default_label(rule)
-                    default_value = rule["options"].get(default_label, _choose_safe_default(rule["options"]))
+                    default_value = rule["options"].get(default_label, rule["safe_default"])
                     resolved_rule_choices[rule["key"]] = (default_label, default_value)
                     try:
                         rule["var"].set(default_label)
@@ -32270,41 +33192,33 @@ def create_rules_tab(tab_rules, save_path_var):
                 except Exception:
                     pass
 
-            # 2) Run direct key savers (non-virtual rules).
-            for saver in rule_savers:
-                try:
-                    saver(tmp)
-                except Exception as se:
-                    print("rule saver error:", se)
-
-            # 3) Read back for custom/special rule handling.
-            with open(tmp, "r", encoding="utf-8") as f:
-                text = f.read()
+            # 2) Run direct key savers (non-virtual rules) on the text in memory.
+            with open(path, "r", encoding="utf-8") as f:
+                original = f.read()
+            text = _run_rule_savers(original, rule_savers)
 
+            # 3) Custom/special rule handling.
             if _custom_rules_active():
+                custom_values = {}
                 for rule in FACTOR_RULE_VARS:
                     if not _is_custom_multiplier_rule(rule):
                         continue
                     _, custom_value = resolved_rule_choices.get(rule["key"], (None, _get_custom_rule_value(rule)))
-                    text = _set_key_in_text(
-                        text,
-                        rule["key"],
-                        json.dumps(_json_rule_multiplier_value(custom_value)),
-                    )
+                    custom_values[rule["key"]] = json.dumps(_json_rule_multiplier_value(custom_value))
+                text = _set_keys_in_text(text, custom_values)
 
             # 4) Ensure each rule key exists and is not null.
             for rule in FACTOR_RULE_VARS:
                 internal_key = rule["key"]
-                options = rule["options"]
-                safe = _choose_safe_default(options)
-                text = _ensure_key_with_default_text(text, internal_key, safe, treat_zero_as_missing=False)
+                text = _ensure_key_with_default_text(text, internal_key, rule["safe_default"], treat_zero_as_missing=False)
 
-            # 5) Apply special linked rule behavior.
+            # 5) Apply special linked rule behavior (collected, then written in one pass).
+            linked_values = {}
             for rule in FACTOR_RULE_VARS:
                 key = rule["key"]
                 opts = rule["options"]
                 label, selected_value = resolved_rule_choices.get(
-                    key, (rule["var"].get(), opts.get(rule["var"].get(), _choose_safe_default(opts)))
+                    key, (rule["var"].get(), opts.get(rule["var"].get(), rule["safe_default"]))
                 )
 
                 if key == "gameDifficultyMode":
@@ -32312,54 +33226,56 @@ def create_rules_tab(tab_rules, save_path_var):
                         is_hard_bool = int(selected_value) == 1
                     except Exception:
                         is_hard_bool = False
-                    text = _set_key_in_text(text, "isHardMode", json.dumps(is_hard_bool))
+                    linked_values["isHardMode"] = json.dumps(is_hard_bool)
                     continue
 
                 if key == "truckAvailability":
                     # Distinguish rank 10/20/30 when the base value is "AVAILABLE_FROM_LEVEL".
                     if label == "store unlocks at rank 10":
-                        text = _set_key_in_text(text, "truckAvailabilityLevel", json.dumps(10))
+                        linked_values["truckAvailabilityLevel"] = json.dumps(10)
                     elif label == "store unlocks at rank 20":
-                        text = _set_key_in_text(text, "truckAvailabilityLevel", json.dumps(20))
+                        linked_values["truckAvailabilityLevel"] = json.dumps(20)
                     elif label == "store unlocks at rank 30":
-                        text = _set_key_in_text(text, "truckAvailabilityLevel", json.dumps(30))
+                        linked_values["truckAvailabilityLevel"] = json.dumps(30)
                     continue
 
                 if key == "internalAddonAvailability":
                     amt = _INTERNAL_ADDON_AMOUNT_BY_LABEL.get(label)
                     if amt is not None:
-                        text = _set_key_in_text(text, "internalAddonAmount", json.dumps(int(amt)))
+                        linked_values["internalAddonAmount"] = json.dumps(int(amt))
                     continue
 
                 if key == "maxContestAttempts":
-                    text = _set_key_in_text(text, "isGoldFailReason", json.dumps(label == "gold time only"))
+                    linked_values["isGoldFailReason"] = json.dumps(label == "gold time only")
                     if label == "gold time only":
-                        text = _set_key_in_text(text, "maxContestAttempts", json.dumps(-1))
+                        linked_values["maxContestAttempts"] = json.dumps(-1)
                     continue
 
                 if key == "regionRepaireMoneyFactor":
                     # Keep money and points factors in sync for regional repair rule.
-                    text = _set_key_in_text(text, "regionRepairePointsFactor", json.dumps(_json_rule_multiplier_value(selected_value)))
+                    linked_values["regionRepairePointsFactor"] = json.dumps(_json_rule_multiplier_value(selected_value))
                     continue
 
                 if key == "needToAddDlcTrucks":
                     # Keep the legacy companion flag coherent with the selected DLC-truck rule.
                     try:
-                        text = _set_key_in_text(text, "isDLCVehiclesAvailable", json.dumps(bool(selected_value)))
+                        linked_values["isDLCVehiclesAvailable"] = json.dumps(bool(selected_value))
                     except Exception:
                         pass
+            text = _set_keys_in_text(text, linked_values)
 
             # 6) Ensure key defaults and special arrays.
             text = _ensure_key_with_default_text(text, "autoloadPrice", _DEFAULT_AUTOLOAD_PRICE, treat_zero_as_missing=True)
-            text = _ensure_array_key(text, "recoveryPrice", _DEFAULT_RECOVERY_PRICE)
-            text = _ensure_array_key(text, "fullRepairPrice", _DEFAULT_FULL_REPAIR_PRICE)
+            text = _ensure_array_keys(
+                text,
+                {"recoveryPrice": _DEFAULT_RECOVERY_PRICE, "fullRepairPrice": _DEFAULT_FULL_REPAIR_PRICE},
+            )
 
             # 7) settingsDictionaryForNGPScreen: ensure exists, then sync from selected rule labels.
-            text = _ensure_settings_dictionary(text, _DEFAULT_SETTINGS_DICT)
-            if difficulty_label == "Normal":
-                settings_dict = dict(_DEFAULT_SETTINGS_DICT)
-            else:
-                settings_dict = _load_settings_dictionary(text, _DEFAULT_SETTINGS_DICT)
+            text, saved_settings = _ensure_settings_dictionary(text, _DEFAULT_SETTINGS_DICT)
+            settings_dict = dict(_DEFAULT_SETTINGS_DICT)
+            if difficulty_label != "Normal":
+                settings_dict.update(saved_settings)
             for rule in FACTOR_RULE_VARS:
                 key = rule["key"]
                 label, _ = resolved_rule_choices.get(key, (rule["var"].get(), None))
@@ -32373,7 +33289,7 @@ def create_rules_tab(tab_rules, save_path_var):
             text = _set_key_in_text(text, "settingsDictionaryForNGPScreen", json.dumps(settings_dict))
 
             # 8) deployPrice ensure object with Region/Map
-            m = re.search(r'"deployPrice"\s*:\s*({[^}]*})', text)
+            m = _DEPLOY_PRICE_OBJECT_RE.search(text)
             if m:
                 try:
                     dp = json.loads(m.group(1))
@@ -32385,47 +33301,66 @@ def create_rules_tab(tab_rules, save_path_var):
                 text = _set_key_in_text(text, "deployPrice", json.dumps(_DEFAULT_DEPLOY_PRICE))
 
             # 9) Compare & write
-            with open(path, "r", encoding="utf-8") as f:
-                original = f.read()
-
             if text == original:
-                try:
-                    os.remove(tmp)
-                except Exception:
-                    pass
                 show_info("No changes", "No rule changes detected.")
                 return
 
+            # backup reads Tk settings, so it stays on the UI thread; the
+            # write runs in a worker and the button stays disabled until it
+            # reports back, so one apply makes exactly one backup and write
             _make_backup(path)
-            _write_text_file_atomic(path, text, encoding="utf-8")
-            try:
-                os.remove(tmp)
-            except Exception:
-                pass
-            show_info("Success", "Rules applied successfully.")
+            apply_button.state(["disabled"])
+
+            def _finish(result):
+                try:
+                    apply_button.state(["!disabled"])
+                except Exception:
+                    pass
+                if isinstance(result, Exception):
+                    messagebox.showerror("Save failed", f"Failed to apply rules: {result}")
+                else:
+                    show_info("Success", "Rules applied successfully.")
+
+            _run_in_worker(
+                tab_rules,
+                lambda: _write_text_file_atomic(path, text, encoding="utf-8"),
+                _finish,
+            )
         except Exception as e:
-            try:
-                os.remove(tmp)
-            except Exception:
-                pass
             messagebox.showerror("Save failed", f"Failed to apply rules: {e}")
 
     # ---------- sync UI values from save to comboboxes ----------
-    def sync_all_rules_from_save(path):
+    # values read by the last sync; reused while the save file is unchanged
+    synced_save = {"path": None, "stamp": None, "settings": None, "scalars": None}
+
+    def _rules_file_stamp(path):
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+
+    def sync_all_rules_from_save(path, content=None):
         _reset_rules_ui_to_defaults()
         if not path or not os.path.exists(path):
             return
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                content = f.read()
-            settings_dict = _load_settings_dictionary(content, _DEFAULT_SETTINGS_DICT)
+            stamp = _rules_file_stamp(path)
+            if synced_save["path"] == path and synced_save["stamp"] == stamp:
+                settings_dict = synced_save["settings"]
+                scalar_values = synced_save["scalars"]
+            else:
+                if content is None:
+                    with open(path, "r", encoding="utf-8") as f:
+                        content = f.read()
+                settings_dict = _load_settings_dictionary(content, _DEFAULT_SETTINGS_DICT)
+                # every scalar the sync looks at, read in one scan of the save
+                scalar_values = _read_scalar_keys(content, [rule["key"] for rule in FACTOR_RULE_VARS] + _RULE_SYNC_LINKED_KEYS)
+                synced_save.update(path=path, stamp=stamp, settings=settings_dict, scalars=scalar_values)
             for rule in FACTOR_RULE_VARS:
                 internal_key = rule["key"]
                 options = rule["options"]
                 var = rule["var"]
 
                 if _is_custom_multiplier_rule(rule):
-                    rawv = _read_scalar_key(content, internal_key)
+                    rawv = scalar_values.get(internal_key)
                     if rawv is not None and not isinstance(rawv, bool):
                         _set_custom_rule_value(rule, rawv)
                         matched_label = _matching_numeric_rule_label(rule, rawv)
@@ -32451,9 +33386,9 @@ def create_rules_tab(tab_rules, save_path_var):
 
                 # Special state inference for real keys.
                 if internal_key == "truckAvailability":
-                    avail = _read_scalar_key(content, "truckAvailability")
+                    avail = scalar_values.get("truckAvailability")
                     if avail == 2:
-                        lvl = _read_scalar_key(content, "truckAvailabilityLevel")
+                        lvl = scalar_values.get("truckAvailabilityLevel")
                         if lvl is not None and int(lvl) >= 30 and "store unlocks at rank 30" in options:
                             var.set("store unlocks at rank 30")
                         elif lvl is not None and int(lvl) >= 20 and "store unlocks at rank 20" in options:
@@ -32463,9 +33398,9 @@ def create_rules_tab(tab_rules, save_path_var):
                         continue
 
                 if internal_key == "internalAddonAvailability":
-                    addon_avail = _read_scalar_key(content, "internalAddonAvailability")
+                    addon_avail = scalar_values.get("internalAddonAvailability")
                     if addon_avail == 2:
-                        addon_amount = _read_scalar_key(content, "internalAddonAmount")
+                        addon_amount = scalar_values.get("internalAddonAmount")
                         if addon_amount is not None:
                             addon_amount = float(addon_amount)
                             if 10 <= addon_amount <= 50 and "10-50 per garage" in options:
@@ -32480,14 +33415,14 @@ def create_rules_tab(tab_rules, save_path_var):
                                 continue
 
                 if internal_key == "maxContestAttempts":
-                    is_gold = _read_scalar_key(content, "isGoldFailReason")
+                    is_gold = scalar_values.get("isGoldFailReason")
                     if is_gold is True and "gold time only" in options:
                         var.set("gold time only")
                         continue
 
                 if internal_key == "regionRepaireMoneyFactor":
-                    money_factor = _read_scalar_key(content, "regionRepaireMoneyFactor")
-                    points_factor = _read_scalar_key(content, "regionRepairePointsFactor")
+                    money_factor = scalar_values.get("regionRepaireMoneyFactor")
+                    points_factor = scalar_values.get("regionRepairePointsFactor")
                     if money_factor is not None and points_factor is not None:
                         for lab, val in options.items():
                             if _rule_option_matches_value(val, money_factor) and _rule_option_matches_value(val, points_factor):
@@ -32496,23 +33431,21 @@ def create_rules_tab(tab_rules, save_path_var):
                         continue
 
                 if internal_key == "needToAddDlcTrucks":
-                    rawv = _read_scalar_key(content, "needToAddDlcTrucks")
+                    rawv = scalar_values.get("needToAddDlcTrucks")
                     if rawv is None:
-                        rawv = _read_scalar_key(content, "isDLCVehiclesAvailable")
+                        rawv = scalar_values.get("isDLCVehiclesAvailable")
                     if rawv is not None:
-                        for lab, val in options.items():
-                            if _rule_option_matches_value(val, rawv):
-                                var.set(lab)
-                                break
+                        lab = _rule_option_label(options, rule["value_index"], rawv)
+                        if lab is not None:
+                            var.set(lab)
                     continue
 
-                rawv = _read_scalar_key(content, internal_key)
+                rawv = scalar_values.get(internal_key)
                 if rawv is None:
                     continue
-                for lab, val in options.items():
-                    if _rule_option_matches_value(val, rawv):
-                        var.set(lab)
-                        break
+                lab = _rule_option_label(options, rule["value_index"], rawv)
+                if lab is not None:
+                    var.set(lab)
         except Exception as e:
             print("sync failed:", e)
 
@@ -32521,17 +33454,34 @@ def create_rules_tab(tab_rules, save_path_var):
     if pls is None:
         plugin_loaders = []
         pls = plugin_loaders
+    sync_all_rules_from_save.accepts_content = True
     try:
         if sync_all_rules_from_save not in pls:
             pls.append(sync_all_rules_from_save)
     except Exception as e:
         print("Could not register rules loader in plugin_loaders:", e)
 
+    # several writes in a row (browse + normalize) collapse into one sync
+    _sync_job = {"id": None}
+    def _schedule_sync(*_args):
+        try:
+            if _sync_job.get("id") is not None:
+                tab_rules.after_cancel(_sync_job["id"])
+        except Exception:
+            pass
+        try:
+            _sync_job["id"] = tab_rules.after(
+                50,
+                lambda: (_sync_job.__setitem__("id", None), sync_all_rules_from_save(save_path_var.get())),
+            )
+        except Exception:
+            sync_all_rules_from_save(save_path_var.get())
+
     try:
-        save_path_var.trace_add("write", lambda *args: sync_all_rules_from_save(save_path_var.get()))
+        save_path_var.trace_add("write", _schedule_sync)
     except Exception:
         try:
-            save_path_var.trace("w", lambda *args: sync_all_rules_from_save(save_path_var.get()))
+            save_path_var.trace("w", _schedule_sync)
         except Exception:
             pass
 
@@ -32568,7 +33518,8 @@ def create_rules_tab(tab_rules, save_path_var):
     button_row = ttk.Frame(bottom)
     button_row.pack(fill="x")
     ttk.Frame(button_row).pack(side="left", expand=True)
-    ttk.Button(button_row, text="Save Rules to Save File", command=apply_all_rules, width=30).pack(side="left")
+    apply_button = ttk.Button(button_row, text="Save Rules to Save File", command=apply_all_rules, width=30)
+    apply_button.pack(side="left")
     ttk.Frame(button_row).pack(side="left", expand=True)
 
     # initial sync
@@ -32599,6 +33550,32 @@ GITHUB_MAIN_PAGE = "https://github.com/MrBoxik/SnowRunner-Save-Editor"
 # SECTION: Update Checks
 # Used In: Settings tab -> "Check for Update"
 # =============================================================================
+RELEASES_CACHE_FILE = os.path.join(get_editor_data_dir(), "snowrunner_editor_releases_cache.json")
+
+
+def _load_releases_cache():
+    """Return (etag, releases) from the last successful release list download."""
+    try:
+        with open(RELEASES_CACHE_FILE, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+    except Exception:
+        return "", None
+    if not isinstance(payload, dict):
+        return "", None
+    releases = payload.get("releases")
+    if not isinstance(releases, list):
+        return "", None
+    return str(payload.get("etag", "") or ""), releases
+
+
+def _save_releases_cache(etag, releases):
+    try:
+        text = json.dumps({"etag": str(etag or ""), "releases": releases}, ensure_ascii=False, separators=(",", ":"))
+        _write_text_file_atomic(RELEASES_CACHE_FILE, text, encoding="utf-8")
+    except Exception:
+        pass
+
+
 def _platform_release_suffix(system_name=None):
     system = str(system_name or platform.system() or "").strip().lower()
     if system == "windows":
@@ -32610,9 +33587,12 @@ def _platform_release_suffix(system_name=None):
     return ""
 
 
+_RELEASE_TAG_RE = re.compile(r"(\d+)([a-z])?")
+
+
 def _release_tag_platform_suffix(tag_raw):
     tag = str(tag_raw or "").lstrip("v").strip().lower()
-    match = re.fullmatch(r"(\d+)([a-z])?", tag)
+    match = _RELEASE_TAG_RE.fullmatch(tag)
     if not match:
         return ""
     return str(match.group(2) or "")
@@ -32651,8 +33631,7 @@ def _select_latest_release_for_platform(releases, suffix):
     if not candidates:
         return None, ""
 
-    candidates.sort(key=lambda x: (x[0], x[1]), reverse=True)
-    _, _, tag_raw, rel = candidates[0]
+    _, _, tag_raw, rel = max(candidates, key=lambda x: (x[0], x[1]))
     return rel, tag_raw
 
 
@@ -33255,6 +34234,10 @@ def _start_windows_update_artifact_cleanup_retry(exe_path=None, attempts=80, int
     threading.Thread(target=_worker, daemon=True).start()
 
 
+_VERSION_NUMBER_RE = re.compile(r"(\d+)")
+_VERSION_NUMBER_CACHE = {}
+
+
 def normalize_version(tag: str) -> int:
     """
     Extract numeric part of version string only.
@@ -33263,8 +34246,17 @@ def normalize_version(tag: str) -> int:
       '69b' -> 69
       '70'  -> 70
     """
-    m = re.match(r"(\d+)", str(tag))
-    return int(m.group(1)) if m else 0
+    key = str(tag)
+    num = _VERSION_NUMBER_CACHE.get(key)
+    if num is None:
+        m = _VERSION_NUMBER_RE.match(key)
+        num = int(m.group(1)) if m else 0
+        if len(_VERSION_NUMBER_CACHE) >= 256:
+            _VERSION_NUMBER_CACHE.clear()
+        _VERSION_NUMBER_CACHE[key] = num
+    return num
+
+
 def check_for_updates_background(root, debug=False, startup_managed=False):
     """Check GitHub for newer release in a background thread."""
     background_attempt_ts = None
@@ -33292,30 +34284,42 @@ def check_for_updates_background(root, debug=False, startup_managed=False):
         }
         try:
             log("Trying to reach GitHub API...")
-            req = urllib.request.Request(
-                GITHUB_RELEASES_API,
-                headers={
-                    "User-Agent": "SnowRunnerEditor/1.0",
-                    "Accept": "application/vnd.github+json",
-                },
-            )
+            cached_etag, cached_releases = _load_releases_cache()
+            headers = {
+                "User-Agent": "SnowRunnerEditor/1.0",
+                "Accept": "application/vnd.github+json",
+            }
+            if cached_etag:
+                # A 304 reply carries no body and does not count against the rate limit.
+                headers["If-None-Match"] = cached_etag
+            req = urllib.request.Request(GITHUB_RELEASES_API, headers=headers)
+            etag = ""
+            body = None
             try:
                 with urllib.request.urlopen(req, timeout=5) as resp:
                     status = int(getattr(resp, "status", 0) or resp.getcode() or 0)
+                    etag = str(resp.headers.get("ETag", "") or "")
                     body = resp.read()
             except urllib.error.HTTPError as he:
-                log(f"GitHub API returned {he.code}, skipping.")
-                return
-            if status != 200:
+                status = int(he.code or 0)
+                if status != 304:
+                    log(f"GitHub API returned {status}, skipping.")
+                    return
+            if status == 304 and cached_releases is not None:
+                log("Release list not modified; using cached copy.")
+                releases = cached_releases
+            elif status != 200 or body is None:
                 log(f"GitHub API returned {status}, skipping.")
                 return
-            log("Internet connection OK")
-
-            try:
-                releases = json.loads(body.decode("utf-8", errors="replace"))
-            except Exception:
-                log("Failed to parse GitHub response JSON.")
-                return
+            else:
+                log("Internet connection OK")
+                try:
+                    releases = json.loads(body.decode("utf-8", errors="replace"))
+                except Exception:
+                    log("Failed to parse GitHub response JSON.")
+                    return
+                if etag and isinstance(releases, list):
+                    _save_releases_cache(etag, releases)
             if not isinstance(releases, list) or not releases:
                 log("No releases found, aborting.")
                 return
@@ -33720,6 +34724,34 @@ def _log_platform_support_status():
 
 
 # UI helper: hide dotted focus rectangles without disabling focus/clicking
+def _strip_focus_layout(layout):
+    if not layout:
+        return layout
+    new_layout = []
+    for elem, opts in layout:
+        children = None
+        if isinstance(opts, dict):
+            children = opts.get("children")
+
+        if "focus" in elem.lower():
+            # If focus element wraps children, keep the children (flatten) to avoid
+            # removing actual content like labels/indicators.
+            if children:
+                new_layout.extend(_strip_focus_layout(children))
+            continue
+
+        if children:
+            opts = dict(opts)
+            opts["children"] = _strip_focus_layout(children)
+        new_layout.append((elem, opts))
+    return new_layout
+
+
+# Themes whose button/tab layouts carry no focus element (e.g. aqua), found
+# on their first strip pass; later passes skip their style calls entirely.
+_FOCUS_RING_FREE_THEMES = set()
+
+
 def _apply_focus_outline_fix(root):
     try:
         style = ttk.Style(root)
@@ -33736,28 +34768,6 @@ def _apply_focus_outline_fix(root):
     if not bg:
         bg = "SystemButtonFace"
 
-    def _strip_focus(layout):
-        if not layout:
-            return layout
-        new_layout = []
-        for elem, opts in layout:
-            children = None
-            if isinstance(opts, dict):
-                children = opts.get("children")
-
-            if "focus" in elem.lower():
-                # If focus element wraps children, keep the children (flatten) to avoid
-                # removing actual content like labels/indicators.
-                if children:
-                    new_layout.extend(_strip_focus(children))
-                continue
-
-            if children:
-                opts = dict(opts)
-                opts["children"] = _strip_focus(children)
-            new_layout.append((elem, opts))
-        return new_layout
-
     # Only strip focus from specific widget layouts to avoid breaking notebook tabs.
     layout_targets = (
         "TButton",
@@ -33767,17 +34777,42 @@ def _apply_focus_outline_fix(root):
         "Editor.TNotebook.Tab",
     )
 
-    for name in layout_targets:
+    # Layouts belong to the theme and survive re-runs (theme toggles call this
+    # again), so each theme only needs its layouts fetched and stripped once.
+    try:
+        theme = style.theme_use()
+    except Exception:
+        theme = None
+    stripped_themes = getattr(root, "_focus_stripped_themes", None)
+    if stripped_themes is None:
+        stripped_themes = set()
         try:
-            layout = style.layout(name)
-            if layout:
-                stripped = _strip_focus(layout)
-                if stripped and stripped != layout:
-                    style.layout(name, stripped)
+            root._focus_stripped_themes = stripped_themes
         except Exception:
             pass
+    # config key hide_focus_outlines_force: always run the full pass
+    force = bool(_load_config_safe().get("hide_focus_outlines_force", False))
+    ring_free = not force and theme is not None and theme in _FOCUS_RING_FREE_THEMES
+    if not ring_free and (force or theme is None or theme not in stripped_themes):
+        had_focus = False
+        complete = True
+        for name in layout_targets:
+            try:
+                layout = style.layout(name)
+                if layout:
+                    stripped = _strip_focus_layout(layout)
+                    if stripped != layout:
+                        had_focus = True
+                    if stripped and stripped != layout:
+                        style.layout(name, stripped)
+            except Exception:
+                complete = False
+        if theme is not None:
+            stripped_themes.add(theme)
+            if complete and not had_focus:
+                _FOCUS_RING_FREE_THEMES.add(theme)
 
-    style_names = layout_targets
+    style_names = () if ring_free else layout_targets
 
     for name in style_names:
         try:
@@ -33798,9 +34833,14 @@ def _apply_focus_outline_fix(root):
         pass
 
     # Prevent focus auto-select for Entry/Combobox (clears only if full text is selected)
-    def _clear_full_selection(widget):
+    def _clear_full_selection(widget, retry=False):
         try:
-            if not hasattr(widget, "selection_present") or not widget.selection_present():
+            if not hasattr(widget, "selection_present"):
+                return
+            if not widget.selection_present():
+                # The auto-select can land after the first idle pass; look once more.
+                if retry:
+                    widget.after(0, _clear_full_selection, widget)
                 return
             first = widget.index("sel.first")
             last = widget.index("sel.last")
@@ -33812,13 +34852,10 @@ def _apply_focus_outline_fix(root):
 
     def _clear_full_selection_late(event):
         w = event.widget
-        def _do():
-            _clear_full_selection(w)
         try:
-            w.after_idle(_do)
-            w.after(1, _do)
+            w.after_idle(_clear_full_selection, w, True)
         except Exception:
-            _do()
+            _clear_full_selection(w)
 
     try:
         root.bind_class("TEntry", "<FocusIn>", _clear_full_selection_late, add="+")
@@ -33896,7 +34933,7 @@ def launch_gui(start_minimized=False):
             print("[AppID Warning]", e)
     
     global max_backups_var, make_backup_var, full_backup_var, save_path_var
-    global money_var, rank_var, time_preset_var, skip_time_var, time_presets
+    global money_var, rank_var, time_preset_var, skip_time_var
     global custom_day_var, custom_night_var, other_season_var
     global FACTOR_RULE_VARS, rule_savers, plugin_loaders
     global tyre_var, delete_path_on_close_var, dont_remember_path_var, autosave_var, dark_mode_var, theme_preset_var
@@ -33968,13 +35005,13 @@ def launch_gui(start_minimized=False):
             pass
 
     # Initialize all variables after root window exists
+    # shared module globals (see the global statements above)
     max_backups_var = tk.StringVar(root, value="20")
     make_backup_var = tk.BooleanVar(root, value=True)
     full_backup_var = tk.BooleanVar(root, value=False)
     save_path_var = tk.StringVar(root)
     money_var = tk.StringVar(root)
     rank_var = tk.StringVar(root)
-    xp_var = tk.StringVar(root)
     time_preset_var = tk.StringVar(root)
     skip_time_var = tk.BooleanVar(root)
     custom_day_var = tk.DoubleVar(root, value=1.0)
@@ -33986,6 +35023,8 @@ def launch_gui(start_minimized=False):
     autosave_var = tk.BooleanVar(root, value=False)
     dark_mode_var = tk.BooleanVar(root, value=False)
     theme_preset_var = tk.StringVar(root, value="Light")
+    # launch_gui locals
+    xp_var = tk.StringVar(root)
     max_autobackups_var = tk.StringVar(root, value="50")
     # Initialize additional variables
     difficulty_var = tk.StringVar(root)
@@ -34064,10 +35103,6 @@ def launch_gui(start_minimized=False):
     except Exception as e:
         print("[Autosave] failed to bind state traces:", e)
 
-    tyre_var = tk.StringVar(value="default")
-    custom_day_var = tk.DoubleVar(value=1.0)
-    custom_night_var = tk.DoubleVar(value=1.0)
-
     # Icon setup removed
 
     # --- schedule delayed version check so the editor can finish loading first ---
@@ -34096,17 +35131,15 @@ def launch_gui(start_minimized=False):
             print("Delayed version check failed:", e)
 
     try:
-        root.after(_VERSION_CHECK_DELAY_MS, _delayed_version_check)
-    except Exception:
-        try:
-            (tk._default_root or root).after(_VERSION_CHECK_DELAY_MS, _delayed_version_check)
-        except Exception:
-            # as last resort, call directly (will be immediate)
-            _delayed_version_check()
+        # count the delay from the first idle after the window is up, not from
+        # while the tabs are still being built
+        root.after_idle(lambda: root.after(_VERSION_CHECK_DELAY_MS, _delayed_version_check))
+    except tk.TclError as e:
+        print("Could not schedule delayed version check:", e)
 
-    def sync_all_rules(path):
+    def sync_all_rules(path, content=None):
         """
-        Read the save file at `path` and update ALL GUI rule widgets:
+        Read the save file at `path` (or use `content` already read from it) and update ALL GUI rule widgets:
         - builtin values (money/rank/difficulty/truck availability/price)
         - addon basic fields (kept simple here)
         - tyre dropdowns (sync_rule_dropdowns)
@@ -34117,16 +35150,18 @@ def launch_gui(start_minimized=False):
         try:
             if not os.path.exists(path):
                 return
-            with open(path, "r", encoding="utf-8") as f:
-                content = f.read()
+            if content is None:
+                with open(path, "r", encoding="utf-8") as f:
+                    content = f.read()
 
             # --- Core info from parser you already have ---
             money, rank, xp, difficulty, truck_avail, skip_time, day, night, truck_price = get_file_info(content)
 
-            # update simple builtins if those vars exist
-            if "money_var" in globals() and money is not None:
+            # every var below is created earlier in launch_gui, so they are set
+            # directly (the old `"x_var" in globals()` probes were always true)
+            if money is not None:
                 money_var.set(str(money))
-            if "rank_var" in globals() and rank is not None:
+            if rank is not None:
                 rank_var.set(str(rank))
 
             # --- robustly read & set experience ---
@@ -34136,91 +35171,73 @@ def launch_gui(start_minimized=False):
                 print(f"[XP] failed to read experience from save: {e}")
                 xp_val = None
 
-            # only set xp_var if the variable actually exists (it is created earlier).
-            if "xp_var" in globals() and xp_var is not None:
-                try:
-                    xp_var.set(str(xp_val) if xp_val is not None else "")
-                except Exception as e:
-                    print(f"[XP] failed to set experience field: {e}")
-
+            xp_var.set(str(xp_val) if xp_val is not None else "")
 
             # set the main builtin rule vars
-            if "difficulty_var" in globals():
-                difficulty_var.set(difficulty_map.get(difficulty, "Normal"))
-            if "truck_avail_var" in globals():
-                truck_avail_var.set(truck_avail_map.get(truck_avail, "default"))
-            if "truck_price_var" in globals():
-                truck_price_var.set(truck_price_map.get(truck_price, "default"))
+            difficulty_var.set(difficulty_map.get(difficulty, "Normal"))
+            truck_avail_var.set(truck_avail_map.get(truck_avail, "default"))
+            truck_price_var.set(truck_price_map.get(truck_price, "default"))
 
             # addons: reset to default for now (parsing internal addon details is more elaborate)
-            if "addon_avail_var" in globals():
-                addon_avail_var.set(addon_avail_map.get(0, "default"))
-            if "addon_amount_var" in globals():
-                addon_amount_var.set("default")
+            addon_avail_var.set(addon_avail_map.get(0, "default"))
+            addon_amount_var.set("default")
 
             # --- Tyres & simple rule dropdowns (re-uses existing helper) ---
-            if "sync_rule_dropdowns" in globals():
-                try:
-                    sync_rule_dropdowns(path)
-                except Exception as e:
-                    print("sync_rule_dropdowns failed:", e)
+            try:
+                sync_rule_dropdowns(path)
+            except Exception as e:
+                print("sync_rule_dropdowns failed:", e)
 
             # --- Factor rules (re-uses existing helper) ---
-            if "sync_factor_rule_dropdowns" in globals():
-                try:
-                    sync_factor_rule_dropdowns(path)
-                except Exception as e:
-                    print("sync_factor_rule_dropdowns failed:", e)
+            try:
+                sync_factor_rule_dropdowns(path)
+            except Exception as e:
+                print("sync_factor_rule_dropdowns failed:", e)
 
             # --- Call any registered plugin loaders so external rule widgets sync too ---
-            if "plugin_loaders" in globals():
-                for loader in plugin_loaders:
-                    try:
+            # Loaders flagged with `accepts_content` take the text read above
+            # instead of opening and reading the save again.
+            for loader in plugin_loaders:
+                try:
+                    if getattr(loader, "accepts_content", False):
+                        loader(path, content)
+                    else:
                         loader(path)
-                    except Exception as e:
-                        print("Plugin loader failed:", e)
+                except Exception as e:
+                    print("Plugin loader failed:", e)
 
             # --- Time settings ---
             _sync_time_ui(day=day, night=night, skip_time=skip_time)
                 
-            # --- other optional UI flags (if present) ---
-            if "other_season_var" in globals():
-                # don't force a literal 'default' into the season entry — leave it blank unless the save provides a value
-                try:
-                    other_season_var.set("")
-                except Exception:
-                    pass
-            if "garage_refuel_var" in globals():
-                # some builds look for different string; simple heuristic:
-                garage_refuel_var.set('"enableGarageRefuel": true' in content)
+            # --- other UI flags ---
+            # don't force a literal 'default' into the season entry — leave it blank unless the save provides a value
+            other_season_var.set("")
+            # some builds look for different string; simple heuristic:
+            garage_refuel_var.set('"enableGarageRefuel": true' in content)
 
         except Exception as e:
             print("Failed to sync all rules:", e)
 
-    def _refresh_all_tabs_from_save(path):
-        """Centralized refresh after a save path is selected."""
+    def _save_file_stamp(path):
+        try:
+            st = os.stat(path)
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def _refresh_all_tabs_from_save(path, content=None):
+        """Centralized refresh after a save path is selected; `content` skips re-reading the file."""
         try:
-            sync_all_rules(path)
+            sync_all_rules(path, content)
         except Exception as e:
             print(f"sync_all_rules failed: {e}")
-        # Flush pending layout/variable work without entering a nested Tk event loop.
-        def _flush_idletasks():
-            try:
-                root.update_idletasks()
-            except Exception:
-                try:
-                    tk._default_root.update_idletasks()
-                except Exception:
-                    pass
-
-        _flush_idletasks()
+        # Variable -> widget updates are idle tasks, so flushing those is enough.
+        # root.update() would also dispatch pending user input and could re-enter
+        # this refresh (or a button handler) before it returns.
         try:
-            root.after_idle(_flush_idletasks)
-        except Exception:
-            try:
-                tk._default_root.after_idle(_flush_idletasks)
-            except Exception:
-                pass
+            root.update_idletasks()
+        except tk.TclError:
+            pass
         try:
             base = os.path.basename(path) if path else "save file"
             set_app_status(f"Loaded {base} and synchronized all tabs.", timeout_ms=5000)
@@ -34373,46 +35390,6 @@ def launch_gui(start_minimized=False):
     except Exception:
         pass
 
-    difficulty_map = {0: "Normal", 1: "Hard", 2: "New Game+"}
-    reverse_difficulty_map = {v: k for k, v in difficulty_map.items()}
-    truck_avail_map = {
-        1: "default", 0: "all trucks available", 3: "5–15 trucks/garage",
-        4: "locked"
-    }
-    reverse_truck_avail_map = {v: k for k, v in truck_avail_map.items()}
-
-    truck_price_map = {
-        1: "default",
-        2: "free",
-        3: "2x",
-        4: "4x",
-        5: "5x"
-    }
-    reverse_truck_price_map = {v: k for k, v in truck_price_map.items()}
-
-    addon_avail_map = {0: "default", 1: "all internal addons unlocked", 2: "custom range"}
-    reverse_addon_avail_map = {v: k for k, v in addon_avail_map.items()}
-    addon_amount_ranges = {
-        "None": (0, 0),
-        "10–50": (10, 50),
-        "30–100": (30, 100),
-        "50–150": (50, 150),
-        "0–100": (0, 100)
-    }
-    time_presets = {
-    "Custom": (1.0, 1.0),
-    "Default": (1.0, 1.0),
-    "Always Day": (0.0, 1.0),
-    "Always Night": (1.0, 0.0),
-    "Long Day": (0.01, 1.0),
-    "Long Night": (1.0, 0.01),
-    "Long Day and Long Night": (0.01, 0.01),
-    "Time Stops": (0.0, 0.0),
-    "Disco [SEIZURE RISK]": (1000.0, 1000.0),
-    "Disco+ [OH GOD WHY]": (10000.0, 10000.0),
-    "Disco++ [WILL DESTROY YOUR EYES]": (100000.0, 100000.0),
-}
-    
     def update_builtin_rule_vars(d, t, p, a, amt_key):
         difficulty_var.set(difficulty_map.get(d, "Normal"))
         truck_avail_var.set(truck_avail_map.get(t, "default"))
@@ -34421,17 +35398,16 @@ def launch_gui(start_minimized=False):
         if a == 2 and amt_key in addon_amount_ranges:
             addon_amount_var.set(amt_key)
 
-    def _build_startup_save_snapshot(path: str, content: str) -> Dict[str, Any]:
+    def _build_startup_save_snapshot(path: str, content) -> Dict[str, Any]:
+        """Snapshot for the startup autoload; content may be text or bytes-like."""
         m, r, xp, d, t, s, day, night, tp = get_file_info(content)
         if day is None or night is None:
             raise ValueError("Missing time settings")
-        addon_avail_val = re.search(r'"internalAddonAvailability"\s*:\s*(\d+)', content)
-        addon_avail = int(addon_avail_val.group(1)) if addon_avail_val else 0
+        addon_avail = _search_file_info_int(content, "internalAddonAvailability", 0)
         addon_amount_key = None
         if addon_avail == 2:
-            amount_val = re.search(r'"internalAddonAmount"\s*:\s*(\d+)', content)
-            if amount_val:
-                amt = int(amount_val.group(1))
+            amt = _search_file_info_int(content, "internalAddonAmount")
+            if amt is not None:
                 for key, (min_v, max_v) in addon_amount_ranges.items():
                     if min_v <= amt <= max_v:
                         addon_amount_key = key
@@ -34439,13 +35415,7 @@ def launch_gui(start_minimized=False):
         if day is None or night is None:
             preset = "Custom"
         else:
-            preset = next(
-                (
-                    k for k, v in time_presets.items()
-                    if abs(day - v[0]) < 0.01 and abs(night - v[1]) < 0.01
-                ),
-                "Custom",
-            )
+            preset = _match_time_preset(day, night)
         return {
             "path": path,
             "money": m,
@@ -34460,7 +35430,9 @@ def launch_gui(start_minimized=False):
             "time_preset": preset,
             "addon_availability": addon_avail_map.get(addon_avail, "default"),
             "addon_amount_key": addon_amount_key,
-            "garage_refuel": ('"enableGarageRefuel": true' in content),
+            "garage_refuel": content.find(
+                '"enableGarageRefuel": true' if isinstance(content, str) else b'"enableGarageRefuel": true'
+            ) != -1,
         }
 
     def _apply_startup_save_snapshot(snapshot: Dict[str, Any]):
@@ -34530,9 +35502,6 @@ def launch_gui(start_minimized=False):
             pass
 
 
-    # Auto-load values if last path is valid
-    plugin_loaders.append(sync_factor_rule_dropdowns)
-
     def browse_file():
         file_path = filedialog.askopenfilename(
             filetypes=_snowrunner_save_picker_filetypes()
@@ -34545,6 +35514,7 @@ def launch_gui(start_minimized=False):
             try:
                 with open(file_path, "r", encoding="utf-8") as f:
                     content = f.read()
+                content_stamp = _save_file_stamp(file_path)
 
                 # Try parsing the save — if it fails or is incomplete, treat as corrupted
                 m, r, xp, d, t, s, day, night, tp = get_file_info(content)
@@ -34586,9 +35556,14 @@ def launch_gui(start_minimized=False):
         # Persist the selection
         save_path(file_path)
 
+        # the validated text is reused unless the file changed while the
+        # version prompt was open
+        if _save_file_stamp(file_path) != content_stamp:
+            content = None
+
         # Centralized refresh
         try:
-            _refresh_all_tabs_from_save(file_path)
+            _refresh_all_tabs_from_save(file_path, content)
             if improve_share_var.get():
                 _maybe_upload_improve_samples_from_save_path(file_path)
             return
@@ -34597,8 +35572,9 @@ def launch_gui(start_minimized=False):
 
         # FALLBACK: manual UI update (keeps previous behavior if sync_all_rules is not defined)
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            if content is None:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    content = f.read()
             m, r, xp, d, t, s, day, night, tp = get_file_info(content)
 
             # Money / rank
@@ -34673,7 +35649,9 @@ def launch_gui(start_minimized=False):
     # -------------------------------------------------------------------------
     # NOTEBOOK + TAB REGISTRY (content is built below)
     # -------------------------------------------------------------------------
-    tab_control = ttk.Notebook(root)
+    # Tabs are added while the notebook is still unmapped; it is packed once
+    # after the last tab so Tk lays the strip out a single time.
+    tab_control = ttk.Notebook(root, takefocus=0)
     tab_file = ttk.Frame(tab_control)
     tab_money = ttk.Frame(tab_control)
     tab_missions = ttk.Frame(tab_control)
@@ -34899,6 +35877,12 @@ def launch_gui(start_minimized=False):
     _register_lazy_tab(tab_fog, "Fog Tool", _build_fog_tab)
     # End TAB: Fog Tool
 
+    # Ctrl+Tab / Ctrl+Shift+Tab switching, bound once for the whole notebook
+    # (it no longer takes keyboard focus itself).
+    try:
+        tab_control.enable_traversal()
+    except tk.TclError:
+        pass
     tab_control.pack(side="top", expand=1, fill='both')
 
     def _open_status_logs_file():
@@ -36060,6 +37044,7 @@ def launch_gui(start_minimized=False):
                 # quick read + reuse existing parsing/validation
                 with open(file_path, "r", encoding="utf-8") as f:
                     content = f.read()
+                content_stamp = _save_file_stamp(file_path)
                 m, r, xp, d, t, s, day, night, tp = get_file_info(content)
                 if day is None or night is None:
                     raise ValueError("Missing time settings")
@@ -36086,9 +37071,11 @@ def launch_gui(start_minimized=False):
             save_path(file_path)
         except Exception:
             pass
+        if _save_file_stamp(file_path) != content_stamp:
+            content = None
         # Centralized refresh (best-effort)
         try:
-            _refresh_all_tabs_from_save(file_path)
+            _refresh_all_tabs_from_save(file_path, content)
             set_app_status(f"Selected save file: {os.path.basename(file_path)}", timeout_ms=5000)
             if improve_share_var.get():
                 _maybe_upload_improve_samples_from_save_path(file_path)
@@ -37590,47 +38577,51 @@ def launch_gui(start_minimized=False):
     # -------------------------------------------------------------------------
     # TAB UI: Missions (tab_missions)
     # -------------------------------------------------------------------------
-    seasons = [(name, i) for i, name in enumerate(SEASON_LABELS, start=1)]
-    base_maps = [(name, code) for code, name in BASE_MAPS]
-    selector = _build_region_selector(
-        tab_missions,
-        seasons,
-        base_maps,
-        other_var=other_season_var,
-        base_maps_label="Base Game Maps:",
-        base_maps_label_font=("TkDefaultFont", 10, "bold"),
-        season_pady=10
-    )
-    season_vars = selector["season_vars"]
-    base_map_vars = selector["map_vars"]
-    all_check_vars = selector["all_check_vars"]
-
-    def run_complete():
-        make_backup_if_enabled(save_path_var.get())
-        if not os.path.exists(save_path_var.get()):
-            messagebox.showerror("Error", "Save file not found.")
-            return
-        selected_seasons = _collect_checked_values(season_vars)
-        _append_other_season_int(selected_seasons, other_season_var)
-        selected_maps = _collect_checked_values(base_map_vars)
-        if not selected_seasons and not selected_maps:
-            show_info("Info", "No seasons or maps selected.")
-            return
-        complete_seasons_and_maps(save_path_var.get(), selected_seasons, selected_maps)
+    # the legacy Missions tab is normally hidden, so its selector is only built
+    # if the tab is ever opened
+    def _build_missions_tab():
+        seasons = [(name, i) for i, name in enumerate(SEASON_LABELS, start=1)]
+        base_maps = [(name, code) for code, name in BASE_MAPS]
+        selector = _build_region_selector(
+            tab_missions,
+            seasons,
+            base_maps,
+            other_var=other_season_var,
+            base_maps_label="Base Game Maps:",
+            base_maps_label_font=("TkDefaultFont", 10, "bold"),
+            season_pady=10
+        )
+        season_vars = selector["season_vars"]
+        base_map_vars = selector["map_vars"]
+        all_check_vars = selector["all_check_vars"]
+
+        def run_complete():
+            make_backup_if_enabled(save_path_var.get())
+            if not os.path.exists(save_path_var.get()):
+                messagebox.showerror("Error", "Save file not found.")
+                return
+            selected_seasons = _collect_checked_values(season_vars)
+            _append_other_season_int(selected_seasons, other_season_var)
+            selected_maps = _collect_checked_values(base_map_vars)
+            if not selected_seasons and not selected_maps:
+                show_info("Info", "No seasons or maps selected.")
+                return
+            complete_seasons_and_maps(save_path_var.get(), selected_seasons, selected_maps)
 
-    ttk.Button(tab_missions, text="Complete Selected Missions", command=run_complete).pack(pady=10)
-    _add_check_all_checkbox(tab_missions, all_check_vars)
+        ttk.Button(tab_missions, text="Complete Selected Missions", command=run_complete).pack(pady=10)
+        _add_check_all_checkbox(tab_missions, all_check_vars)
 
-    # Disclaimer below the complete button
-    ttk.Label(
-        tab_missions,
-        text="You must accept the task or mission in the game before it can be completed",
-        style="Warning.TLabel",
-        font=("TkDefaultFont", 10, "bold"),
-        wraplength=400,
-        justify="center"
-    ).pack(pady=(5, 15))
+        # Disclaimer below the complete button
+        ttk.Label(
+            tab_missions,
+            text="You must accept the task or mission in the game before it can be completed",
+            style="Warning.TLabel",
+            font=("TkDefaultFont", 10, "bold"),
+            wraplength=400,
+            justify="center"
+        ).pack(pady=(5, 15))
 
+    _register_lazy_tab(tab_missions, "Missions", _build_missions_tab)
 
     # -------------------------------------------------------------------------
     # END TAB UI: Missions
@@ -37639,48 +38630,10 @@ def launch_gui(start_minimized=False):
     # -------------------------------------------------------------------------
     # TAB UI: Time (tab_time)
     # -------------------------------------------------------------------------
-    ttk.Label(tab_time, text="Time Preset:").pack(pady=10)
-    ttk.Combobox(tab_time, textvariable=time_preset_var, values=list(time_presets.keys()), state="readonly", width=30).pack(pady=5)
-    ttk.Checkbutton(tab_time, text="Enable Time Skipping", variable=skip_time_var).pack(pady=10)
-    ttk.Label(tab_time, text="⚠️ Time settings only apply in New Game+ mode.", style="Warning.TLabel", font=("TkDefaultFont", 9, "bold")).pack(pady=(5, 10))
-    ttk.Label(tab_time, text="⚠️ To use custom sliders, select 'Custom' from the Time Presets.", style="Warning.TLabel", font=("TkDefaultFont", 9, "bold")).pack(pady=(5, 10))
-
-
-
-
-    frame_day = ttk.Frame(tab_time)
-    frame_day.pack()
-    ttk.Label(frame_day, text="Custom Day Time   :").pack(side="left")
-    ttk.Scale(
-        frame_day,
-        command=lambda v: custom_day_var.set(round(float(v), 2)),
-        from_=-5.0,
-        to=5.0,
-        variable=custom_day_var,
-        orient="horizontal",
-        length=250
-    ).pack(side="left", padx=5)
-    day_entry = ttk.Entry(frame_day, textvariable=custom_day_var, width=6)
-    day_entry.pack(side="left")
     try:
         custom_day_var.set(round(float(day), 2) if day is not None else 1.0)
     except Exception:
         custom_day_var.set(1.0)
-
-    frame_night = ttk.Frame(tab_time)
-    frame_night.pack()
-    ttk.Label(frame_night, text="Custom Night Time:").pack(side="left")
-    ttk.Scale(
-        frame_night,
-        command=lambda v: custom_night_var.set(round(float(v), 2)),
-        from_=-5.0,
-        to=5.0,
-        variable=custom_night_var,
-        orient="horizontal",
-        length=250
-    ).pack(side="left", padx=5)
-    night_entry = ttk.Entry(frame_night, textvariable=custom_night_var, width=6)
-    night_entry.pack(side="left")
     try:
         custom_night_var.set(round(float(night), 2) if night is not None else 1.0)
     except Exception:
@@ -37727,17 +38680,6 @@ def launch_gui(start_minimized=False):
             except Exception:
                 pass
 
-
-    ttk.Label(tab_time, text="""ℹ️ Time Speed Settings:
-2.0 = Twice as fast
-1.0 = normal speed
-0.0 = time stops
--1.0 = Rewinds time
--2.0 = Twice as fast in reverse
-
-⚠️ If one value is positive and the other is negative,
-time will freeze at the transition (day to night or night to day).""", wraplength=400, justify="left").pack(pady=(10, 20))
-
     def update_time_btn():
         make_backup_if_enabled(save_path_var.get())
         path = save_path_var.get()
@@ -37753,7 +38695,58 @@ time will freeze at the transition (day to night or night to day).""", wraplengt
         st = skip_time_var.get()
         modify_time(path, day, night, st)
 
-    ttk.Button(tab_time, text="Apply Time Settings", command=update_time_btn).pack(pady=20)
+    # the vars and traces above stay eager (save sync drives them); only the
+    # widgets wait until the tab is first opened
+    def _build_time_tab():
+        ttk.Label(tab_time, text="Time Preset:").pack(pady=10)
+        ttk.Combobox(tab_time, textvariable=time_preset_var, values=list(time_presets.keys()), state="readonly", width=30).pack(pady=5)
+        ttk.Checkbutton(tab_time, text="Enable Time Skipping", variable=skip_time_var).pack(pady=10)
+        ttk.Label(tab_time, text="⚠️ Time settings only apply in New Game+ mode.", style="Warning.TLabel", font=("TkDefaultFont", 9, "bold")).pack(pady=(5, 10))
+        ttk.Label(tab_time, text="⚠️ To use custom sliders, select 'Custom' from the Time Presets.", style="Warning.TLabel", font=("TkDefaultFont", 9, "bold")).pack(pady=(5, 10))
+
+        frame_day = ttk.Frame(tab_time)
+        frame_day.pack()
+        ttk.Label(frame_day, text="Custom Day Time   :").pack(side="left")
+        ttk.Scale(
+            frame_day,
+            command=lambda v: custom_day_var.set(round(float(v), 2)),
+            from_=-5.0,
+            to=5.0,
+            variable=custom_day_var,
+            orient="horizontal",
+            length=250
+        ).pack(side="left", padx=5)
+        day_entry = ttk.Entry(frame_day, textvariable=custom_day_var, width=6)
+        day_entry.pack(side="left")
+
+        frame_night = ttk.Frame(tab_time)
+        frame_night.pack()
+        ttk.Label(frame_night, text="Custom Night Time:").pack(side="left")
+        ttk.Scale(
+            frame_night,
+            command=lambda v: custom_night_var.set(round(float(v), 2)),
+            from_=-5.0,
+            to=5.0,
+            variable=custom_night_var,
+            orient="horizontal",
+            length=250
+        ).pack(side="left", padx=5)
+        night_entry = ttk.Entry(frame_night, textvariable=custom_night_var, width=6)
+        night_entry.pack(side="left")
+
+        ttk.Label(tab_time, text="""ℹ️ Time Speed Settings:
+2.0 = Twice as fast
+1.0 = normal speed
+0.0 = time stops
+-1.0 = Rewinds time
+-2.0 = Twice as fast in reverse
+
+⚠️ If one value is positive and the other is negative,
+time will freeze at the transition (day to night or night to day).""", wraplength=400, justify="left").pack(pady=(10, 20))
+
+        ttk.Button(tab_time, text="Apply Time Settings", command=update_time_btn).pack(pady=20)
+
+    _register_lazy_tab(tab_time, "Time", _build_time_tab)
 
     # -------------------------------------------------------------------------
     # END TAB UI: Time
@@ -37853,25 +38846,26 @@ time will freeze at the transition (day to night or night to day).""", wraplengt
             if isinstance(snapshot, dict):
                 _apply_startup_save_snapshot(snapshot)
 
-        def _startup_worker(path: str):
+        def _startup_worker(path: str) -> Dict[str, Any]:
             result = {"path": path, "snapshot": None, "missing": False, "error": ""}
             try:
                 if not os.path.exists(path):
                     result["missing"] = True
                 else:
-                    with open(path, "r", encoding="utf-8") as f:
-                        content = f.read()
-                    result["snapshot"] = _build_startup_save_snapshot(path, content)
+                    # only scanned here, so the save is mapped rather than decoded
+                    content = _open_save_for_scan(path)
+                    try:
+                        result["snapshot"] = _build_startup_save_snapshot(path, content)
+                    finally:
+                        if hasattr(content, "close"):
+                            content.close()
             except Exception as e:
                 result["error"] = str(e)
+            return result
 
-            try:
-                root.after(0, lambda payload=result: _apply_startup_result(payload))
-            except Exception:
-                _apply_startup_result(result)
-
+        # Tk variables are only set from _apply_startup_result on the Tk thread
         try:
-            threading.Thread(target=_startup_worker, args=(last_path,), daemon=True).start()
+            _run_in_worker(root, lambda: _startup_worker(last_path), _apply_startup_result)
         except Exception as e:
             print("[Startup] remembered save autoload failed:", e)
 
@@ -38175,6 +39169,12 @@ def run_self_test():
         actual = _looks_like_snowrunner_game_process_line(raw_line)
         _check(actual == expected, f"process detection mismatch for sample line: {raw_line!r}")
 
+    big_int_block = '{"a":18446744073709551617,"b":[-18446744073709551617,1.5]}'
+    big_int_text = _json_dumps_compact(_json_loads_block(big_int_block))
+    _check(big_int_text == big_int_block, f"save block with >64-bit ints changed on round trip: {big_int_text!r}")
+    nan_text = _json_dumps_compact({"a": [1, float("nan")], "b": None})
+    _check(nan_text == '{"a":[1,NaN],"b":null}', f"compact JSON lost a non-finite float: {nan_text!r}")
+
     discovery_ids = _truck_shop_unlock_ids_for_regions(["US_02", "RU_02"], DISCOVERY_TRUCK_SHOP_UNLOCKS_BY_LEVEL)
     regional_ids = _truck_shop_unlock_ids_for_regions(["US_02", "RU_02"], REGIONAL_TRUCK_SHOP_UNLOCKS_BY_LEVEL)
     _check(
@@ -38374,6 +39374,63 @@ def run_self_test():
     except Exception as e:
         _check(False, f"atomic text writer self-test failed: {e}")
 
+    brace_sample = '{"a":{"s":"x}\\"{","l":["]",{}]},"b":1}'
+    _check(
+        extract_brace_block(brace_sample, 5) == ('{"s":"x}\\"{","l":["]",{}]}', 5, 31),
+        "brace block scan should skip braces inside strings",
+    )
+    _check(
+        extract_bracket_block(brace_sample, 5)[0] == '["]",{}]',
+        "bracket block scan should skip brackets inside strings",
+    )
+    _check(
+        _decode_json_value_at(brace_sample, 5) == ({"s": 'x}"{', "l": ["]", {}]}, 5, 31),
+        "in-place JSON decode should end where the brace scan does",
+    )
+
+    try:
+        with tempfile.TemporaryDirectory() as td:
+            wp_path = os.path.join(td, "CompleteSave.cfg")
+            with open(wp_path, "w", encoding="utf-8") as fh:
+                fh.write('{"watchPointsData":{"stamp":36893488147419103232,"data":{}}}')
+            unlock_watchtowers(wp_path, [], notify=False, make_backup=False)
+            with open(wp_path, "r", encoding="utf-8") as fh:
+                _check(
+                    '"stamp":36893488147419103232,' in fh.read(),
+                    "watchtower unlock should keep integers beyond 64 bits exact",
+                )
+    except Exception as e:
+        _check(False, f"watchtower large-int self-test failed: {e}")
+
+    try:
+        with tempfile.TemporaryDirectory() as td:
+            upg_path = os.path.join(td, "CompleteSave.cfg")
+            with open(upg_path, "w", encoding="utf-8") as fh:
+                fh.write('{"upgradesGiverData":{"level_us_01_01":{"a":0,"b":[1],"c":{"d":1}}}}')
+            upg_result = find_and_modify_upgrades(upg_path, ["US_01"], notify=False, make_backup=False)
+            with open(upg_path, "r", encoding="utf-8") as fh:
+                upg_text = fh.read()
+            _check(
+                bool((upg_result or {}).get("ok")) and '"a":2' in upg_text and '"b":[1]' in upg_text,
+                f"upgrade unlock should skip malformed entries: {upg_result!r}",
+            )
+    except Exception as e:
+        _check(False, f"upgrade unlock self-test failed: {e}")
+
+    rules_sample = '{"a": 1, "B": null, "c": [1]}'
+    rules_edits = {"b": "2", "d": "true", "a": "3", "e": "[]"}
+    rules_expected = rules_sample
+    for rule_key, rule_value in rules_edits.items():
+        rules_expected = _set_key_in_text(rules_expected, rule_key, rule_value)
+    _check(
+        _set_keys_in_text(rules_sample, rules_edits) == rules_expected,
+        "batched rule key writes should match one-by-one writes",
+    )
+    _check(
+        _set_keys_in_text(rules_expected, {"a": "3", "b": "2"}) is rules_expected,
+        "batched rule key writes should leave already-set values untouched",
+    )
+
     try:
         with tempfile.TemporaryDirectory() as td:
             pak_path = os.path.join(td, "initial.pak")